@@ -37,6 +37,8 @@ tailors the behavior of a :py:class:`synthdata.base.Synthesizer`.
     :members:
     :special-members: __init__
 
+The pools of values are defined in the :py:mod:`synthdata.pools` module.
+
 Synthesizer Class
 ===============================
 
@@ -55,6 +57,17 @@ The :py:class:`synthdata.base.BaseModelSynthesizer` supports the pydantic ``Base
 The :py:class:`synthdata.base.SchemaSynthesizer` permits references among Synthesizers.
 This permits FK references to PK pools.
 
+Rows can be created one at a time, as ``dict[str, Any]`` or ``BaseModel`` instances,
+or in column-oriented batches.
+A batch is a ``dict[str, Column]``, with a column of values for each field.
+The batches avoid the per-row and per-value overhead when creating large volumes of data.
+
+Rows are reproducible, and can be created in any order.
+Each field's synthesizer has a seed derived from the schema's seed, the model name, and the field name.
+:py:meth:`ModelSynthesizer.row` creates any single row,
+and :py:meth:`ModelSynthesizer.row_batch` creates any range of rows.
+The seeds and streams are defined in the :py:mod:`synthdata.streams` module.
+
 ..  autofunction:: synth_name_map
 
 ..  autoclass:: DataIter
@@ -79,15 +92,36 @@ This permits FK references to PK pools.
 """
 
 import abc
-from collections.abc import Iterator, Callable
+from collections import deque, namedtuple
+from collections.abc import Iterator, Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+import hashlib
 from itertools import filterfalse
+import json
+import math
+import multiprocessing
+import os
+from pathlib import Path
 import random
+import shutil
+import sqlite3
+import tempfile
 from types import UnionType, NoneType
-from typing import Any, cast, TypeVar, _UnionGenericAlias  # type: ignore [attr-defined]
+from typing import Any, BinaryIO, cast, TypeVar, TYPE_CHECKING
+from typing import _LiteralGenericAlias, _UnionGenericAlias  # type: ignore [attr-defined]
 
-from pydantic import BaseModel, Json
+import numpy
+from pydantic import BaseModel, Json, TypeAdapter
 from pydantic.fields import FieldInfo
 
+from .distributions import AliasTable, DISTRIBUTIONS, Distribution, make_distribution
+from .pools import Pool, ListPool, FeistelPermutation, SHARED_MEMORY_DIR, load_pool
+from .streams import BLOCK_SIZE, derive_seed, random_stream, numpy_stream, uniform_at, uniform_array
+from . import writers
+
+if TYPE_CHECKING:
+    import pyarrow
+
 
 class Behavior(abc.ABC):
     """
@@ -99,6 +133,16 @@ class Behavior(abc.ABC):
         self.synth = synth
 
     def prepare(self) -> None:
+        """
+        Prepares the behavior before the first value.
+        This is idempotent: once prepared, nothing is done until after :py:meth:`reset`.
+        """
+        pass
+
+    def reset(self) -> None:
+        """
+        Discards the prepared state, so the next :py:meth:`prepare` starts over.
+        """
         pass
 
     def __repr__(self) -> str:
@@ -111,12 +155,37 @@ class Behavior(abc.ABC):
         """
         ...
 
-    def choice(self) -> Any:
+    @abc.abstractmethod
+    def row(self, index: int) -> Any:  # pragma: no cover
+        """
+        Returns the value for row ``index``, without creating the values for any other rows.
+        """
+        ...
+
+    def row_batch(self, start: int, stop: int) -> "Column":
+        """
+        Returns a column of the values for rows ``start`` up to ``stop``.
+        """
+        return [self.row(index) for index in range(start, stop)]
+
+    def choice(self, rng: random.Random | None = None) -> Any:
         """
         Returns a value chosen from a pool, only overridden by the Pooled subclass.
         """
         return self.next()
 
+    def batch(self, n: int) -> "Column":
+        """
+        Returns a column of ``n`` next values for a Synthesizer.
+        """
+        return [self.next() for _ in range(n)]
+
+    def choice_batch(self, n: int, rng: numpy.random.Generator | None = None) -> "Column":
+        """
+        Returns a column of ``n`` values chosen from a pool, only overridden by the Pooled subclass.
+        """
+        return self.batch(n)
+
 
 class Independent(Behavior):
     """
@@ -131,14 +200,37 @@ class Independent(Behavior):
         super().__init__(synth)
         self.count = 0
 
+    def reset(self) -> None:
+        self.count = 0
+
     def next(self) -> Any:
         """
-        Returns a value from :py:meth:`synthdata.base.Synthesizer.value_gen()`.
+        Returns the value for the next row from :py:meth:`synthdata.base.Synthesizer.value_at()`.
         """
-        v = self.synth.value_gen(self.count)
+        v = self.synth.value_at(self.count)
         self.count += 1
         return v
 
+    def row(self, index: int) -> Any:
+        """
+        Returns a value from :py:meth:`synthdata.base.Synthesizer.value_at()`.
+        """
+        return self.synth.value_at(index)
+
+    def batch(self, n: int) -> "Column":
+        """
+        Returns a column of values for the next ``n`` rows from :py:meth:`synthdata.base.Synthesizer.value_range()`.
+        """
+        values = self.synth.value_range(self.count, self.count + n)
+        self.count += n
+        return values
+
+    def row_batch(self, start: int, stop: int) -> "Column":
+        """
+        Returns a column of values from :py:meth:`synthdata.base.Synthesizer.value_range()`.
+        """
+        return self.synth.value_range(start, stop)
+
 
 class Pooled(Behavior):
     """
@@ -147,62 +239,221 @@ class Pooled(Behavior):
     This requires an associated :py:class:`synthdata.base.SynthesizerModel` to provide the target number of rows in the pool.
 
     Values in the pool will be unique.
+
+    The pool is a :py:class:`synthdata.pools.Pool`.
+    It may be a lazy pool, where values are computed as needed, or a materialized pool of values.
+    The values are dealt in the pool's order.
+    After the pool is exhausted, the values are dealt again in a reshuffled order,
+    defined by a :py:class:`synthdata.pools.FeistelPermutation` of the pool's indices.
+    The value dealt for row :math:`i` depends only on :math:`i` and the synthesizer's seed.
     """
 
+    dedupe_limit = 16
+    """The most batches of additional values :py:meth:`dedupe` generates."""
+
     def __init__(self, synth: "Synthesizer") -> None:
         super().__init__(synth)
-        assert self.synth.model.rows is not None, f"no target rows for {self.synth.model}"
-        self.pool_iter: Iterator[Any]
+        self.pool: Pool
+        self.dealt = 0
+        self.reshuffled: tuple[int, FeistelPermutation] | None = None
+        self.prepared = False
 
     def prepare(self):
-        self.fill()
+        """Fills the pool, once."""
+        if not self.prepared:
+            self.fill()
+
+    def reset(self) -> None:
+        """The pool will be filled again by the next :py:meth:`prepare`."""
+        self.prepared = False
+        self.dealt = 0
+        self.reshuffled = None
+
+    def attach(self, pool: Pool) -> None:
+        """
+        Uses a pool built elsewhere, for example, a shared pool from another process.
+        An attached pool is not filled by :py:meth:`prepare`.
+        """
+        self.pool = pool
+        self.dealt = 0
+        self.reshuffled = None
+        self.prepared = True
 
     def fill(self):
         """
         Populate the ``self.pool`` collection of unique values.
-        This uses :py:meth:`synthdata.base.Synthesizer.value_gen` to build instances.
-        This is used by the model's _prepare() method.
-        """
-        # Often, these are enough
-        if self.synth.model.rows is None:
-            raise ValueError("no rows provided for {self.synth.model} instance")  # pragma: no cover
-        unique_pool = set(self.synth.value_gen(x) for x in range(self.synth.model.rows))
-        self.count = self.synth.model.rows
+        This is used by :py:meth:`prepare`, the first time the model is prepared.
+
+        The :py:meth:`synthdata.base.Synthesizer.domain_size` is checked first.
+        A request for more rows than there are distinct values raises an exception.
+
+        Where the synthesizer offers a lazy pool, from :py:meth:`synthdata.base.Synthesizer.lazy_pool`,
+        no values are generated.
+        Where the synthesizer can draw unique values directly,
+        :py:meth:`synthdata.base.Synthesizer.sample_unique` builds the pool.
+        Otherwise, batches of values from :py:meth:`synthdata.base.Synthesizer.value_batch`
+        are deduplicated until there are enough unique values.
+        If :py:meth:`dedupe` gives up, :py:meth:`synthdata.base.Synthesizer.sample_weighted` builds the pool.
+        A materialized pool is built by :py:meth:`synthdata.base.Synthesizer.make_pool`,
+        which keeps numbers, dates, and strings in compact buffers.
+
+        :raises ValueError: if the rows exceed the size of the domain,
+            or the distribution has too few likely values for the rows.
+        """
+        rows = self.synth.model.rows
+        if rows is None:
+            raise ValueError(
+                f"no rows provided for {self.synth.model} instance"
+            )  # pragma: no cover
+        domain_size = self.synth.domain_size()
+        if domain_size is not None and rows > domain_size:
+            raise ValueError(f"{rows} rows exceeds {domain_size} distinct values for {self.synth}")
+        self.dealt = 0
+        self.reshuffled = None
+        self.synth.stream("pool")
+        lazy = self.synth.lazy_pool(rows)
+        sample = None if lazy is not None else self.synth.sample_unique(rows)
+        if lazy is not None:
+            self.count = 0
+            self.pool = lazy
+        elif sample is not None:
+            self.count = rows
+            self.pool = self.synth.make_pool(sample)
+        else:
+            column = self.dedupe(rows)
+            if column is None:
+                self.count = rows
+                column = self.synth.sample_weighted(rows)
+            if column is None:
+                raise ValueError(f"{rows} rows exceeds the distinct values found for {self.synth}")
+            self.pool = self.synth.make_pool(column)
+        self.prepared = True
+
+    def dedupe(self, rows: int) -> "Column | None":
+        """
+        Generate batches of values until there are ``rows`` unique values.
+        The values remain in the random order in which they were generated.
+        NumPy arrays remain arrays.
+        None means there weren't enough unique values after :py:attr:`dedupe_limit` batches:
+        the distribution has too few likely values for the rows.
+        """
+        unique_pool = unique_column(self.synth.value_batch(rows, 0))
+        self.count = rows
         # May need a few more because of duplicates.
-        while len(unique_pool) != self.synth.model.rows:
-            unique_pool.add(self.synth.value_gen(self.count))
-            self.count += 1
-        self.pool = list(unique_pool)
-        random.shuffle(self.pool)
-        self.pool_iter = iter(self.pool)
+        for _ in range(self.dedupe_limit):
+            if len(unique_pool) >= rows:
+                return unique_pool
+            more = rows - len(unique_pool)
+            unique_pool = unique_column(
+                concat_columns([unique_pool, self.synth.value_batch(more, self.count)])
+            )
+            self.count += more
+        return unique_pool if len(unique_pool) >= rows else None
+
+    def reshuffle(self, epoch: int) -> FeistelPermutation:
+        """
+        The permutation of pool indices for dealing the pool again.
+        Each time through the pool has a new permutation, keyed by the synthesizer's seed and the epoch.
+        """
+        if self.reshuffled is None or self.reshuffled[0] != epoch:
+            seed = derive_seed(self.synth.seed, "epoch", epoch)
+            self.reshuffled = (epoch, FeistelPermutation(len(self.pool), seed))
+        return self.reshuffled[1]
 
     def next(self) -> Any:
         """
         In the event of using ``next(synth_instance)``,
-        the :py:meth:`synthdata.base.Synthesizer.__next__` picks a value at random from the pool using this.
+        the :py:meth:`synthdata.base.Synthesizer.__next__` deals the next value from the pool using this.
         """
-        try:
-            return next(self.pool_iter)
-        except StopIteration:
-            random.shuffle(self.pool)
-            self.pool_iter = iter(self.pool)
-            return next(self.pool_iter)
+        value = self.row(self.dealt)
+        self.dealt += 1
+        return value
 
-    def choice(self) -> Any:
+    def row(self, index: int) -> Any:
         """
-        Returns a value chosen from a pool.
+        The value dealt for row ``index``.
         """
-        return random.choice(self.pool)
+        epoch, index = divmod(index, len(self.pool))
+        if epoch:
+            index = self.reshuffle(epoch)(index)
+        return self.pool[index]
 
+    def choice(self, rng: random.Random | None = None) -> Any:
+        """
+        Returns a value chosen from a pool, using the given ``rng`` or the synthesizer's.
+        """
+        rng = self.synth.rng if rng is None else rng
+        return self.pool[rng.randrange(len(self.pool))]
 
-type NoiseGen = Callable[[int | None], Any | None]
+    def batch(self, n: int) -> "Column":
+        """
+        Deals the next ``n`` values from the pool, reshuffling each time the pool is exhausted.
+        """
+        values = self.row_batch(self.dealt, self.dealt + n)
+        self.dealt += n
+        return values
+
+    def row_batch(self, start: int, stop: int) -> "Column":
+        """
+        The values dealt for rows ``start`` up to ``stop``.
+        """
+        epochs, indices = numpy.divmod(numpy.arange(start, stop), len(self.pool))
+        for epoch in numpy.unique(epochs[epochs > 0]).tolist():
+            selected = epochs == epoch
+            indices[selected] = self.reshuffle(epoch).array(indices[selected])
+        return self.pool.take(indices)
+
+    def choice_batch(self, n: int, rng: numpy.random.Generator | None = None) -> "Column":
+        """
+        Returns ``n`` values chosen from a pool, using the given ``rng`` or the synthesizer's.
+        """
+        rng = self.synth.numpy_rng() if rng is None else rng
+        return self.pool.take(rng.integers(0, len(self.pool), size=n))
+
+
+type NoiseGen = Callable[[int | None, random.Random], Any | None]
+
+type Column = Sequence[Any] | numpy.ndarray
+
+
+def concat_columns(columns: list[Column]) -> Column:
+    """
+    Concatenates columns. The result is a NumPy array if all the columns are arrays.
+    """
+    if all(isinstance(column, numpy.ndarray) for column in columns):
+        return numpy.concatenate(cast(list[numpy.ndarray], columns))
+    return [value for column in columns for value in column]
+
+
+def unique_column(column: Column) -> Column:
+    """
+    Removes duplicates from a column, keeping the first occurrence of each value, in order.
+    An ``object`` array is deduplicated by hashing, since the values may not be ordered.
+    """
+    if isinstance(column, numpy.ndarray):
+        if column.dtype.kind == "O":
+            first: dict[Any, int] = {}
+            for index, value in enumerate(column.tolist()):
+                first.setdefault(value, index)
+            return column[list(first.values())]
+        _, indices = numpy.unique(column, return_index=True)
+        return column[numpy.sort(indices)]
+    return list(dict.fromkeys(column))
 
 
 class Synthesizer(abc.ABC):
     """
     Abstract Base Class for all synthesisers.
+
+    Each synthesizer has its own ``seed``, and its own random generators:
+    ``rng``, a ``random.Random``, and the NumPy ``Generator`` from :py:meth:`numpy_rng`.
+    The generators are restarted by :py:meth:`stream` for each block of values,
+    so that the values for any row can be created by :py:meth:`value_at` without creating the rows before it.
+    See :py:mod:`synthdata.streams`.
     """
 
+    block_size = BLOCK_SIZE
+
     # Fields only used by SynthesizeReference, named here to satisfy PyRight
     model_ref = ""
     field_ref = ""
@@ -220,6 +471,9 @@ class Synthesizer(abc.ABC):
         Builds a Synthesizer that's part of a :py:class:`synthdata.base.ModelSynthesizer`.
         This is associated with a specific field of the ``BaseModel``.
 
+        The initial seed comes from the ``random`` module.
+        A :py:class:`synthdata.base.ModelSynthesizer` will :py:meth:`reseed` each of its synthesizers.
+
         The :py:class:`synthdata.base.Behavior` is provided as a class name.
         The instance is created here *after* the field information is parsed by the :py:meth:`prepare` method.
         This permits a :py:class:`synthdata.base.Pooled` synthesizer to immediately create the
@@ -227,9 +481,11 @@ class Synthesizer(abc.ABC):
         """
         self.model = model
         self.field = field
+        self.reseed(random.getrandbits(64))
         self.behavior = behavior(self)
         self.json_schema_extra = cast(dict[str, Any], self.field.json_schema_extra or {})
-        self.noise_synth: list[NoiseGen] = [lambda x: None]  # Noise values.
+        self.noise_synth: list[NoiseGen] = [lambda x, rng: None]  # Noise values.
+        self.noise_rate: float | None = self.json_schema_extra.get("noise")
         self.initialize()
         # Subclasses use these values
         self.min_length: int
@@ -242,13 +498,96 @@ class Synthesizer(abc.ABC):
         """Get the next value from the :py:class:`synthdata.base.Behavior` **Strategy**."""
         return self.behavior.next()
 
-    def choice(self) -> Any:
+    def choice(self, rng: random.Random | None = None) -> Any:
         """Get an arbitrary value from a :py:class:`synthdata.base.Pooled` **Strategy**."""
-        return self.behavior.choice()
+        return self.behavior.choice(rng)
+
+    def batch(self, n: int) -> Column:
+        """Get a column of the next ``n`` values from the :py:class:`synthdata.base.Behavior` **Strategy**."""
+        return self.behavior.batch(n)
+
+    def choice_batch(self, n: int, rng: numpy.random.Generator | None = None) -> Column:
+        """Get a column of ``n`` arbitrary values from a :py:class:`synthdata.base.Pooled` **Strategy**."""
+        return self.behavior.choice_batch(n, rng)
+
+    def row(self, index: int) -> Any:
+        """Get the value for row ``index`` from the :py:class:`synthdata.base.Behavior` **Strategy**."""
+        return self.behavior.row(index)
+
+    def row_batch(self, start: int, stop: int) -> Column:
+        """Get a column of values for rows ``start`` up to ``stop`` from the :py:class:`synthdata.base.Behavior` **Strategy**."""
+        return self.behavior.row_batch(start, stop)
+
+    def reseed(self, seed: int) -> None:
+        """
+        Sets the seed for this synthesizer's streams of random values.
+        """
+        self.seed = seed
+        self.noise_seed = derive_seed(seed, "noise")
+        self.cached_block: tuple[int, Column, list[Any] | None] | None = None
+        self.cached_noise: tuple[int, float, dict[int, Any]] | None = None
+        self.stream()
+
+    def stream(self, *key: Any) -> None:
+        """
+        Restarts ``rng`` and the NumPy generator with the stream identified by the seed and the key.
+        The key is a block number, or a name like ``"pool"``.
+        """
+        self.rng = random_stream(self.seed, *key)
+        self.np_rng = numpy_stream(self.seed, *key)
+
+    def block(self, number: int) -> Column:
+        """
+        The column of values for block ``number``, the ``block_size`` rows starting at ``number * block_size``.
+        The block is created by :py:meth:`value_batch` with the block's own stream.
+        The most recent block is cached.
+        """
+        if self.cached_block is None or self.cached_block[0] != number:
+            self.stream(number)
+            column = self.value_batch(self.block_size, number * self.block_size)
+            self.cached_block = (number, column, None)
+        return self.cached_block[1]
+
+    def value_at(self, index: int) -> Any:
+        """
+        The value for row ``index``, as a Python object.
+        Only the block which contains the row is created.
+        """
+        number, offset = divmod(index, self.block_size)
+        cached = self.cached_block
+        if cached is None or cached[0] != number:
+            self.block(number)
+            cached = cast(tuple[int, Column, list[Any] | None], self.cached_block)
+        values = cached[2]
+        if values is None:
+            values = self.to_values(cached[1])
+            self.cached_block = (number, cached[1], values)
+        return values[offset]
+
+    def value_range(self, start: int, stop: int) -> Column:
+        """
+        The column of values for rows ``start`` up to ``stop``.
+        Only the blocks which contain the rows are created.
+        """
+        if stop <= start:
+            return []
+        size = self.block_size
+        columns = [
+            self.block(number)[max(start - number * size, 0) : stop - number * size]
+            for number in range(start // size, (stop - 1) // size + 1)
+        ]
+        return concat_columns(columns)
 
     def prepare(self) -> None:
+        """Prepares the :py:class:`synthdata.base.Behavior` **Strategy**, once."""
         self.behavior.prepare()
 
+    def reset(self) -> None:
+        """Discards the prepared **Strategy** and any cached values."""
+        self.behavior.reset()
+        self.cached_block = None
+        self.cached_noise = None
+
     @abc.abstractmethod
     def initialize(self) -> None:  # pragma: no cover
         """
@@ -268,12 +607,159 @@ class Synthesizer(abc.ABC):
         """
         ...
 
-    def noise_gen(self, sequence: int | None = None) -> Any:  # pragma: no cover
+    def value_batch(self, n: int, sequence: int | None = None) -> Column:
+        """
+        Low-level synthesis of a column of ``n`` values.
+        Subclasses override this to avoid the per-value overhead of :py:meth:`value_gen`.
+        """
+        start = sequence or 0
+        return [self.value_gen(start + i) for i in range(n)]
+
+    def to_values(self, column: Column) -> list[Any]:
+        """
+        Converts a column from :py:meth:`value_batch` to a list of Python values,
+        the same types created by :py:meth:`value_gen`.
+        """
+        if isinstance(column, numpy.ndarray):
+            return column.tolist()
+        return list(column)
+
+    def make_pool(self, column: Column) -> Pool:
+        """
+        A materialized pool of the unique values in a column.
+        Subclasses override this to store values in a compact buffer.
+        """
+        return ListPool(self.to_values(column))
+
+    def domain_size(self) -> int | None:
+        """
+        The number of distinct values this synthesizer can create.
+        None means the domain is too large to count, or unknown.
+        """
+        return None
+
+    def sample_unique(self, n: int) -> Column | None:
+        """
+        Draws ``n`` distinct values, in random order, without replacement.
+        None means this synthesizer can't do this directly,
+        and unique values must be found by removing duplicates.
+        """
+        return None
+
+    def sample_weighted(self, n: int) -> Column | None:
+        """
+        Draws ``n`` distinct values without replacement, each in proportion to its probability.
+        This is used when removing duplicates doesn't find enough distinct values.
+        None means this synthesizer can't do this.
+        """
+        return None
+
+    def lazy_pool(self, rows: int) -> Pool | None:
+        """
+        A pool of ``rows`` unique values, computed as needed instead of generated and stored.
+        None means the pool must be materialized.
+        """
+        return None
+
+    def numpy_rng(self) -> numpy.random.Generator:
+        """
+        The NumPy ``Generator`` for :py:meth:`value_batch`, from the current :py:meth:`stream`.
+        """
+        return self.np_rng
+
+    def noise_gen(self, sequence: int | None = None, rng: random.Random | None = None) -> Any:
         """
         Low-level noise synthesis. Pick one of the ``noise_synth`` functions.
+        The choice, and the function, use ``rng``; the default is this synthesizer's own ``rng``.
         """
-        noise_synth = random.choice(self.noise_synth)
-        return noise_synth(sequence)
+        rng = self.rng if rng is None else rng
+        noise_synth = rng.choice(self.noise_synth)
+        return noise_synth(sequence, rng)
+
+    def noise_level(self, noise: float) -> float:
+        """
+        The probability of noise for this field, when noise is injected.
+        A ``{"noise": rate}`` in the field's ``json_schema_extra`` replaces the ``noise`` probability;
+        ``{"noise": 0}`` keeps the field clean.
+        """
+        if noise and self.noise_rate is not None:
+            return self.noise_rate
+        return noise
+
+    def noise_mask(self, start: int, stop: int, noise: float) -> numpy.ndarray:
+        """
+        A boolean array: which of the rows ``start`` up to ``stop`` have noise, with probability ``noise``.
+        The choice for each row depends only on the seed and the row.
+        The ``noise`` is adjusted by :py:meth:`noise_level`.
+        """
+        return uniform_array(self.noise_seed, start, stop) < self.noise_level(noise)
+
+    def is_noise(self, index: int, noise: float) -> bool:
+        """The choice made by :py:meth:`noise_mask` for a single row."""
+        return uniform_at(self.noise_seed, index) < self.noise_level(noise)
+
+    def noise_block(self, number: int, noise: float) -> dict[int, Any]:
+        """
+        The noise values for block ``number``, a mapping from offset in the block to value.
+
+        The noisy rows of the block are found in one step by :py:meth:`noise_mask`.
+        Only those rows get a value, from :py:meth:`noise_values` with the block's own noise stream.
+        The most recent block is cached.
+        """
+        level = self.noise_level(noise)
+        cached = self.cached_noise
+        if cached is None or cached[:2] != (number, level):
+            start = number * self.block_size
+            noisy = numpy.flatnonzero(self.noise_mask(start, start + self.block_size, noise))
+            self.stream("noise", number)
+            values = self.noise_values((noisy + start).tolist())
+            cached = (number, level, dict(zip(noisy.tolist(), values)))
+            self.cached_noise = cached
+        return cached[2]
+
+    def noise_at(self, index: int, noise: float) -> Any:
+        """
+        The noise value for row ``index``, a row chosen by :py:meth:`is_noise`.
+        Only the noise values of the block which contains the row are created.
+        """
+        number, offset = divmod(index, self.block_size)
+        return self.noise_block(number, noise)[offset]
+
+    def noise_values(self, indices: list[int]) -> list[Any]:
+        """
+        Low-level synthesis of the noise values for each of the rows in ``indices``, from the current :py:meth:`stream`.
+        """
+        return [self.noise_gen(index) for index in indices]
+
+    def noise_batch(self, n: int) -> Column:
+        """
+        Low-level synthesis of a column of ``n`` noise values.
+        """
+        return [self.noise_gen() for _ in range(n)]
+
+    def inject_noise(self, column: Column, start: int, stop: int, noise: float) -> Column:
+        """
+        Replaces the values in a column for rows ``start`` up to ``stop`` with the noise values from :py:meth:`noise_block`.
+        The noise values are scattered into a copy of the column.
+        Without any noisy rows, the column is returned unchanged.
+        """
+        if stop <= start or not self.noise_level(noise):
+            return column
+        size = self.block_size
+        scatter: list[tuple[int, Any]] = []
+        for number in range(start // size, (stop - 1) // size + 1):
+            base = number * size - start
+            scatter.extend(
+                (base + offset, value)
+                for offset, value in self.noise_block(number, noise).items()
+                if 0 <= base + offset < stop - start
+            )
+        if not scatter:
+            return column
+        values = self.to_values(column)
+        for offset, value in scatter:
+            values[offset] = value
+        return values
 
     T = TypeVar("T")
 
@@ -323,6 +809,18 @@ class SynthesizeUnion(Synthesizer):
         super().__init__(model, field, behavior)
         self.subdomain: dict[Synthesizer, float]
 
+    def reseed(self, seed: int) -> None:
+        """Each source has a seed derived from this synthesizer's seed."""
+        super().reseed(seed)
+        for name, synth in self.sources.items():
+            synth.reseed(derive_seed(seed, name))
+
+    def stream(self, *key: Any) -> None:
+        """The sources restart their streams along with this synthesizer."""
+        super().stream(*key)
+        for synth in self.sources.values():
+            synth.stream(*key)
+
     def initialize(self):
         """
         Use jsonschema "subdomain"  to determine distribution.
@@ -349,27 +847,49 @@ class SynthesizeUnion(Synthesizer):
             else:
                 # Without a subdomain spec, the default distribution is uniform.
                 self.subdomain = {s: 1 for s in self.sources.values()}
+        self.domains: list[Synthesizer] = list(self.subdomain)
+        self.alias = AliasTable(list(self.subdomain.values()))
+
+    def pick(self, rng: random.Random | None = None) -> "Synthesizer":
+        """Pick a domain, using the ``alias`` table and one value from ``rng``; the default is ``self.rng``."""
+        return self.domains[self.alias.sample((self.rng if rng is None else rng).random())]
 
     def value_gen(self, sequence: int | None = None) -> Any:
         """
         Pick a domain. Then pick a value from the domain.
         """
-        synth = random.choices(
-            list(self.subdomain.keys()), weights=list(self.subdomain.values()), k=1
-        )[0]
-        return cast(Synthesizer, synth).value_gen(sequence)
+        return self.pick().value_gen(sequence)
 
-    def noise_gen(self, sequence: int | None = None) -> Any:
+    def value_batch(self, n: int, sequence: int | None = None) -> Column:
+        """
+        Pick a domain for each of the ``n`` values, all at once, from the ``alias`` table.
+        Then get each domain's share of the values in a single batch, and scatter them into the column.
+        """
+        picks = self.alias.sample_array(self.numpy_rng().random(n))
+        values: list[Any] = [None] * n
+        for index, synth in enumerate(self.domains):
+            positions = numpy.flatnonzero(picks == index).tolist()
+            if positions:
+                shares = synth.to_values(synth.value_batch(len(positions), sequence))
+                for p, v in zip(positions, shares):
+                    values[p] = v
+        return values
+
+    def domain_size(self) -> int | None:
+        """The total of the domain sizes, if all of the domains can be counted."""
+        sizes = [synth.domain_size() for synth in self.subdomain]
+        if any(size is None for size in sizes):
+            return None
+        return sum(cast(list[int], sizes))
+
+    def noise_gen(self, sequence: int | None = None, rng: random.Random | None = None) -> Any:
         """
         Pick a value not in any domain.
 
         Ideally, pick a domain and pick a value not in the domain.
         If the domains are reasonably disjoint, this **could** work.
         """
-        synth = random.choices(
-            list(self.subdomain.keys()), weights=list(self.subdomain.values()), k=1
-        )[0]
-        return cast(Synthesizer, synth).noise_gen(sequence)
+        return self.pick(rng).noise_gen(sequence, rng)
 
 
 class SynthesizeReference(Synthesizer):
@@ -383,6 +903,30 @@ class SynthesizeReference(Synthesizer):
     to locate the other synthesizer.
     This rule requires `json_schema_extra={"sql": {"key": "foreign", "reference": "model.field"}}`
 
+    The ``"distribution"`` key of the ``json_schema_extra`` determines how often each key in the pool is used.
+
+    -   ``"uniform"``, the default, chooses keys at random, all equally likely.
+
+    -   ``"deal"`` deals the keys: every key is used once before any key is used again.
+        Each pass through the pool is a new permutation.
+
+    -   ``"zipf"``, ``"hot-set"``, and the other names in :py:mod:`synthdata.distributions`
+        are distributions over the positions in the pool.
+        For example, ``{"distribution": "zipf", "s": 1.2}`` makes the first keys in the pool the most common,
+        and ``{"distribution": "hot-set", "fraction": 0.01, "weight": 0.5}`` gives 1% of the keys half of the rows.
+        The order of the pool is random, so the common keys are arbitrary keys.
+
+    Each position is a rank transform of one uniform value: the floor of the distribution's inverse CDF.
+    There's no table to build, and a skewed column costs about the same as a uniform one.
+
+    A ``"children"`` key makes this model a child of the referenced model, with a number of children for each parent.
+    For example, ``{"children": {"min": 5, "max": 15}}`` gives each parent from 5 to 15 children.
+    The count is uniform, or the ``"distribution"`` in the ``"children"``, with its parameters, over [min, max].
+    The rows are generated by streaming over the parent pool, in the order of the parent's rows:
+    the children of each parent are contiguous, and every parent with a count over zero is referenced.
+    The counts are drawn once, for the whole pool, by :py:meth:`fan_out`.
+    See :py:class:`synthdata.base.SchemaSynthesizer` for the child model's rows.
+
     The ``source`` attribute is stateful.
     The :py:class:`synthdata.base.SynthesizeSchema` sets this to a specific :py:class:`synthdata.base.Synthesizer`  instance.
     The update is done as part of preparation to emit rows of data.
@@ -402,35 +946,149 @@ class SynthesizeReference(Synthesizer):
             self.model_ref, self.field_ref = self.json_schema_extra["sql"]["reference"].split(".")
         except KeyError:  # pragma: no cover
             raise ValueError(f"improper value for {self.json_schema_extra}")
+        self.children: dict[str, Any] | None = self.json_schema_extra.get("children")
+        if self.children is not None:
+            self.dist_name = "children"
+            minimum = self.children.get("min", 1)
+            maximum = self.children.get("max", minimum)
+            if not 0 <= minimum <= maximum or maximum == 0:
+                raise ValueError(f"improper children {self.children}")
+            if self.children.get("distribution", "uniform") not in DISTRIBUTIONS:
+                raise ValueError(f"unknown children distribution {self.children['distribution']!r}")
+        else:
+            self.dist_name = self.json_schema_extra.get("distribution", "uniform")
+            if self.dist_name != "deal" and self.dist_name not in DISTRIBUTIONS:
+                raise ValueError(f"unknown reference distribution {self.dist_name!r}")
         # Will be updated by a SynthesizerSchema when the reference is resolved.
         self.source: Synthesizer | None = None
+        self.positions: tuple[int, Distribution] | None = None
+        self.offsets: numpy.ndarray | None = None
 
-    def value_gen(self, sequence: int | None = None) -> Any:
-        """Generates a value by extracting it from a source synthensizer.
+    def pool(self) -> Pool:
+        """The source's pool of keys."""
+        if self.source is None:
+            raise ValueError(
+                f"source {self.model_ref}.{self.field_ref} not resolved"
+            )  # pragma: no cover
+        return cast(Pooled, self.source.behavior).pool
 
-        ..  important:
+    def distribution(self, size: int) -> Distribution:
+        """The distribution over the positions [0, ``size``) of the pool, created once for each size."""
+        if self.positions is None or self.positions[0] != size:
+            parameters = {k: v for k, v in self.json_schema_extra.items() if k != "distribution"}
+            self.positions = (size, make_distribution(self.dist_name, 0, size, **parameters))
+        return self.positions[1]
 
-            There are several candidate distributions.
+    def deal(self, indices: numpy.ndarray, size: int) -> numpy.ndarray:
+        """
+        The pool positions dealt for rows ``indices``.
+        Each pass through the pool, an epoch, has a permutation keyed by this synthesizer's seed and the epoch.
+        """
+        epochs, offsets = numpy.divmod(indices, size)
+        positions = numpy.empty_like(offsets)
+        for epoch in numpy.unique(epochs).tolist():
+            selected = epochs == epoch
+            permutation = FeistelPermutation(size, derive_seed(self.seed, "deal", epoch))
+            positions[selected] = permutation.array(offsets[selected])
+        return positions
+
+    def fan_out(self) -> numpy.ndarray:
+        """
+        The cumulative number of children of the parents in the pool, created once for each pool.
+        The children of parent :math:`p` are the rows from ``offsets[p - 1]`` up to ``offsets[p]``.
+        The counts come from a stream keyed by this synthesizer's seed.
+        """
+        size = len(self.pool())
+        if self.offsets is None or len(self.offsets) != size:
+            spec = dict(cast(dict[str, Any], self.children))
+            minimum = spec.pop("min", 1)
+            maximum = spec.pop("max", minimum)
+            name = spec.pop("distribution", "uniform")
+            rng = numpy_stream(self.seed, "children")
+            if name == "uniform":
+                counts = rng.integers(minimum, maximum, size=size, endpoint=True)
+            else:
+                distribution = make_distribution(name, minimum, maximum + 1, **spec)
+                counts = numpy.minimum(
+                    numpy.floor(distribution.ppf_array(rng.random(size))), maximum
+                )
+            self.offsets = numpy.cumsum(counts, dtype=numpy.int64)
+        return self.offsets
+
+    def child_rows(self) -> int:
+        """The total number of children of all of the parents."""
+        return int(self.fan_out()[-1])
+
+    def parents(self, indices: numpy.ndarray) -> numpy.ndarray:
+        """
+        The parent pool positions for child rows ``indices``.
+        Rows past the last child start over with the first parent.
 
-            Using self.source.next() will "deal" fairly from the pool.
+        :raises ValueError: if rows are requested, but the parents have no children.
+        """
+        offsets = self.fan_out()
+        if len(indices) and (len(offsets) == 0 or offsets[-1] == 0):
+            raise ValueError(f"no children of {self.model_ref}.{self.field_ref} for {self.model}")
+        return numpy.searchsorted(offsets, indices % offsets[-1], side="right")
 
-            Using self.source.choice() will make random choices from the pool.
+    def value_gen(self, sequence: int | None = None) -> Any:
+        """Generates a value by extracting it from a source synthensizer.
 
-            Other options are possible for non-uniform distributions.
+        The choice uses this synthesizer's ``rng``, not the source's.
+        """
+        if self.dist_name == "uniform":
+            return cast(Synthesizer, self.source).choice(self.rng)
+        pool = self.pool()
+        if self.dist_name == "children":
+            return pool[int(self.parents(numpy.array([sequence or 0]))[0])]
+        if self.dist_name == "deal":
+            return pool[int(self.deal(numpy.array([sequence or 0]), len(pool))[0])]
+        position = math.floor(self.distribution(len(pool)).ppf(self.rng.random()))
+        return pool[min(position, len(pool) - 1)]
+
+    def value_batch(self, n: int, sequence: int | None = None) -> Column:
         """
+        Generates a column of values by extracting them from a source synthesizer.
+        The pool positions for all ``n`` values are computed at once, and taken from the pool in one step.
+        """
+        if self.dist_name == "uniform":
+            if self.source is None:
+                raise ValueError(
+                    f"source {self.model_ref}.{self.field_ref} not resolved"
+                )  # pragma: no cover
+            return self.source.choice_batch(n, self.numpy_rng())
+        pool = self.pool()
+        start = sequence or 0
+        if self.dist_name == "children":
+            return pool.take(self.parents(numpy.arange(start, start + n)))
+        if self.dist_name == "deal":
+            return pool.take(self.deal(numpy.arange(start, start + n), len(pool)))
+        u = self.numpy_rng().random(n)
+        positions = numpy.floor(self.distribution(len(pool)).ppf_array(u)).astype(numpy.int64)
+        return pool.take(numpy.minimum(positions, len(pool) - 1))
+
+    def noise_gen(self, sequence: int | None = None, rng: random.Random | None = None) -> Any:
+        """Pick a value NOT in the key pool, using this synthesizer's ``rng`` by default."""
         if self.source is None:
             raise ValueError(
                 f"source {self.model_ref}.{self.field_ref} not resolved"
             )  # pragma: no cover
-        return self.source.choice()
+        return self.source.noise_gen(rng=self.rng if rng is None else rng)
 
-    def noise_gen(self, sequence: int | None = None) -> Any:
-        """Pick a value NOT in the key pool."""
+    def noise_values(self, indices: list[int]) -> list[Any]:
+        """
+        Pick values NOT in the key pool, with a generator keyed by this synthesizer and the first row.
+        The generator is passed to the source's :py:meth:`synthdata.base.Synthesizer.noise_gen`,
+        so the source's own state is unchanged.
+        """
         if self.source is None:
             raise ValueError(
                 f"source {self.model_ref}.{self.field_ref} not resolved"
             )  # pragma: no cover
-        return self.source.noise_gen()
+        if not indices:
+            return []
+        rng = random_stream(self.seed, "noise", indices[0])
+        return [self.source.noise_gen(rng=rng) for _ in indices]
 
 
 def synth_name_map() -> dict[str, type[Synthesizer]]:
@@ -460,46 +1118,139 @@ class DataIter:
     A trash injector can replace good data with invalid values -- bad numbers, bad strings, None, etc.
     The resulting object will **not** be a valid Pydantic ``BaseModel`` instance.
 
+    The iterator starts at row ``start``.
+    Rows are created in chunks by :py:meth:`synthdata.base.ModelSynthesizer.row_chunk`:
+    a column-oriented batch, turned into ``dict`` objects by the model's compiled row function.
+    The first chunk is small, and each chunk is twice the size of the previous one, up to a block.
+    The rows are the same as the rows from :py:meth:`synthdata.base.ModelSynthesizer.row`.
+
     ..  todo:: Handle recursive structures here.
     """
 
-    def __init__(self, model: "ModelSynthesizer", noise: float = 0.0) -> None:
-        """Creates an iterator, bound to a :py:class:`synthdata.base.ModelSynthesizer` instance."""
+    first_chunk = 16
+
+    def __init__(
+        self, model: "ModelSynthesizer", noise: float = 0.0, start: int = 0, row_type: str = "dict"
+    ) -> None:
+        """
+        Creates an iterator, bound to a :py:class:`synthdata.base.ModelSynthesizer` instance.
+
+        :param row_type: the kind of rows: ``"dict"``, ``"tuple"``, or ``"namedtuple"``.
+            A ``tuple`` has the values in the order of the ``fields`` attribute, shared by all of the rows.
+            A ``namedtuple`` is an instance of :py:meth:`synthdata.base.ModelSynthesizer.row_class`.
+        """
         self.model = model
         self.noise = noise
+        self.count = start
+        self.row_type = row_type
+        self.fields = tuple(model.fields)
+        self.chunk = self.first_chunk
+        self.buffer: deque[Any] = deque()
 
     def __repr__(self) -> str:
         return f"DataIter({self.model}, noise={self.noise})"
 
-    def __iter__(self) -> Iterator[dict[str, Any]]:
+    def __iter__(self) -> Iterator[Any]:
         return self
 
-    def __next__(self) -> dict[str, Any]:  # BaseModel:
+    def __next__(self) -> Any:  # BaseModel:
         """
-        Creates the next ``dict[str, Any]`` object.
+        Creates the next ``dict[str, Any]`` object, or the next ``tuple``.
         Each field is created by the Sythesizer's attached Behavior.
         """
-        data: dict[str, Any] = {}
-        for name, synth in self.model.fields.items():
-            if self.noise and random.random() < self.noise:
-                data[name] = synth.noise_gen()
-            else:
-                data[name] = synth.next()
+        if not self.buffer:
+            self.buffer.extend(
+                self.model.row_chunk(self.count, self.count + self.chunk, self.noise, self.row_type)
+            )
+            self.chunk = min(2 * self.chunk, BLOCK_SIZE)
+        self.count += 1
+        return self.buffer.popleft()
+
+    def batch(self, n: int) -> dict[str, Column]:
+        """
+        Creates a column-oriented batch of the next ``n`` rows: a ``dict[str, Column]`` with a column per field.
+        Each column is created by the Synthesizer's attached Behavior.
+        With noise, each cell is replaced by a noise value with the given probability.
+        """
+        data = self.model.row_batch(self.count, self.count + n, self.noise)
+        self.count += n
+        self.buffer.clear()
         return data
 
+    def batches(self, size: int, rows: int | None = None) -> Iterator[dict[str, Column]]:
+        """
+        Creates a sequence of column-oriented batches, each with at most ``size`` rows.
+
+        :param size: the number of rows in each batch.
+        :param rows: the total number of rows; defaults to the model's ``rows``.
+        :raises ValueError: if there's no number of rows.
+        """
+        remaining = self.model.rows if rows is None else rows
+        if remaining is None:
+            raise ValueError(f"no rows provided for {self.model}")
+        return self._batches(size, remaining)
+
+    def _batches(self, size: int, remaining: int) -> Iterator[dict[str, Column]]:
+        while remaining > 0:
+            n = min(size, remaining)
+            yield self.batch(n)
+            remaining -= n
+
 
 class ModelIter:
     """
     Iterate through values of a :py:class:`synthdata.base.ModelSynthesizer` instance.
     This can only create the Pydantic ``BaseModel`` instances with valid data.
+
+    The synthesizers create values which satisfy the field constraints,
+    so full validation of every row is often more than is needed.
+    The ``validate`` strategy is one of the following:
+
+    -   ``"full"``. Each row is validated by the model class. This is the default.
+
+    -   ``"none"``. Each row is built with no validation, by :py:meth:`construct`.
+
+    -   ``"sample:<rate>"``. A fraction of the rows, for example, ``"sample:0.01"``, are validated.
+        This will catch a synthesizer that drifts from the field constraints.
+        The other rows are built with no validation.
+        The choice of rows depends only on the model's seed and the row.
+
+    -   ``"batch"`` or ``"batch:<size>"``. Chunks of rows, 1,024 by default, are created by
+        :py:meth:`synthdata.base.ModelSynthesizer.row_batch` and validated all at once
+        by a ``TypeAdapter`` for a list of the model.
     """
 
-    def __init__(self, model: "ModelSynthesizer", noise: float = 0.0) -> None:
-        """Creates an iterator, bound to a :py:class:`synthdata.base.ModelSynthesizer` instance."""
+    batch_size = 1024
+
+    def __init__(
+        self, model: "ModelSynthesizer", noise: float = 0.0, validate: str = "full"
+    ) -> None:
+        """
+        Creates an iterator, bound to a :py:class:`synthdata.base.ModelSynthesizer` instance.
+
+        :raises ValueError: if the ``validate`` strategy isn't one of the strategies.
+        """
         self.model = model
         if noise:  # pragma: no cover
             raise TypeError("must use noise=0.0 for ModelIter instances")
         self.data_iter = DataIter(model)
+        self.validate = validate
+        self.rate = 1.0
+        self.buffer: deque[BaseModel] = deque()
+        match validate.split(":"):
+            case ["full"]:
+                pass
+            case ["none"]:
+                self.rate = 0.0
+            case ["sample", rate] if 0 <= float(rate) <= 1:
+                self.rate = float(rate)
+                self.sample_seed = derive_seed(model.seed, "validate")
+            case ["batch"]:
+                pass
+            case ["batch", size] if int(size) > 0:
+                self.batch_size = int(size)
+            case _:
+                raise ValueError(f"unknown validate strategy {validate!r}")
 
     def __repr__(self) -> str:
         return f"ModelIter({self.model})"
@@ -508,7 +1259,16 @@ class ModelIter:
         return self
 
     def __next__(self) -> BaseModel:
+        if self.validate.startswith("batch"):
+            if not self.buffer:
+                self.buffer.extend(self.next_batch())
+            return self.buffer.popleft()
+        index = self.data_iter.count
         data = next(self.data_iter)
+        if self.rate == 0.0 or (
+            self.rate < 1.0 and uniform_at(self.sample_seed, index) >= self.rate
+        ):
+            return self.construct(data)
         try:
             return self.model.model_class(**data)
         except Exception:  # pragma: no cover
@@ -516,27 +1276,190 @@ class ModelIter:
             print(data)
             raise
 
+    def construct(self, data: dict[str, Any]) -> BaseModel:
+        """
+        Builds a model instance from trusted data, with no validation.
+        The data has a value for every field, so there are no defaults to fill in.
+        The instance's attributes are set directly, as ``model_construct()`` does, without its other overheads.
+        A model with extra fields, a root model, or a model with post-init processing uses ``model_construct()``.
+        """
+        model_class = self.model.model_class
+        if (
+            model_class.__pydantic_post_init__
+            or model_class.__pydantic_root_model__
+            or model_class.model_config.get("extra") == "allow"
+        ):
+            return model_class.model_construct(**data)
+        instance = cast(Any, model_class).__new__(model_class)
+        object.__setattr__(instance, "__dict__", data)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(data))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    def next_batch(self) -> list[BaseModel]:
+        """
+        Creates the next chunk of rows as a batch, and validates them all at once.
+        """
+        batch = self.data_iter.batch(self.batch_size)
+        columns = [self.model.fields[name].to_values(column) for name, column in batch.items()]
+        data = [dict(zip(batch, values)) for values in zip(*columns)]
+        return self.model.list_adapter().validate_python(data)
+
 
 class ModelSynthesizer(abc.ABC):
     """Abstract Base Class for various model synthesizers."""
 
     @abc.abstractmethod
-    def __init__(self, cls_: type, rows: int | None = None) -> None:
+    def __init__(self, cls_: type, rows: int | None = None, seed: int | None = None) -> None:
         """
         Initialize a model synthesizer.
 
         :param cls_: a class definition with fields of some kind.
         :param rows: the number of rows to generate when creating key pools.
-        :param noise: the probability of invalid data in the resulting object.
-            Note that non-zero noise values may lead to Pydantic validation errors.
+        :param seed: the seed for all of the field synthesizers.
+            The default is a seed from the ``random`` module.
         """
         self.model_class = cls_
         self.rows = rows
+        self.seed = random.getrandbits(64) if seed is None else seed
         # Reversed to put subclasses first in the dictionary keys.
         self._synth_name_map = synth_name_map()
 
         # Subclasses will popluate the field - synthesizer mapping.
         self.fields: dict[str, Synthesizer]
+        self._list_adapter: TypeAdapter[list[Any]] | None = None
+        self._compiled: dict[str, tuple[Callable[..., Any], Callable[..., list[Any]]]] = {}
+        self._row_class: type[tuple[Any, ...]] | None = None
+
+    def list_adapter(self) -> TypeAdapter[list[Any]]:
+        """
+        The Pydantic ``TypeAdapter`` for a list of the model class, created once.
+        """
+        if self._list_adapter is None:
+            self._list_adapter = TypeAdapter(list[self.model_class])  # type: ignore [name-defined]
+        return self._list_adapter
+
+    def reseed(self, seed: int) -> None:
+        """
+        Sets the seed of each field synthesizer.
+        The field's seed is derived from this seed, the model class name, and the field name.
+        """
+        self.seed = seed
+        for name, synth in self.fields.items():
+            synth.reseed(derive_seed(seed, self.model_class.__name__, name))
+
+    row_types = ("dict", "tuple", "namedtuple")
+    """The kinds of rows: a ``dict``, a ``tuple`` in field order, or a :py:meth:`row_class` instance."""
+
+    def row_class(self) -> type[tuple[Any, ...]]:
+        """
+        A ``namedtuple`` class for the rows of this model, created once.
+        The class has the model's name, and a slot for each field.
+        """
+        if self._row_class is None:
+            self._row_class = namedtuple(self.model_class.__name__, list(self.fields))  # type: ignore [misc]
+        return self._row_class
+
+    def compile(
+        self, row_type: str = "dict"
+    ) -> tuple[Callable[..., Any], Callable[..., list[Any]]]:
+        """
+        Generates the code of two functions specialized for this model's fields and a row type, once.
+
+        -   ``row(index, noise)`` creates a row.
+            Each field's :py:meth:`synthdata.base.Behavior.row` is bound to a name in the function.
+            Without noise, there's no test for noise.
+
+        -   ``rows(n, *columns)`` creates each of ``n`` rows from a column of values for each field.
+
+        A ``dict`` is built by a ``dict`` display with the field names as constants,
+        a ``tuple`` by a tuple display, and a ``namedtuple`` by calling the :py:meth:`row_class`.
+        There's no loop over the fields, and no attribute lookups for each value.
+
+        :raises ValueError: if the ``row_type`` isn't one of the :py:attr:`row_types`.
+        """
+        if row_type not in self.row_types:
+            raise ValueError(f"unknown row type {row_type!r}")
+        if row_type not in self._compiled:
+            names = list(self.fields)
+
+            def display(values: list[str]) -> str:
+                match row_type:
+                    case "dict":
+                        return "{" + ", ".join(f"{n!r}: {v}" for n, v in zip(names, values)) + "}"
+                    case "tuple":
+                        return "(" + "".join(f"{v}, " for v in values) + ")"
+                    case _:
+                        return "Row(" + ", ".join(values) + ")"
+
+            namespace: dict[str, Any] = {
+                "Row": self.row_class() if row_type == "namedtuple" else None
+            }
+            args, values, plain, noisy = [], [], [], []
+            for i, synth in enumerate(self.fields.values()):
+                namespace[f"row_{i}"] = synth.behavior.row
+                namespace[f"is_noise_{i}"] = synth.is_noise
+                namespace[f"noise_at_{i}"] = synth.noise_at
+                args.append(f"c_{i}")
+                values.append(f"v_{i}")
+                plain.append(f"row_{i}(index)")
+                noisy.append(
+                    f"noise_at_{i}(index, noise) if is_noise_{i}(index, noise) else row_{i}(index)"
+                )
+            if not names:
+                rows = f"[{display([])} for _ in range(n)]"
+            elif row_type == "tuple":
+                rows = f"list(zip({', '.join(args)}))"
+            else:
+                rows = f"[{display(values)} for {', '.join(values)}, in zip({', '.join(args)})]"
+            source = "\n".join(
+                [
+                    "def row(index, noise):",
+                    "    if not noise:",
+                    f"        return {display(plain)}",
+                    f"    return {display(noisy)}",
+                    f"def rows(n, {', '.join(args)}):",
+                    f"    return {rows}",
+                ]
+            )
+            exec(source, namespace)
+            self._compiled[row_type] = (namespace["row"], namespace["rows"])
+        return self._compiled[row_type]
+
+    def row(self, index: int, noise: float = 0.0, row_type: str = "dict") -> Any:
+        """
+        Creates the row ``index``, without creating the rows before it.
+        The row is a ``dict[str, Any]`` by default; see :py:attr:`row_types`.
+        With noise, each value is replaced by a noise value with the given probability.
+        The pools must be prepared first.
+        """
+        return self.compile(row_type)[0](index, noise)
+
+    def row_chunk(
+        self, start: int, stop: int, noise: float = 0.0, row_type: str = "dict"
+    ) -> list[Any]:
+        """
+        Creates each of the rows ``start`` up to ``stop``.
+        The rows are created as a batch by :py:meth:`row_batch`, and turned into rows by the compiled ``rows()`` function.
+        The rows are identical to the rows from :py:meth:`row`.
+        """
+        batch = self.row_batch(start, stop, noise)
+        columns = [synth.to_values(batch[name]) for name, synth in self.fields.items()]
+        return self.compile(row_type)[1](stop - start, *columns)
+
+    def row_batch(self, start: int, stop: int, noise: float = 0.0) -> dict[str, Column]:
+        """
+        Creates a column-oriented batch for rows ``start`` up to ``stop``.
+        The batch is identical to the rows from :py:meth:`row`.
+        """
+        data: dict[str, Column] = {}
+        for name, synth in self.fields.items():
+            column = synth.row_batch(start, stop)
+            if noise:
+                column = synth.inject_noise(column, start, stop, noise)
+            data[name] = column
+        return data
 
 
 class BaseModelSynthesizer(ModelSynthesizer):
@@ -549,7 +1472,9 @@ class BaseModelSynthesizer(ModelSynthesizer):
     ..  todo:: Handle recursive structures here.
     """
 
-    def __init__(self, cls_: type[BaseModel], rows: int | None = None) -> None:
+    def __init__(
+        self, cls_: type[BaseModel], rows: int | None = None, seed: int | None = None
+    ) -> None:
         """
         Initializes a synthesizer for all fields of a given ``BaseModel``.
         The number of rows is only needed if there are any :py:class:`synthdata.base.Pooled` synthesizers,
@@ -561,9 +1486,11 @@ class BaseModelSynthesizer(ModelSynthesizer):
         The general use case is the use the ``fields`` attribute, which is a mapping
         of field names to :py:class:`synthdata.base.Synthesizer` instances.
 
+        The same ``seed`` creates the same rows.
+
         ..  todo:: Handle nested models.
         """
-        super().__init__(cls_, rows)
+        super().__init__(cls_, rows, seed)
         # Special case for FK references
         self.synthesize_reference = self._synth_name_map["SynthesizeReference"]
 
@@ -571,12 +1498,21 @@ class BaseModelSynthesizer(ModelSynthesizer):
             name: self.make_field_synth(field)
             for name, field in self.model_class.model_fields.items()
         }
+        self.reseed(self.seed)
 
     def _prepare(self):
-        """Initialize pools, and handle any other required preparation."""
+        """
+        Initialize pools, and handle any other required preparation.
+        Each field is prepared once; after that, this does nothing until :py:meth:`reset`.
+        """
         for name, field_synth in self.fields.items():
             field_synth.prepare()
 
+    def reset(self) -> None:
+        """Discards the prepared pools of all fields, so they're filled again by :py:meth:`_prepare`."""
+        for name, field_synth in self.fields.items():
+            field_synth.reset()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.model_class}, rows={self.rows})"
 
@@ -668,6 +1604,9 @@ class BaseModelSynthesizer(ModelSynthesizer):
             case type() as simple_type:
                 # Single Match, also no Behavior.
                 sources = {str(simple_type): simple_match(simple_type, field.json_schema_extra)}
+            case _LiteralGenericAlias() as literal:
+                # A Literal isn't a type; a single match, also no Behavior.
+                sources = {str(literal): simple_match(literal, field.json_schema_extra)}
             case _:  # pragma: no cover
                 raise TypeError(f"unexpected {field.annotation!r}")
         return None, sources
@@ -723,13 +1662,21 @@ class BaseModelSynthesizer(ModelSynthesizer):
     def __iter__(self) -> Iterator[BaseModel]:
         return self.model_iter()
 
-    def model_iter(self, noise: float = 0.0) -> Iterator[BaseModel]:
+    def model_iter(self, noise: float = 0.0, validate: str = "full") -> Iterator[BaseModel]:
+        """
+        Returns an iterator over ``BaseModel`` instances.
+        See :py:class:`synthdata.base.ModelIter` for the ``validate`` strategies.
+        """
         self._prepare()
-        return ModelIter(self, noise=0.0)
+        return ModelIter(self, noise=0.0, validate=validate)
 
-    def data_iter(self, noise: float = 0.0) -> Iterator[dict[str, Any]]:
+    def data_iter(self, noise: float = 0.0, row_type: str = "dict") -> Iterator[Any]:
+        """
+        Returns an iterator over rows, with noise.
+        See :py:class:`synthdata.base.DataIter` for the ``row_type``.
+        """
         self._prepare()
-        return DataIter(self, noise)
+        return DataIter(self, noise, row_type=row_type)
 
 
 class SchemaSynthesizer:
@@ -747,6 +1694,43 @@ class SchemaSynthesizer:
     Then -- after all models have been added -- use :py:meth:`rows` to get rows for a ``BaseModel``.
 
     The ``noise`` value is the probability of noise -- invalid values or None values if None is not permitted.
+    A field can have its own probability of noise, used when noise is injected:
+    ``Field(json_schema_extra={"noise": 0.25})``.
+    A probability of 0 keeps the field clean.
+
+    The ``seed`` determines all of the rows of all of the models.
+    The default is a seed from the ``random`` module.
+
+    A child model has a reference with a ``"children"`` count for each parent;
+    see :py:class:`synthdata.base.SynthesizeReference`.
+    Add a child model without rows: its rows are the total number of children, known when the parent's pool is prepared.
+    Each parent's children are contiguous, in the order of the parent's rows,
+    which makes clustered data for loading into indexed tables.
+    With rows, the children start over with the first parent after the last child.
+
+    Preparation is demand-driven.
+    The FK references form a dependency graph among fields.
+    The first request for a model's rows prepares only the pools that model needs:
+    its own, plus the pools its references lead to, transitively.
+
+    The optional ``cache_dir`` is a persistent cache of materialized pools.
+    A pool is saved in a subdirectory named by a fingerprint of the model's JSON schema
+    (including each field's ``json_schema_extra``), the field, the number of rows, and the field's seed.
+    The next run with the same fingerprint memory-maps the saved pool instead of filling it again.
+    Any change to the model, the rows, or the seed is a new fingerprint; stale entries are simply not used.
+
+    Use :py:meth:`write_csv` or :py:meth:`write_jsonl` to write a model's rows to a file.
+    These format the column-oriented batches directly; see :py:mod:`synthdata.writers`.
+    Use :py:meth:`record_batches` for Apache Arrow record batches, and :py:meth:`write_parquet` for a Parquet file.
+    Use :py:meth:`load_sqlite` to create and load the tables of a SQLite database.
+    Use :py:meth:`write_copy` for PostgreSQL ``COPY ... FROM STDIN``.
+
+    Use :py:meth:`parallel_batches` to split a model's rows among worker processes.
+    A schema is pickled as its recipe: the seed, and the model classes and rows provided to :py:meth:`add`.
+    Each worker rebuilds the schema from the recipe.
+    The model classes must be importable by the workers.
+    Materialized pools are published by :py:meth:`share_pools` and memory-mapped by the workers,
+    so there's one copy of each pool, no matter how many workers there are.
 
     ..  important::
 
@@ -755,10 +1739,20 @@ class SchemaSynthesizer:
         It's best to define all model classes before trying to emit any data.
     """
 
-    def __init__(self) -> None:
+    cache_version = 2
+    """Part of each cache fingerprint; changed when the way pools are filled changes."""
+
+    def __init__(self, seed: int | None = None, cache_dir: Path | str | None = None) -> None:
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
         self.schema = {}
         self.references = []
-        self.prepared = False
+        self.graph: dict[tuple[str, str], set[tuple[str, str]]] = {}
+        self.recipe: list[tuple[type[BaseModel], int | None]] = []
+        self.shared_pools: dict[tuple[str, str], Pool] = {}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _rebuild_schema, (self.seed, self.cache_dir, tuple(self.recipe), self.shared_pools)
 
     def add(self, model_class: type[BaseModel], rows: int | None = None) -> None:
         """
@@ -768,16 +1762,17 @@ class SchemaSynthesizer:
         """
         match model_class:
             case BaseModel.__class__():
-                model = BaseModelSynthesizer(model_class, rows)
+                model = BaseModelSynthesizer(model_class, rows, self.seed)
             case _:  # pragma: no cover
                 raise ValueError(f"unsupported {type(model_class)} model")
         self.schema[model_class.__name__] = model
-        references = [
-            (model, field, field.model_ref, field.field_ref)
-            for field in model.fields.values()
-            if field.model_ref and field.field_ref
-        ]
-        self.references.extend(references)
+        self.recipe.append((model_class, rows))
+        for name, field in model.fields.items():
+            if field.model_ref and field.field_ref:
+                self.references.append((model, field, field.model_ref, field.field_ref))
+                self.graph.setdefault((model_class.__name__, name), set()).add(
+                    (field.model_ref, field.field_ref)
+                )
 
     def _resolve(self) -> None:
         """
@@ -792,44 +1787,484 @@ class SchemaSynthesizer:
                 print(f"{model_ref} not in {self.schema.keys()}")
                 raise KeyError(f"can't resolve {model} {field} ref to {model_ref}.{field_ref}")
             field.source = target
-            self.prepare()
 
-    def prepare(self) -> None:
+    def needed(self, *model_classes: type[BaseModel]) -> list[tuple[str, str]]:
+        """
+        The (model name, field name) of each field needed to create rows for the given models:
+        all of their fields, and the fields reachable through the FK reference graph.
+        With no models, all of the fields in the schema are needed.
         """
-        For Pooled synthesizers, this will populate the pools.
-        Once.
-        After that, it does nothing.
+        names = [cls_.__name__ for cls_ in model_classes] or list(self.schema)
+        pending = [(name, field) for name in names for field in self.schema[name].fields]
+        needed: dict[tuple[str, str], None] = {}
+        while pending:
+            key = pending.pop()
+            if key not in needed:
+                needed[key] = None
+                pending.extend(self.graph.get(key, ()))
+        return list(needed)
+
+    def prepare(self, *model_classes: type[BaseModel]) -> None:
+        """
+        For Pooled synthesizers, this will populate the pools needed by the given models.
+        With no models, all of the pools are populated.
+        Each pool is filled once.
+        After that, it's shared by every iterator.
+        """
+        self._resolve()
+        needed = self.needed(*model_classes)
+        for model_name in dict.fromkeys(model_name for model_name, _ in needed):
+            self.fan_out(model_name)
+        for model_name, field_name in needed:
+            self.prepare_field(model_name, field_name)
+
+    def prepare_field(self, model_name: str, field_name: str) -> None:
+        """Prepares one field's synthesizer, using the pool cache, if there is one."""
+        synth = self.schema[model_name].fields[field_name]
+        if self.cache_dir is not None and isinstance(synth.behavior, Pooled):
+            if not synth.behavior.prepared:
+                self.cached_pool(model_name, field_name)
+        synth.prepare()
+
+    def fan_out(self, model_name: str, visiting: frozenset[str] = frozenset()) -> None:
+        """
+        Sets the rows of a child model -- a model with a ``"children"`` reference and no rows provided to :py:meth:`add` --
+        to the total number of children of its parents.
+        The parent's pool is prepared first; a parent can be a child model, also.
+
+        :raises ValueError: for a cycle of ``"children"`` references.
         """
-        if self.prepared:
+        model = self.schema[model_name]
+        if model.rows is not None:
             return
-        self.prepared = True
-        for model, model_synth in self.schema.items():
-            model_synth._prepare()
+        if model_name in visiting:
+            raise ValueError(f"cycle of children references through {model_name}")
+        for synth in model.fields.values():
+            if isinstance(synth, SynthesizeReference) and synth.children is not None:
+                self.fan_out(synth.model_ref, visiting | {model_name})
+                self.prepare_field(synth.model_ref, synth.field_ref)
+                model.rows = synth.child_rows()
+                return
+
+    def fingerprint(self, model_name: str, field_name: str) -> str:
+        """
+        The cache key for the pool of a field.
+        A hash of the model's JSON schema, the field, its synthesizer, the rows, and the field's seed.
+        """
+        model = self.schema[model_name]
+        synth = model.fields[field_name]
+        definition = {
+            "version": self.cache_version,
+            "model": model.model_class.model_json_schema(),
+            "field": field_name,
+            "synth": synth.__class__.__name__,
+            "rows": model.rows,
+            "seed": synth.seed,
+        }
+        text = json.dumps(definition, sort_keys=True, default=str)
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def cached_pool(self, model_name: str, field_name: str) -> None:
+        """
+        Attaches a field's pool from the ``cache_dir``.
+        If it's not in the cache, the pool is filled and saved.
+        Pools which can't be shared, for example, lazy pools, are filled and not saved.
+
+        A new entry is written to a staging directory, and renamed into place.
+        Concurrent runs never see a partially-written entry.
+        """
+        assert self.cache_dir is not None
+        behavior = cast(Pooled, self.schema[model_name].fields[field_name].behavior)
+        entry = self.cache_dir / self.fingerprint(model_name, field_name)
+        pool = load_pool(entry / "pool")
+        if pool is None:
+            behavior.fill()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(dir=self.cache_dir))
+            try:
+                if behavior.pool.share(staging / "pool") is None:
+                    return
+                staging.rename(entry)
+            except OSError:
+                # Another run saved the same entry first.
+                pass
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+            pool = load_pool(entry / "pool")
+        if pool is not None:
+            behavior.attach(pool)
 
     def reset(self) -> None:
-        """Reset the synthesizers to repopulate pools."""
-        self.prepared = False
-        self.prepare()
+        """
+        Discards all of the pools.
+        They're filled again the next time they're needed.
+        """
+        for model, model_synth in self.schema.items():
+            model_synth.reset()
 
-    def rows(self, model_class: type[BaseModel]) -> Iterator[BaseModel]:
+    def rows(self, model_class: type[BaseModel], validate: str = "full") -> Iterator[BaseModel]:
         """
         Returns the iterator for the :py:class:`synthdata.synth.SynthesizeModel`.
         If all FK references are not resolved, will raise an exception.
 
+        :param validate: the validation strategy: ``"full"``, ``"none"``, ``"sample:<rate>"``, or ``"batch"``.
+            See :py:class:`synthdata.base.ModelIter`.
         :raises KeyError: if the FK reference (``"Model.field"``) cannot be found.
         :raises ValueError: if the FK reference is not a Pooled synthesizer.
         """
-        self._resolve()
-        self.prepare()
+        self.prepare(model_class)
         model = self.schema[model_class.__name__]
-        return model.model_iter(noise=0.0)
+        return model.model_iter(noise=0.0, validate=validate)
 
-    def data(self, model_class: type[BaseModel], noise: float = 0.0) -> Iterator[dict[str, Any]]:
+    def data(
+        self, model_class: type[BaseModel], noise: float = 0.0, row_type: str = "dict"
+    ) -> Iterator[Any]:
         """
         Returns an iterator for potential :py:class:`synthdata.synth.SynthesizeModel` instances.
         Noise is injected and the values may not be valid.
+
+        :param row_type: ``"dict"``, ``"tuple"`` in field order, or ``"namedtuple"``.
+            See :py:class:`synthdata.base.DataIter`.
         """
-        self._resolve()
-        self.prepare()
+        self.prepare(model_class)
+        model = self.schema[model_class.__name__]
+        return model.data_iter(noise=noise, row_type=row_type)
+
+    def batches(
+        self,
+        model_class: type[BaseModel],
+        size: int,
+        rows: int | None = None,
+        noise: float = 0.0,
+    ) -> Iterator[dict[str, Column]]:
+        """
+        Returns an iterator over column-oriented batches for a model.
+        Each batch is a ``dict[str, Column]`` with at most ``size`` rows.
+        The total number of rows defaults to the number of rows provided to :py:meth:`add`.
+        Noise is injected and the values may not be valid.
+        """
+        self.prepare(model_class)
+        model = self.schema[model_class.__name__]
+        return cast(DataIter, model.data_iter(noise=noise)).batches(size, rows)
+
+    def write_csv(
+        self,
+        model_class: type[BaseModel],
+        path: Path | str,
+        rows: int | None = None,
+        noise: float = 0.0,
+        header: bool = True,
+        size: int = writers.BATCH_ROWS,
+    ) -> int:
+        """
+        Writes rows for a model to a CSV file, with a column for each field.
+        The rows are the same as the batches from :py:meth:`batches`.
+
+        :param rows: the number of rows; defaults to the number of rows provided to :py:meth:`add`.
+        :param header: write a first row with the field names.
+        :param size: the number of rows formatted and written at once.
+        :returns: the number of rows written.
+        """
+        batches = self.batches(model_class, size, rows, noise)
+        model = self.schema[model_class.__name__]
+        with open(path, "w", newline="", encoding="utf-8", buffering=writers.BUFFER_SIZE) as target:
+            return writers.write_csv(target, list(model.fields), batches, header)
+
+    def write_jsonl(
+        self,
+        model_class: type[BaseModel],
+        path: Path | str,
+        rows: int | None = None,
+        noise: float = 0.0,
+        size: int = writers.BATCH_ROWS,
+    ) -> int:
+        """
+        Writes rows for a model to a JSON Lines file, with an object for each row.
+        The rows are the same as the batches from :py:meth:`batches`.
+
+        :param rows: the number of rows; defaults to the number of rows provided to :py:meth:`add`.
+        :param size: the number of rows formatted and written at once.
+        :returns: the number of rows written.
+        """
+        batches = self.batches(model_class, size, rows, noise)
         model = self.schema[model_class.__name__]
-        return model.data_iter(noise=noise)
+        with open(path, "w", encoding="utf-8", buffering=writers.BUFFER_SIZE) as target:
+            return writers.write_jsonl(target, list(model.fields), batches)
+
+    def record_batches(
+        self,
+        model_class: type[BaseModel],
+        size: int = writers.BATCH_ROWS,
+        rows: int | None = None,
+    ) -> Iterator["pyarrow.RecordBatch"]:
+        """
+        Returns an iterator over Apache Arrow record batches for a model,
+        with the rows of the batches from :py:meth:`batches`.
+        The Arrow types come from the model's annotations; see :py:func:`synthdata.writers.arrow_schema`.
+        Numeric and timestamp columns are not copied.
+
+        There's no noise: noise values don't fit the Arrow types of the columns.
+        """
+        schema = writers.arrow_schema(model_class)
+        batches = self.batches(model_class, size, rows)
+        return (writers.record_batch(schema, batch) for batch in batches)
+
+    def write_parquet(
+        self,
+        model_class: type[BaseModel],
+        path: Path | str,
+        rows: int | None = None,
+        row_group_size: int = writers.BATCH_ROWS,
+        compression: str = "snappy",
+    ) -> int:
+        """
+        Writes rows for a model to a Parquet file, streaming one row group at a time.
+        The rows are the same as the batches from :py:meth:`batches`.
+
+        :param rows: the number of rows; defaults to the number of rows provided to :py:meth:`add`.
+        :param row_group_size: the number of rows in each row group.
+        :param compression: the Parquet compression codec.
+        :returns: the number of rows written.
+        """
+        return writers.write_parquet(
+            path,
+            writers.arrow_schema(model_class),
+            self.record_batches(model_class, row_group_size, rows),
+            compression,
+        )
+
+    def write_copy(
+        self,
+        model_class: type[BaseModel],
+        target: BinaryIO | Path | str,
+        rows: int | None = None,
+        noise: float = 0.0,
+        binary: bool = False,
+        size: int = writers.BATCH_ROWS,
+    ) -> int:
+        """
+        Writes rows for a model in the PostgreSQL ``COPY ... FROM STDIN`` text or binary format.
+        The rows are the same as the batches from :py:meth:`batches`.
+        :py:func:`synthdata.writers.copy_statement` is the matching ``COPY`` statement.
+
+        :param target: a binary file or pipe, for example, ``sys.stdout.buffer``, or the path of a file.
+        :param rows: the number of rows; defaults to the number of rows provided to :py:meth:`add`.
+        :param binary: use the binary format, with the column types from the model's annotations.
+        :param size: the number of rows formatted and written at once.
+        :returns: the number of rows written.
+        :raises ValueError: for noise in the binary format; noise values don't fit the column types.
+        """
+        if binary and noise:
+            raise ValueError("noise can't be written in the binary COPY format")
+        batches = self.batches(model_class, size, rows, noise)
+        if isinstance(target, (Path, str)):
+            with open(target, "wb", buffering=writers.BUFFER_SIZE) as output:
+                return self._write_copy(model_class, output, batches, binary)
+        return self._write_copy(model_class, target, batches, binary)
+
+    def _write_copy(
+        self,
+        model_class: type[BaseModel],
+        target: BinaryIO,
+        batches: Iterator[dict[str, Column]],
+        binary: bool = False,
+    ) -> int:
+        """Writes the batches for :py:meth:`write_copy` to an open binary file."""
+        fields = list(self.schema[model_class.__name__].fields)
+        if binary:
+            types = [
+                writers.postgres_type(model_class.model_fields[name].annotation) for name in fields
+            ]
+            return writers.write_copy_binary(target, fields, types, batches)
+        return writers.write_copy_text(target, fields, batches)
+
+    def load_order(self, *model_classes: type[BaseModel]) -> list[str]:
+        """
+        The names of the given models (or all models), with each model after the models it refers to.
+        Models which refer to each other, directly or indirectly, are in the order they were added.
+        """
+        names = [cls_.__name__ for cls_ in model_classes] or list(self.schema)
+        parents: dict[str, set[str]] = {name: set() for name in names}
+        for (model_name, field_name), targets in self.graph.items():
+            if model_name in parents:
+                parents[model_name] |= {ref for ref, _ in targets if ref in parents} - {model_name}
+        order: list[str] = []
+        while parents:
+            # A cycle has no model with all parents loaded; the first model breaks the cycle.
+            ready = [name for name, refs in parents.items() if refs <= set(order)]
+            name = ready[0] if ready else next(iter(parents))
+            order.append(name)
+            del parents[name]
+        return order
+
+    def load_sqlite(
+        self,
+        database: sqlite3.Connection | Path | str,
+        *model_classes: type[BaseModel],
+        size: int = writers.BATCH_ROWS,
+    ) -> dict[str, int]:
+        """
+        Creates a SQLite table for each of the given models (or all models), and loads the rows.
+        Each model has the number of rows provided to :py:meth:`add`.
+
+        The tables are created and loaded in :py:meth:`load_order`, in a single transaction.
+        The connection's pragmas are set from :py:data:`synthdata.writers.SQLITE_PRAGMAS` while the rows are loaded,
+        and then put back the way they were.
+        See :py:mod:`synthdata.writers` for the DDL.
+
+        :param database: a connection, or the path of a database file.
+        :param size: the number of rows inserted by each ``executemany()``.
+        :returns: the number of rows loaded into each table.
+        :raises sqlite3.OperationalError: if a table already exists.
+        :raises ValueError: if a model has no number of rows.
+        """
+        order = self.load_order(*model_classes)
+        self.prepare(*(self.schema[name].model_class for name in order))
+        for name in order:
+            if self.schema[name].rows is None:
+                raise ValueError(f"no rows provided for {self.schema[name]}")
+        connection = (
+            database if isinstance(database, sqlite3.Connection) else sqlite3.connect(database)
+        )
+        saved = {
+            pragma: connection.execute(f"PRAGMA {pragma}").fetchone()[0]
+            for pragma in writers.SQLITE_PRAGMAS
+        }
+        try:
+            for pragma, value in writers.SQLITE_PRAGMAS.items():
+                connection.execute(f"PRAGMA {pragma} = {value}")
+            counts: dict[str, int] = {}
+            connection.execute("BEGIN")
+            with connection:
+                for name in order:
+                    connection.execute(writers.create_table(self.schema[name].model_class))
+                for name in order:
+                    model = self.schema[name]
+                    counts[name] = writers.load_table(
+                        connection, name, list(model.fields), self.batches(model.model_class, size)
+                    )
+            return counts
+        finally:
+            for pragma, value in saved.items():
+                connection.execute(f"PRAGMA {pragma} = {value}")
+            if connection is not database:
+                connection.close()
+
+    def parallel_batches(
+        self,
+        model_class: type[BaseModel],
+        size: int,
+        rows: int | None = None,
+        noise: float = 0.0,
+        workers: int | None = None,
+    ) -> Iterator[dict[str, Column]]:
+        """
+        Returns an iterator over the same column-oriented batches as :py:meth:`batches`,
+        created by a pool of ``workers`` processes.
+
+        Each batch is a shard of ``size`` rows, created by
+        :py:meth:`synthdata.base.ModelSynthesizer.row_batch` in a worker.
+        The batches are yielded in row order.
+        Since each row depends only on the seed and the row number,
+        the batches are identical for any number of workers.
+
+        :param workers: the number of processes; defaults to the number of CPUs.
+        :raises ValueError: if there's no number of rows.
+        """
+        self.prepare(model_class)
+        model = self.schema[model_class.__name__]
+        total = model.rows if rows is None else rows
+        if total is None:
+            raise ValueError(f"no rows provided for {model}")
+        workers = workers or os.cpu_count() or 1
+        shards = ((start, min(start + size, total)) for start in range(0, total, size))
+        # Forking a process with threads is unsafe; the fork server starts workers from a clean process.
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+        with tempfile.TemporaryDirectory(dir=SHARED_MEMORY_DIR) as directory:
+            self.shared_pools = self.share_pools(Path(directory), model_class)
+            # Each worker gets its copy of the schema once, and keeps it for all of its shards.
+            executor = ProcessPoolExecutor(
+                workers,
+                multiprocessing.get_context(method),
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+            try:
+                # A bounded number of shards in flight limits the memory used by completed shards.
+                pending: deque[Future[dict[str, Column]]] = deque()
+                for start, stop in shards:
+                    pending.append(executor.submit(_shard_batch, model_class, start, stop, noise))
+                    if len(pending) >= 2 * workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # Abandoned iteration shouldn't wait for shards no one will read.
+                executor.shutdown(cancel_futures=True)
+                self.shared_pools = {}
+
+    def share_pools(
+        self, directory: Path, *model_classes: type[BaseModel]
+    ) -> dict[tuple[str, str], Pool]:
+        """
+        Prepares the pools needed by the given models (or all models),
+        and writes each shareable pool to a file in the ``directory``.
+        A pool that's already memory-mapped, for example, from the ``cache_dir``, is shared as it is.
+
+        :returns: a mapping from (model name, field name) to a pool which memory-maps the file.
+            A pickled schema includes these pools, and workers attach to them instead of filling their own.
+        """
+        self.prepare(*model_classes)
+        shared: dict[tuple[str, str], Pool] = {}
+        for model_name, field_name in self.needed(*model_classes):
+            behavior = self.schema[model_name].fields[field_name].behavior
+            if isinstance(behavior, Pooled):
+                pool = behavior.pool
+                if pool.path is None:
+                    pool = pool.share(directory / f"{model_name}.{field_name}")
+                if pool is not None:
+                    shared[model_name, field_name] = pool
+        return shared
+
+
+def _rebuild_schema(
+    seed: int,
+    cache_dir: Path | None,
+    recipe: tuple[tuple[type[BaseModel], int | None], ...],
+    shared_pools: dict[tuple[str, str], Pool],
+) -> SchemaSynthesizer:
+    """
+    Rebuilds a pickled :py:class:`synthdata.base.SchemaSynthesizer` from its recipe,
+    attached to any shared pools.
+    """
+    schema = SchemaSynthesizer(seed, cache_dir)
+    for model_class, rows in recipe:
+        schema.add(model_class, rows)
+    for (model_name, field_name), pool in shared_pools.items():
+        behavior = cast(Pooled, schema.schema[model_name].fields[field_name].behavior)
+        behavior.attach(pool)
+    return schema
+
+
+_worker_schema: SchemaSynthesizer | None = None
+"""The schema of a :py:meth:`synthdata.base.SchemaSynthesizer.parallel_batches` worker process."""
+
+
+def _init_worker(schema: SchemaSynthesizer) -> None:
+    """
+    Keeps a worker's copy of the schema, so the pools are filled or attached once per worker.
+    """
+    global _worker_schema
+    _worker_schema = schema
+
+
+def _shard_batch(
+    model_class: type[BaseModel],
+    start: int,
+    stop: int,
+    noise: float,
+) -> dict[str, Column]:
+    """Creates one shard of :py:meth:`synthdata.base.SchemaSynthesizer.parallel_batches` in a worker."""
+    schema = cast(SchemaSynthesizer, _worker_schema)
+    schema.prepare(model_class)
+    return schema.schema[model_class.__name__].row_batch(start, stop, noise)
@@ -0,0 +1,531 @@
+"""
+Bounded distributions for the numeric synthesizers.
+
+Each distribution is truncated to the ``ge`` and ``le`` bounds of a field.
+Values are created by inverse transform sampling:
+a uniform random value, :math:`u`, is mapped through the inverse of the truncated distribution's CDF.
+This has a fixed cost per value, no matter how narrow the truncation window is.
+There's no rejection loop.
+
+Each distribution offers two methods:
+
+-   :py:meth:`Distribution.ppf` maps a single uniform value to a value in range.
+    This is used by :py:meth:`synthdata.base.Synthesizer.value_gen`.
+
+-   :py:meth:`Distribution.ppf_array` maps a NumPy array of uniform values to an array of values in range.
+    This is used by :py:meth:`synthdata.base.Synthesizer.value_batch`.
+
+The ``"distribution"`` key of the ``json_schema_extra`` names the distribution.
+Additional keys provide the parameters.
+
+..  csv-table::
+    :header: distribution, parameters, defaults
+
+    ``"uniform"``, ,
+    ``"normal"``, ``"mu"`` ``"sigma"``, "midpoint, :math:`\\tfrac{1}{6}` of the range"
+    ``"lognormal"``, ``"mu"`` ``"sigma"``, "0, 1, the parameters of the underlying normal"
+    ``"exponential"``, ``"scale"``, ":math:`\\tfrac{1}{6}` of the range"
+    ``"zipf"``, ``"s"``, 1
+    ``"hot-set"``, ``"fraction"`` ``"weight"``, "0.2, 0.8"
+
+..  autoclass:: Distribution
+    :members:
+
+..  autofunction:: norm_cdf
+
+..  autofunction:: tail_ppf
+
+..  autoclass:: Uniform
+
+..  autoclass:: Normal
+
+..  autoclass:: LogNormal
+
+..  autoclass:: Exponential
+
+..  autoclass:: Zipf
+
+..  autoclass:: HotSet
+
+..  autofunction:: make_distribution
+
+Distinct values of a small domain are drawn with :py:func:`weighted_sample`,
+using the probabilities from :py:meth:`Distribution.cdf_array`.
+
+..  autofunction:: weighted_sample
+
+Weighted choices among a few alternatives use an :py:class:`AliasTable`.
+This is Vose's version of Walker's alias method.
+The table is built once; each choice then takes a single uniform random value and constant time.
+
+..  autoclass:: AliasTable
+    :members:
+"""
+
+import abc
+import math
+from statistics import NormalDist
+from typing import Any
+
+import numpy
+
+# Coefficients for the rational approximations of the standard normal inverse CDF.
+# Acklam's algorithm, relative error less than 1.15e-9.
+_A = (
+    -39.69683028665376,
+    220.9460984245205,
+    -275.9285104469687,
+    138.3577518672690,
+    -30.66479806614716,
+    2.506628277459239,
+)
+_B = (
+    -54.47609879822406,
+    161.5858368580409,
+    -155.6989798598866,
+    66.80131188771972,
+    -13.28068155288572,
+)
+_C = (
+    -0.007784894002430293,
+    -0.3223964580411365,
+    -2.400758277161838,
+    -2.549732539343734,
+    4.374664141464968,
+    2.938163982698783,
+)
+_D = (0.007784695709041462, 0.3224671290700398, 2.445134137142996, 3.754408661907416)
+_P_LOW = 0.02425
+
+SQRT2 = math.sqrt(2)
+LOG_SQRT_2PI = 0.5 * math.log(2 * math.pi)
+# Terms of the Mills ratio continued fraction; plenty for z >= 5.
+_MILLS_TERMS = 40
+_NEWTON_STEPS = 3
+# Below this CDF value, inv_cdf() loses precision, and the window is sampled as a tail.
+_TAIL_CDF = 1e-280
+
+
+def _polyval(coefficients: tuple[float, ...], x: numpy.ndarray) -> numpy.ndarray:
+    result = numpy.zeros_like(x)
+    for c in coefficients:
+        result = result * x + c
+    return result
+
+
+def norm_ppf_array(p: numpy.ndarray) -> numpy.ndarray:
+    """
+    Vectorized inverse CDF of the standard normal distribution.
+    The ``p`` values must be in the open interval (0, 1).
+    """
+    p = numpy.asarray(p, dtype=numpy.float64)
+    x = numpy.empty_like(p)
+    low = p < _P_LOW
+    high = p > 1 - _P_LOW
+    central = ~(low | high)
+
+    q = numpy.sqrt(-2 * numpy.log(p[low]))
+    x[low] = _polyval(_C, q) / (_polyval(_D, q) * q + 1)
+
+    q = numpy.sqrt(-2 * numpy.log1p(-p[high]))
+    x[high] = -_polyval(_C, q) / (_polyval(_D, q) * q + 1)
+
+    q = p[central] - 0.5
+    r = q * q
+    x[central] = _polyval(_A, r) * q / (_polyval(_B, r) * r + 1)
+    return x
+
+
+class Distribution(abc.ABC):
+    """
+    A distribution truncated to the closed interval [``low``, ``high``].
+    The ``parameters`` names the optional ``json_schema_extra`` keys used by the distribution.
+    """
+
+    parameters: tuple[str, ...] = ()
+
+    def __init__(self, low: float, high: float) -> None:
+        if high < low:
+            raise ValueError(f"empty range {low=} {high=}")
+        self.low = low
+        self.high = high
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.low}, {self.high})"
+
+    @abc.abstractmethod
+    def ppf(self, u: float) -> float:  # pragma: no cover
+        """Maps a uniform random value in [0, 1) to a value in range."""
+        ...
+
+    @abc.abstractmethod
+    def ppf_array(self, u: numpy.ndarray) -> numpy.ndarray:  # pragma: no cover
+        """Maps an array of uniform random values in [0, 1) to an array of values in range."""
+        ...
+
+    @abc.abstractmethod
+    def cdf_array(self, x: numpy.ndarray) -> numpy.ndarray:  # pragma: no cover
+        """Maps an array of values to the probability of a value below each one."""
+        ...
+
+
+class Uniform(Distribution):
+    """Uniform distribution over the range."""
+
+    def ppf(self, u: float) -> float:
+        return self.low + u * (self.high - self.low)
+
+    def ppf_array(self, u: numpy.ndarray) -> numpy.ndarray:
+        return self.low + u * (self.high - self.low)
+
+    def cdf_array(self, x: numpy.ndarray) -> numpy.ndarray:
+        if self.high == self.low:
+            return (x > self.low).astype(numpy.float64)
+        return numpy.clip((x - self.low) / (self.high - self.low), 0.0, 1.0)
+
+
+def norm_cdf(z: float) -> float:
+    """
+    The CDF of the standard normal distribution.
+    This uses ``erfc()``, which keeps its relative precision far into the lower tail;
+    ``1 + erf()`` rounds to 0 beyond about 8 standard deviations.
+    """
+    return 0.5 * math.erfc(-z / SQRT2)
+
+
+_erfc = numpy.frompyfunc(math.erfc, 1, 1)
+
+
+def norm_cdf_array(z: numpy.ndarray) -> numpy.ndarray:
+    """Vectorized :py:func:`norm_cdf`."""
+    return 0.5 * numpy.asarray(_erfc(-z / SQRT2), dtype=numpy.float64)
+
+
+def norm_log_sf(z: Any) -> Any:
+    """
+    The log of the upper tail mass, :math:`\\log Q(z)`, for :math:`z` far in the upper tail.
+    :math:`Q(z) = \\phi(z) R(z)`, where the Mills ratio, :math:`R(z)`, is a continued fraction.
+    This works for a float or a NumPy array, where :math:`z \\geq 5`.
+    """
+    t = z
+    for k in range(_MILLS_TERMS, 0, -1):
+        t = z + k / t
+    return -z * z / 2 - LOG_SQRT_2PI - numpy.log(t)
+
+
+def tail_ppf(u: Any, a: float, b: float) -> Any:
+    """
+    Maps uniform values to a standard normal truncated to [``a``, ``b``], far in the upper tail.
+    The CDF values underflow, so this works with :py:func:`norm_log_sf` instead.
+
+    The first approximation is Robert's exponential tail: an exponential with rate
+    :math:`\\lambda = (a + \\sqrt{a^2 + 4}) / 2`, truncated to the window.
+    Newton's method on :math:`\\log Q(z)` corrects it to the normal tail.
+    This works for a float or a NumPy array.
+    """
+    rate = (a + math.sqrt(a * a + 4)) / 2
+    z = a - numpy.log1p(u * numpy.expm1(-rate * (b - a))) / rate
+    log_a = norm_log_sf(a)
+    target = log_a + numpy.log1p(u * numpy.expm1(norm_log_sf(b) - log_a))
+    for _ in range(_NEWTON_STEPS):
+        # d/dz log Q(z) = -1 / R(z), where 1 / R(z) is the continued fraction.
+        t = z
+        for k in range(_MILLS_TERMS, 0, -1):
+            t = z + k / t
+        z = z + (norm_log_sf(z) - target) / t
+    return numpy.clip(z, a, b)
+
+
+class Normal(Distribution):
+    """
+    Truncated normal distribution.
+    The default ``mu`` is the midpoint of the range, the default ``sigma`` is one sixth of the range.
+
+    A window in the upper tail is sampled as the mirror image of the lower tail.
+    This keeps the CDF values small, where floating-point has the most precision.
+    The CDF is computed by :py:func:`norm_cdf`, which is precise to about 37 standard deviations.
+    A window beyond that, where the CDF underflows, is sampled by :py:func:`tail_ppf`.
+    """
+
+    parameters = ("mu", "sigma")
+
+    def __init__(
+        self, low: float, high: float, mu: float | None = None, sigma: float | None = None
+    ) -> None:
+        super().__init__(low, high)
+        self.mu = (high + low) / 2 if mu is None else mu
+        self.sigma = ((high - low) / 6 or 1.0) if sigma is None else sigma
+        if self.sigma <= 0:
+            raise ValueError(f"sigma must be positive, not {self.sigma}")
+        alpha = (low - self.mu) / self.sigma
+        beta = (high - self.mu) / self.sigma
+        self.sign = -1.0 if alpha > 0 else 1.0
+        if self.sign < 0:
+            alpha, beta = -beta, -alpha
+        self.alpha, self.beta = alpha, beta
+        self.cdf_low = norm_cdf(alpha)
+        self.cdf_width = norm_cdf(beta) - self.cdf_low
+        # The CDF of the whole window is too small for inv_cdf(); use the upper tail's mirror image.
+        self.tail = norm_cdf(beta) < _TAIL_CDF
+        self.tiny = math.ulp(0.0)
+
+    def ppf(self, u: float) -> float:
+        if self.tail:
+            z = -float(tail_ppf(u, -self.beta, -self.alpha))
+        elif self.cdf_width <= 0:
+            # The window is narrower than the precision of the CDF, it's effectively flat.
+            return self.low + u * (self.high - self.low)
+        else:
+            p = max(self.cdf_low + u * self.cdf_width, self.tiny)
+            z = NormalDist().inv_cdf(p)
+        return min(max(self.mu + self.sign * z * self.sigma, self.low), self.high)
+
+    def ppf_array(self, u: numpy.ndarray) -> numpy.ndarray:
+        if self.tail:
+            z = -tail_ppf(u, -self.beta, -self.alpha)
+        elif self.cdf_width <= 0:
+            return self.low + u * (self.high - self.low)
+        else:
+            p = numpy.maximum(self.cdf_low + u * self.cdf_width, self.tiny)
+            z = norm_ppf_array(p)
+        return numpy.clip(self.mu + self.sign * z * self.sigma, self.low, self.high)
+
+    def cdf_array(self, x: numpy.ndarray) -> numpy.ndarray:
+        if not self.tail and self.cdf_width <= 0:
+            return Uniform(self.low, self.high).cdf_array(x)
+        z = numpy.clip(self.sign * (x - self.mu) / self.sigma, self.alpha, self.beta)
+        if self.tail:
+            # The fraction of the mirror image's upper tail beyond -z.
+            a, b = -self.beta, -self.alpha
+            log_a = norm_log_sf(a)
+            above = numpy.expm1(norm_log_sf(-z) - log_a) / math.expm1(norm_log_sf(b) - log_a)
+            below = 1 - above
+        else:
+            below = (norm_cdf_array(z) - self.cdf_low) / self.cdf_width
+        below = numpy.clip(below, 0.0, 1.0)
+        return below if self.sign > 0 else 1 - below
+
+
+class LogNormal(Distribution):
+    """
+    Truncated log-normal distribution.
+    The ``mu`` and ``sigma`` parameters are for the underlying normal distribution;
+    the defaults are 0 and 1.
+    The values are the exponential of a truncated normal value.
+    """
+
+    parameters = ("mu", "sigma")
+
+    def __init__(self, low: float, high: float, mu: float = 0.0, sigma: float = 1.0) -> None:
+        super().__init__(low, high)
+        if high <= 0:
+            raise ValueError(f"lognormal requires a positive range, not {low=} {high=}")
+        # A lower bound of zero (or less) is equivalent to no lower bound.
+        log_low = math.log(low) if low > 0 else mu - 40 * sigma
+        self.normal = Normal(log_low, math.log(high), mu, sigma)
+
+    def ppf(self, u: float) -> float:
+        return min(max(math.exp(self.normal.ppf(u)), self.low), self.high)
+
+    def ppf_array(self, u: numpy.ndarray) -> numpy.ndarray:
+        return numpy.clip(numpy.exp(self.normal.ppf_array(u)), self.low, self.high)
+
+    def cdf_array(self, x: numpy.ndarray) -> numpy.ndarray:
+        with numpy.errstate(divide="ignore"):
+            log_x = numpy.log(numpy.maximum(x, 0.0))
+        return numpy.where(x <= self.low, 0.0, self.normal.cdf_array(log_x))
+
+
+class Exponential(Distribution):
+    """
+    Truncated exponential distribution, starting at the low end of the range.
+    The default ``scale`` (the mean of the untruncated distribution) is one sixth of the range.
+    """
+
+    parameters = ("scale",)
+
+    def __init__(self, low: float, high: float, scale: float | None = None) -> None:
+        super().__init__(low, high)
+        self.scale = ((high - low) / 6 or 1.0) if scale is None else scale
+        if self.scale <= 0:
+            raise ValueError(f"scale must be positive, not {self.scale}")
+        # Probability mass within the range.
+        self.mass = -math.expm1(-(high - low) / self.scale)
+
+    def ppf(self, u: float) -> float:
+        return min(self.low - self.scale * math.log1p(-u * self.mass), self.high)
+
+    def ppf_array(self, u: numpy.ndarray) -> numpy.ndarray:
+        return numpy.minimum(self.low - self.scale * numpy.log1p(-u * self.mass), self.high)
+
+    def cdf_array(self, x: numpy.ndarray) -> numpy.ndarray:
+        below = -numpy.expm1(-(numpy.clip(x, self.low, self.high) - self.low) / self.scale)
+        return numpy.minimum(below / self.mass, 1.0)
+
+
+class Zipf(Distribution):
+    """
+    A bounded power-law with exponent ``s``, the continuous analog of Zipf's law.
+    The density is proportional to :math:`r^{-s}` where :math:`r = x - low + 1` is the rank.
+
+    The low end of the range is the most common value.
+    For integer values, the floor of each value has approximately a Zipf distribution.
+    """
+
+    parameters = ("s",)
+
+    def __init__(self, low: float, high: float, s: float = 1.0) -> None:
+        super().__init__(low, high)
+        if s <= 0:
+            raise ValueError(f"s must be positive, not {s}")
+        self.s = s
+        self.rank_max = high - low + 1
+
+    def _rank(self, u: Any) -> Any:
+        if self.s == 1:
+            return self.rank_max**u
+        exponent = 1 - self.s
+        return (1 + u * (self.rank_max**exponent - 1)) ** (1 / exponent)
+
+    def ppf(self, u: float) -> float:
+        return min(self.low + self._rank(u) - 1, self.high)
+
+    def ppf_array(self, u: numpy.ndarray) -> numpy.ndarray:
+        return numpy.minimum(self.low + self._rank(u) - 1, self.high)
+
+    def cdf_array(self, x: numpy.ndarray) -> numpy.ndarray:
+        rank = numpy.clip(x - self.low + 1, 1.0, self.rank_max)
+        if self.rank_max == 1:
+            return (x > self.low).astype(numpy.float64)
+        if self.s == 1:
+            return numpy.log(rank) / math.log(self.rank_max)
+        exponent = 1 - self.s
+        return (rank**exponent - 1) / (self.rank_max**exponent - 1)
+
+
+class HotSet(Distribution):
+    """
+    A uniform distribution with a hot set: the first ``fraction`` of the range has ``weight`` of the values.
+    The defaults are the 80/20 rule: 20% of the range has 80% of the values.
+    The rest of the range is uniform, also.
+    """
+
+    parameters = ("fraction", "weight")
+
+    def __init__(self, low: float, high: float, fraction: float = 0.2, weight: float = 0.8) -> None:
+        super().__init__(low, high)
+        if not 0 < fraction < 1:
+            raise ValueError(f"fraction must be between 0 and 1, not {fraction}")
+        if not 0 < weight < 1:
+            raise ValueError(f"weight must be between 0 and 1, not {weight}")
+        self.fraction = fraction
+        self.weight = weight
+        self.split = low + fraction * (high - low)
+
+    def ppf(self, u: float) -> float:
+        if u < self.weight:
+            return self.low + u / self.weight * (self.split - self.low)
+        return self.split + (u - self.weight) / (1 - self.weight) * (self.high - self.split)
+
+    def ppf_array(self, u: numpy.ndarray) -> numpy.ndarray:
+        hot = self.low + u / self.weight * (self.split - self.low)
+        cold = self.split + (u - self.weight) / (1 - self.weight) * (self.high - self.split)
+        return numpy.where(u < self.weight, hot, cold)
+
+    def cdf_array(self, x: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.clip(x, self.low, self.high)
+        if self.high == self.low:
+            return (x > self.low).astype(numpy.float64)
+        hot = self.weight * (x - self.low) / (self.split - self.low)
+        cold = self.weight + (1 - self.weight) * (x - self.split) / (self.high - self.split)
+        return numpy.where(x < self.split, hot, cold)
+
+
+DISTRIBUTIONS: dict[str, type[Distribution]] = {
+    "uniform": Uniform,
+    "normal": Normal,
+    "lognormal": LogNormal,
+    "exponential": Exponential,
+    "zipf": Zipf,
+    "hot-set": HotSet,
+}
+
+
+def make_distribution(name: str, low: float, high: float, **parameters: Any) -> Distribution:
+    """
+    Creates a named distribution truncated to [``low``, ``high``].
+    Parameters not used by the named distribution are ignored.
+
+    :raises KeyError: if the distribution name is unknown.
+    """
+    dist_class = DISTRIBUTIONS[name]
+    used = {k: v for k, v in parameters.items() if k in dist_class.parameters}
+    return dist_class(low, high, **used)
+
+
+def weighted_sample(rng: numpy.random.Generator, weights: numpy.ndarray, n: int) -> numpy.ndarray:
+    """
+    Draws ``n`` distinct indices of the ``weights`` without replacement, each in proportion to its weight.
+    Each index gets a key, the log of its weight plus Gumbel noise; the ``n`` largest keys win.
+    The cost is one pass over the weights: there's no retry loop.
+    Indices with zero weight are chosen last, in random order.
+
+    :raises ValueError: if ``n`` exceeds the number of weights.
+    """
+    if n > len(weights):
+        raise ValueError(f"{n} values exceeds {len(weights)} choices")
+    noise = rng.gumbel(size=len(weights))
+    with numpy.errstate(divide="ignore"):
+        keys = numpy.log(weights) + noise
+    # The last key is the primary key; ties at -inf are ordered by the noise.
+    return numpy.lexsort((noise, keys))[::-1][:n]
+
+
+class AliasTable:
+    """
+    Weighted choices of the indices ``0`` to ``len(weights) - 1`` by Walker's alias method.
+
+    A uniform value, :math:`u`, picks a column, :math:`i = \\lfloor un \\rfloor`.
+    The fraction, :math:`un - i`, picks either index :math:`i` or the column's alias.
+    Vose's construction fills each column from one small and one large weight.
+    """
+
+    def __init__(self, weights: list[float]) -> None:
+        if not weights or min(weights) < 0 or sum(weights) <= 0:
+            raise ValueError(f"invalid weights {weights}")
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.probability = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            self.probability[s], self.alias[s] = scaled[s], g
+            scaled[g] -= 1 - scaled[s]
+            (small if scaled[g] < 1 else large).append(g)
+        # Any leftovers are 1, apart from rounding.
+        self.n = n
+        self.probability_array = numpy.array(self.probability)
+        self.alias_array = numpy.array(self.alias)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.probability}, {self.alias})"
+
+    def __len__(self) -> int:
+        return self.n
+
+    def sample(self, u: float) -> int:
+        """Maps a uniform random value in [0, 1) to an index."""
+        column, fraction = divmod(u * self.n, 1)
+        i = min(int(column), self.n - 1)
+        return i if fraction < self.probability[i] else self.alias[i]
+
+    def sample_array(self, u: numpy.ndarray) -> numpy.ndarray:
+        """Maps an array of uniform random values in [0, 1) to an array of indices."""
+        scaled = u * self.n
+        column = numpy.minimum(scaled.astype(numpy.intp), self.n - 1)
+        return numpy.where(
+            scaled - column < self.probability_array[column], column, self.alias_array[column]
+        )
@@ -0,0 +1,372 @@
+"""
+Pools of unique values for :py:class:`synthdata.base.Pooled` synthesizers.
+
+A pool is a read-only, indexable collection of distinct values.
+The :py:class:`synthdata.base.Pooled` behavior deals values from a pool,
+and a :py:class:`synthdata.base.SynthesizeReference` picks values from it.
+
+There are two kinds of pools:
+
+-   **Materialized**. The values are generated and stored.
+    A :py:class:`ListPool` stores Python objects.
+    An :py:class:`ArrayPool` or :py:class:`DatetimePool` stores numbers or timestamps in a NumPy array.
+    A :py:class:`StringPool` stores strings as a single buffer of UTF-8 bytes plus an array of offsets.
+
+-   **Lazy**. The values are computed from an index when they're needed.
+    A :py:class:`PermutationPool` is a keyed permutation over a range of integers.
+    It uses :math:`O(1)` memory no matter how many rows it has.
+
+Sharing
+=======
+
+A materialized pool can be shared with other processes.
+:py:meth:`Pool.share` writes the pool's buffers to ``.npy`` files, and returns a pool which memory-maps them.
+A shared pool pickles as its file paths; unpickling maps the same files, without copying the values.
+In a directory like ``/dev/shm``, the files are in shared memory.
+The :py:data:`SHARED_MEMORY_DIR` is ``/dev/shm`` where it exists; otherwise it's None, the default temporary directory.
+
+The same files are a persistent cache of pools.
+:py:func:`load_pool` memory-maps the files written by :py:meth:`Pool.share`, whatever the kind of pool.
+
+..  autodata:: SHARED_MEMORY_DIR
+
+..  autofunction:: load_pool
+
+Permutations
+============
+
+A :py:class:`FeistelPermutation` is a keyed bijection on the integers :math:`[0, n)`.
+It's a small Feistel network over the smallest even number of bits that can hold :math:`n - 1`.
+Results outside :math:`[0, n)` are encrypted again ("cycle walking") until they're in range.
+Since each step is a bijection, the result is a permutation of :math:`[0, n)`.
+
+This has two uses:
+
+-   A permutation of a range of keys is a pool of unique keys, in random order, that's never stored.
+
+-   A permutation of the indices of a pool is a reshuffled order for dealing the pool's values.
+
+..  autoclass:: FeistelPermutation
+    :members:
+    :special-members: __call__
+
+..  autoclass:: Pool
+    :members:
+
+..  autoclass:: ListPool
+
+..  autoclass:: ArrayPool
+
+..  autoclass:: DatetimePool
+
+..  autoclass:: StringPool
+
+..  autoclass:: PermutationPool
+"""
+
+import abc
+from collections.abc import Iterator, Sequence
+import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy
+
+SHARED_MEMORY_DIR = Path("/dev/shm") if Path("/dev/shm").is_dir() else None
+"""A directory for the files of shared pools."""
+
+MASK64 = (1 << 64) - 1
+GOLDEN64 = 0x9E3779B97F4A7C15
+
+
+def mix64(z: int) -> int:
+    """The SplitMix64 finalizer: a fast, well-distributed 64-bit hash."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+def mix64_array(z: numpy.ndarray) -> numpy.ndarray:
+    """Vectorized :py:func:`mix64` for an array of ``uint64`` values."""
+    z = (z ^ (z >> numpy.uint64(30))) * numpy.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> numpy.uint64(27))) * numpy.uint64(0x94D049BB133111EB)
+    return z ^ (z >> numpy.uint64(31))
+
+
+class FeistelPermutation:
+    """
+    A keyed permutation of the integers :math:`[0, size)`.
+
+    The scalar :py:meth:`__call__` and the vectorized :py:meth:`array` compute identical results.
+    """
+
+    max_size = 1 << 62
+
+    def __init__(self, size: int, seed: int, rounds: int = 4) -> None:
+        if not 0 < size <= self.max_size:
+            raise ValueError(f"size {size} not in range 1 to {self.max_size}")
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        self.half = (bits + 1) // 2
+        self.mask = (1 << self.half) - 1
+        self.keys = [mix64((seed + (r + 1) * GOLDEN64) & MASK64) for r in range(rounds)]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.size})"
+
+    def _encrypt(self, x: int) -> int:
+        left, right = x >> self.half, x & self.mask
+        for key in self.keys:
+            left, right = right, left ^ (mix64(right ^ key) & self.mask)
+        return (left << self.half) | right
+
+    def _encrypt_array(self, x: numpy.ndarray) -> numpy.ndarray:
+        half, mask = numpy.uint64(self.half), numpy.uint64(self.mask)
+        left, right = x >> half, x & mask
+        for key in self.keys:
+            left, right = right, left ^ (mix64_array(right ^ numpy.uint64(key)) & mask)
+        return (left << half) | right
+
+    def __call__(self, index: int) -> int:
+        """The position of ``index`` in the permutation."""
+        x = self._encrypt(index)
+        while x >= self.size:
+            x = self._encrypt(x)
+        return x
+
+    def array(self, indices: numpy.ndarray) -> numpy.ndarray:
+        """The positions of an array of ``indices`` in the permutation, as ``int64``."""
+        x = self._encrypt_array(numpy.asarray(indices, dtype=numpy.uint64))
+        outside = x >= self.size
+        while outside.any():
+            x[outside] = self._encrypt_array(x[outside])
+            outside = x >= self.size
+        return x.astype(numpy.int64)
+
+
+class Pool(abc.ABC):
+    """
+    A read-only, indexable collection of distinct values.
+    """
+
+    path: Path | None = None
+    """The files of a memory-mapped pool; None for a pool in memory."""
+
+    @abc.abstractmethod
+    def __len__(self) -> int:  # pragma: no cover
+        ...
+
+    @abc.abstractmethod
+    def __getitem__(self, index: int) -> Any:  # pragma: no cover
+        """The value at ``index``, as a Python object."""
+        ...
+
+    @abc.abstractmethod
+    def take(self, indices: numpy.ndarray) -> Sequence[Any] | numpy.ndarray:  # pragma: no cover
+        """A column of the values at an array of ``indices``."""
+        ...
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)})"
+
+    def share(self, path: Path) -> "Pool | None":
+        """
+        Writes the pool to files named with the ``path`` prefix,
+        and returns a pool which memory-maps the files.
+        None means this pool can't be shared, and must be built by each process.
+        """
+        return None
+
+
+class ListPool(Pool):
+    """
+    A materialized pool of arbitrary Python objects.
+    """
+
+    def __init__(self, values: list[Any]) -> None:
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.values[index]
+
+    def take(self, indices: numpy.ndarray) -> Sequence[Any] | numpy.ndarray:
+        values = self.values
+        return [values[i] for i in indices.tolist()]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values)
+
+
+class ArrayPool(Pool):
+    """
+    A materialized pool of numbers in a NumPy array.
+    A column of values is a NumPy array.
+    """
+
+    chunk = 65_536
+
+    def __init__(self, values: numpy.ndarray, path: Path | None = None) -> None:
+        self.values = values
+        self.path = path
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        if self.path is None:
+            return type(self), (self.values,)
+        return type(self).load, (self.path,)
+
+    def share(self, path: Path) -> "ArrayPool":
+        target = Path(f"{path}.npy")
+        numpy.save(target, self.values)
+        return type(self).load(target)
+
+    @classmethod
+    def load(cls, path: Path) -> "ArrayPool":
+        """Memory-maps a pool written by :py:meth:`share`."""
+        return cls(numpy.load(path, mmap_mode="r"), path)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.values[index].item()
+
+    def take(self, indices: numpy.ndarray) -> Sequence[Any] | numpy.ndarray:
+        return self.values[indices]
+
+    def __iter__(self) -> Iterator[Any]:
+        for start in range(0, len(self.values), self.chunk):
+            yield from self.values[start : start + self.chunk].tolist()
+
+
+class DatetimePool(ArrayPool):
+    """
+    A materialized pool of timestamps in a NumPy ``datetime64[us]`` array, implicitly UTC.
+    Individual values are UTC ``datetime.datetime`` objects.
+    """
+
+    def __getitem__(self, index: int) -> Any:
+        return self.values[index].item().replace(tzinfo=datetime.timezone.utc)
+
+    def __iter__(self) -> Iterator[Any]:
+        utc = datetime.timezone.utc
+        for value in super().__iter__():
+            yield value.replace(tzinfo=utc)
+
+
+class StringPool(Pool):
+    """
+    A materialized pool of strings.
+    The strings are encoded as UTF-8 and concatenated into a single ``uint8`` buffer.
+    An array of offsets locates each string; the string at index :math:`i`
+    is the bytes from ``offsets[i]`` to ``offsets[i+1]``.
+    """
+
+    def __init__(
+        self, data: numpy.ndarray, offsets: numpy.ndarray, path: Path | None = None
+    ) -> None:
+        self.data = data
+        self.offsets = offsets
+        self.path = path
+        self.view = memoryview(data)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        if self.path is None:
+            return type(self), (self.data, self.offsets)
+        return type(self).load, (self.path,)
+
+    def share(self, path: Path) -> "StringPool":
+        numpy.save(Path(f"{path}.data.npy"), self.data)
+        numpy.save(Path(f"{path}.offsets.npy"), self.offsets)
+        return type(self).load(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "StringPool":
+        """Memory-maps a pool written by :py:meth:`share`."""
+        return cls(
+            numpy.load(Path(f"{path}.data.npy"), mmap_mode="r"),
+            numpy.load(Path(f"{path}.offsets.npy"), mmap_mode="r"),
+            path,
+        )
+
+    @classmethod
+    def from_strings(cls, values: Sequence[str] | numpy.ndarray) -> "StringPool":
+        """Builds the buffer and offsets from a sequence -- or an array -- of strings."""
+        encoded = [str(v).encode("utf-8") for v in values]
+        data = numpy.frombuffer(b"".join(encoded), dtype=numpy.uint8)
+        # Smaller offsets for buffers under 2GB.
+        dtype = numpy.int32 if len(data) < 2**31 else numpy.int64
+        offsets = numpy.zeros(len(encoded) + 1, dtype=dtype)
+        numpy.cumsum(
+            numpy.fromiter(map(len, encoded), dtype=dtype, count=len(encoded)), out=offsets[1:]
+        )
+        return cls(data, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self)
+        return str(self.view[self.offsets[index] : self.offsets[index + 1]], "utf-8")
+
+    def take(self, indices: numpy.ndarray) -> Sequence[Any] | numpy.ndarray:
+        view = self.view
+        starts = self.offsets[indices].tolist()
+        ends = self.offsets[indices + 1].tolist()
+        return [str(view[start:end], "utf-8") for start, end in zip(starts, ends)]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.take(numpy.arange(len(self))))
+
+
+class PermutationPool(Pool):
+    """
+    A lazy pool of ``size`` distinct integers from the range :math:`[low, low + domain)`.
+    The value at index :math:`i` is :math:`low + p(i)`, where :math:`p` is a :py:class:`FeistelPermutation` of the range.
+    """
+
+    def __init__(self, low: int, domain: int, size: int, seed: int) -> None:
+        if size > domain:
+            raise ValueError(f"{size} values exceeds domain of {domain}")
+        self.low = low
+        self.size = size
+        self.permutation = FeistelPermutation(domain, seed)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> Any:
+        if not 0 <= index < self.size:
+            raise IndexError(f"pool index {index} out of range")
+        return self.low + self.permutation(index)
+
+    def take(self, indices: numpy.ndarray) -> numpy.ndarray:
+        return self.permutation.array(indices) + self.low
+
+    def __iter__(self) -> Iterator[Any]:
+        chunk = 65_536
+        for start in range(0, self.size, chunk):
+            yield from self.take(numpy.arange(start, min(start + chunk, self.size))).tolist()
+
+
+def load_pool(path: Path) -> Pool | None:
+    """
+    Memory-maps a pool written by :py:meth:`Pool.share` with the ``path`` prefix.
+    The files determine the kind of pool.
+    None means there are no files for the ``path``.
+    """
+    if Path(f"{path}.data.npy").exists() and Path(f"{path}.offsets.npy").exists():
+        return StringPool.load(path)
+    target = Path(f"{path}.npy")
+    if target.exists():
+        values = numpy.load(target, mmap_mode="r")
+        pool_class = DatetimePool if values.dtype.kind == "M" else ArrayPool
+        return pool_class(values, target)
+    return None
@@ -0,0 +1,71 @@
+"""
+Seeds and random streams for the synthesizers.
+
+Each :py:class:`synthdata.base.Synthesizer` has its own seed.
+A seed is derived from the schema's seed, the model name, and the field name by :py:func:`derive_seed`.
+Output doesn't depend on the global ``random`` module, or on the order in which models and fields are created.
+
+The values of a column are created in fixed-size blocks of :py:data:`BLOCK_SIZE` rows.
+Each block has its own stream, keyed by the synthesizer's seed and the block number.
+Row :math:`i` is in block :math:`\\lfloor i / B \\rfloor`;
+it can be created without creating any other block.
+This permits random access to the rows of a model, and splitting a model's rows among workers.
+
+Some choices are made for a single row, without creating a block.
+For these, :py:func:`uniform_at` and :py:func:`uniform_array` are counter-based:
+the value for a row is a hash of the seed and the row number.
+
+..  autodata:: BLOCK_SIZE
+
+..  autofunction:: derive_seed
+
+..  autofunction:: random_stream
+
+..  autofunction:: numpy_stream
+
+..  autofunction:: uniform_at
+
+..  autofunction:: uniform_array
+"""
+
+import hashlib
+import random
+from typing import Any
+
+import numpy
+
+from .pools import GOLDEN64, MASK64, mix64, mix64_array
+
+BLOCK_SIZE = 4096
+"""The number of rows in a block of a column."""
+
+
+def derive_seed(seed: int, *key: Any) -> int:
+    """
+    A 64-bit seed derived from a parent seed and a key.
+    The key is a sequence of names and numbers, for example, a model name and a field name.
+    """
+    text = "\x1f".join(map(str, (seed,) + key))
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest())
+
+
+def random_stream(seed: int, *key: Any) -> random.Random:
+    """A ``random.Random`` generator for the stream identified by a seed and a key."""
+    return random.Random(derive_seed(seed, *key))
+
+
+def numpy_stream(seed: int, *key: Any) -> numpy.random.Generator:
+    """A NumPy ``Generator`` for the stream identified by a seed and a key."""
+    return numpy.random.default_rng(derive_seed(seed, *key))
+
+
+def uniform_at(seed: int, index: int) -> float:
+    """A uniform value in [0, 1) for an index, computed from the seed and the index alone."""
+    return (mix64((seed + index * GOLDEN64) & MASK64) >> 11) / 2**53
+
+
+def uniform_array(seed: int, start: int, stop: int) -> numpy.ndarray:
+    """Vectorized :py:func:`uniform_at` for the indices from ``start`` to ``stop``."""
+    indices = numpy.arange(start, stop, dtype=numpy.uint64)
+    z = mix64_array(numpy.uint64(seed & MASK64) + indices * numpy.uint64(GOLDEN64))
+    return (z >> numpy.uint64(11)).astype(numpy.float64) / 2**53
@@ -2,19 +2,29 @@
 Synthesizer Definitions.
 """
 
+from collections.abc import Sequence
 import datetime
+import enum
 from datetime import timezone
-from functools import partial
-from operator import attrgetter
+import math
 import random
+from operator import attrgetter
 import string
 from types import UnionType, NoneType
-from typing import Any, cast, _UnionGenericAlias  # type: ignore [attr-defined]
+from typing import Any, cast, get_args, get_origin, Literal, _UnionGenericAlias  # type: ignore [attr-defined]
 
+import numpy
 from pydantic.fields import FieldInfo
 from annotated_types import MaxLen, MinLen, Ge, Le
 
-from .base import Synthesizer, NoiseGen
+from .base import Synthesizer, NoiseGen, Column
+from .distributions import AliasTable, Distribution, make_distribution, weighted_sample
+from .pools import Pool, ArrayPool, DatetimePool, StringPool, PermutationPool, FeistelPermutation
+from .streams import derive_seed
+
+# Translation tables for the case of ASCII codes.
+ASCII_LOWER = numpy.frombuffer(bytes(range(256)).lower(), dtype=numpy.uint8)
+ASCII_UPPER = numpy.frombuffer(bytes(range(256)).upper(), dtype=numpy.uint8)
 
 
 class SynthesizeNone(Synthesizer):
@@ -27,11 +37,17 @@ class SynthesizeNone(Synthesizer):
         return field_type is None or issubclass(field_type, NoneType)
 
     def initialize(self):
-        self.noise_synth = [lambda x: f"Noise-{x}"]
+        self.noise_synth = [lambda x, rng: f"Noise-{x}"]
 
     def value_gen(self, sequence: int | None = None) -> Any:
         return None
 
+    def value_batch(self, n: int, sequence: int | None = None) -> Column:
+        return [None] * n
+
+    def domain_size(self) -> int | None:
+        return 1
+
 
 class SynthesizeString(Synthesizer):
     """
@@ -41,6 +57,10 @@ class SynthesizeString(Synthesizer):
 
     -   ``min_length`` (default 1)
     -   ``max_length`` (default 32)
+
+    The :py:meth:`value_batch` method draws all of the characters for a batch of strings
+    as a single NumPy array of ASCII codes, decodes the array once, and slices it into strings.
+    A ``domain`` with non-ASCII characters uses the synthesizer's ``rng`` for each string.
     """
 
     domain = sorted(
@@ -55,24 +75,110 @@ class SynthesizeString(Synthesizer):
         if self.min_length is None:
             self.min_length = self.min_default
         if self.min_length > 0:
-            self.noise_synth.append(lambda x: "")
+            self.noise_synth.append(lambda x, rng: "")
         if self.max_length is None:
             self.max_length = self.max_default
             # No point in trying to create a string too long... no max length provided.
         else:
-            too_long = lambda x: self._value(self.max_length + random.randint(4, 12), x)
+            too_long = lambda x, rng: self._value(self.max_length + rng.randint(4, 12), x, rng)
             self.noise_synth.append(too_long)
-
-    def _value(self, size: int, sequence: int | None = None) -> str:
-        return "".join([random.choice(self.domain) for _ in range(size)])
+        try:
+            domain = "".join(self.domain).encode("ascii")
+            self.domain_codes: numpy.ndarray | None = numpy.frombuffer(domain, dtype=numpy.uint8)
+        except UnicodeEncodeError:
+            self.domain_codes = None
+
+    def _value(
+        self, size: int, sequence: int | None = None, rng: random.Random | None = None
+    ) -> str:
+        choice = (self.rng if rng is None else rng).choice
+        return "".join([choice(self.domain) for _ in range(size)])
 
     def value_gen(self, sequence: int | None = None) -> Any:
         """
         Low-level value synthesis.
         """
-        size = random.randint(self.min_length, self.max_length)
+        size = self.rng.randint(self.min_length, self.max_length)
         return self._value(size, sequence)
 
+    def code_batch(
+        self, rng: numpy.random.Generator, n: int
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Draws the lengths of ``n`` strings, and the ASCII codes for all of their characters.
+        """
+        domain_codes = cast(numpy.ndarray, self.domain_codes)
+        lengths = rng.integers(self.min_length, self.max_length, size=n, endpoint=True)
+        picks = rng.integers(0, len(domain_codes), size=int(lengths.sum()), dtype=numpy.uint8)
+        return lengths, domain_codes[picks]
+
+    @staticmethod
+    def decode_batch(lengths: numpy.ndarray, codes: numpy.ndarray) -> list[str]:
+        """
+        Decodes all of the ASCII codes in one pass, then slices the text into strings.
+        """
+        text = codes.tobytes().decode("ascii")
+        ends = numpy.cumsum(lengths).tolist()
+        return [text[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+    def value_batch(self, n: int, sequence: int | None = None) -> Column:
+        """
+        Low-level synthesis of a column of strings.
+        """
+        if self.domain_codes is None:
+            choices, randint, domain = self.rng.choices, self.rng.randint, self.domain
+            return [
+                "".join(choices(domain, k=randint(self.min_length, self.max_length)))
+                for _ in range(n)
+            ]
+        lengths, codes = self.code_batch(self.numpy_rng(), n)
+        return self.decode_batch(lengths, codes)
+
+    def make_pool(self, column: Column) -> Pool:
+        """Strings are stored as a single buffer of UTF-8 bytes and an array of offsets."""
+        return StringPool.from_strings(column)
+
+    def unique_domain(self) -> Sequence[str] | None:
+        """
+        The characters which lead to distinct strings.
+        None means the number of distinct strings can't be computed.
+        """
+        return self.domain
+
+    def domain_size(self) -> int | None:
+        """The number of distinct strings with lengths from ``min_length`` to ``max_length``."""
+        domain = self.unique_domain()
+        if domain is None:
+            return None
+        return sum(len(domain) ** size for size in range(self.min_length, self.max_length + 1))
+
+    def string_at(self, index: int) -> str:
+        """
+        Decodes an index into the enumeration of all distinct strings,
+        shortest strings first, with the ``domain`` characters as digits.
+        """
+        domain = cast(Sequence[str], self.unique_domain())
+        size = self.min_length
+        while index >= (count := len(domain) ** size):
+            index -= count
+            size += 1
+        chars = []
+        for _ in range(size):
+            index, digit = divmod(index, len(domain))
+            chars.append(domain[digit])
+        return "".join(chars)
+
+    def sample_unique(self, n: int) -> Column | None:
+        """
+        When the ``n`` values are a large fraction of the domain,
+        removing duplicates would be slow.
+        Instead, draw distinct indices into the enumeration of all strings.
+        """
+        domain_size = self.domain_size()
+        if domain_size is None or domain_size > 4 * n:
+            return None
+        return [self.string_at(index) for index in self.rng.sample(range(domain_size), n)]
+
     @classmethod
     def match(cls, field_type: type, json_schema_extra: dict[str, Any]) -> bool:
         """Generic ``Annotated[str, ...]``."""
@@ -98,6 +204,11 @@ class SynthesizeName(SynthesizeString):
     min_default = 3
     max_default = 12
 
+    def initialize(self) -> None:
+        super().initialize()
+        # With only letters, Title Case is an upper-case first letter and lower-case for the rest.
+        self.letters_only = self.domain_codes is not None and "".join(self.domain).isalpha()
+
     def value_gen(self, sequence: int | None = None) -> Any:
         """
         Low-level value synthesis.
@@ -105,6 +216,28 @@ class SynthesizeName(SynthesizeString):
         """
         return super().value_gen(sequence).title()
 
+    def value_batch(self, n: int, sequence: int | None = None) -> Column:
+        """
+        Low-level synthesis of a column of names in Title Case.
+        The case is changed in bulk on the array of ASCII codes, before decoding.
+        """
+        if not self.letters_only:
+            return [v.title() for v in super().value_batch(n, sequence)]
+        lengths, codes = self.code_batch(self.numpy_rng(), n)
+        codes = ASCII_LOWER[codes]
+        firsts = (numpy.cumsum(lengths) - lengths)[lengths > 0]
+        codes[firsts] = ASCII_UPPER[codes[firsts]]
+        return self.decode_batch(lengths, codes)
+
+    def unique_domain(self) -> Sequence[str] | None:
+        """Title Case makes upper- and lower-case letters equivalent."""
+        if not self.letters_only:
+            return None
+        return sorted(set("".join(self.domain).lower()))
+
+    def string_at(self, index: int) -> str:
+        return super().string_at(index).title()
+
     @classmethod
     def match(cls, field_type: type, json_schema_extra: dict[str, Any]) -> bool:
         """Requires ``Annotated[str, ...]`` and ``json_schema_extra`` with ``{"domain": "name"}``"""
@@ -127,51 +260,188 @@ class SynthesizeNumber(Synthesizer):
 
     Uses ``json_schema_extra`` values
 
-    -    ``"distribution"`` -- can be ``"normal"`` or ``"uniform"``.
+    -    ``"distribution"`` -- can be ``"uniform"``, ``"normal"``, ``"lognormal"``, ``"exponential"``, or ``"zipf"``.
+
+    -    ``"mu"``, ``"sigma"``, ``"scale"``, ``"s"`` -- optional parameters of the distribution.
+         See :py:mod:`synthdata.distributions`.
+
+    The distribution is truncated to the ``ge`` and ``le`` bounds.
+    Values are created by inverse transform sampling, with a fixed cost per value.
+
+    The :py:meth:`value_batch` method uses a NumPy ``Generator`` to draw whole blocks of values.
+    Subclasses provide the NumPy array of results.
     """
 
     default_distribution = "uniform"
 
+    weighted_domain = 2**20
+    """The largest domain for which :py:meth:`sample_weighted` computes the probability of every value."""
+
     def initialize(self) -> None:
+        self.initialize_bounds()
+        self.dist_name = self.json_schema_extra.get("distribution", self.default_distribution)
+        self.distribution = self.make_distribution()
+
+    def initialize_bounds(self) -> None:
+        """Sets ``min_value`` and ``max_value`` from the ``ge`` and ``le`` bounds."""
         self.min_value = self.get_meta(Ge, attrgetter("ge"))
         self.max_value = self.get_meta(Le, attrgetter("le"))
         if self.min_value is None:
             self.min_value = 0
         if self.max_value is None:
             self.max_value = 2**32 - 1
-        self.dist_name = self.json_schema_extra.get("distribution", self.default_distribution)
+
+    def array_bounds(self) -> tuple[Any, Any]:
+        """The ``ge`` and ``le`` bounds as numbers, used to bound blocks of values."""
+        return self.min_value, self.max_value
+
+    def distribution_parameters(self) -> dict[str, Any]:
+        """The parameters for the distribution, from the ``json_schema_extra``."""
+        return self.json_schema_extra
+
+    def make_distribution(self) -> Distribution:
+        """Creates the named distribution, truncated to the bounds."""
+        low, high = self.array_bounds()
+        return make_distribution(self.dist_name, low, high, **self.distribution_parameters())
+
+    def array_gen(self, rng: numpy.random.Generator, n: int) -> numpy.ndarray:
+        """Draws a block of ``n`` values from the distribution."""
+        return self.distribution.ppf_array(rng.random(n))
+
+    def array_values(self, values: numpy.ndarray) -> numpy.ndarray:
+        """Converts a block of bounded values to the resulting array type."""
+        return values
+
+    def value_batch(self, n: int, sequence: int | None = None) -> Column:
+        """
+        Creates a NumPy array of ``n`` values in range with the given distribution.
+        """
+        return self.array_values(self.array_gen(self.numpy_rng(), n))
+
+    def make_pool(self, column: Column) -> Pool:
+        """A NumPy array is kept as the pool's buffer."""
+        if isinstance(column, numpy.ndarray):
+            return ArrayPool(column)
+        return super().make_pool(column)
+
+    def weighted_unique(self, low: int, domain_size: int, unit: float, n: int) -> numpy.ndarray:
+        """
+        Draws ``n`` distinct integers from ``low`` up to ``low + domain_size``, without replacement.
+        Integer :math:`k` stands for the values of the distribution from :math:`k \\cdot unit` up to :math:`(k + 1) \\cdot unit`;
+        its probability comes from :py:meth:`synthdata.distributions.Distribution.cdf_array`.
+        See :py:func:`synthdata.distributions.weighted_sample`.
+        """
+        edges = (low + numpy.arange(domain_size + 1, dtype=numpy.float64)) * unit
+        cdf = self.distribution.cdf_array(edges)
+        cdf[0], cdf[-1] = 0.0, 1.0
+        weights = numpy.maximum(numpy.diff(cdf), 0.0)
+        return weighted_sample(self.numpy_rng(), weights, n).astype(numpy.int64) + low
 
 
 class SynthesizeInteger(SynthesizeNumber):
-    """Extends :py:class:`synthdata.synths.SynthesizeNumber` to offer only integer values."""
+    """
+    Extends :py:class:`synthdata.synths.SynthesizeNumber` to offer only integer values.
+
+    Uniform values are exact.
+    Other distributions are sampled over [``ge``, ``le`` + 1) and the floor is taken.
+
+    A pool of uniform integers is a lazy :py:class:`synthdata.pools.PermutationPool`.
+    Use ``{"pool": "materialized"}`` in the ``json_schema_extra`` to generate and store the values.
+    """
 
     min_value: int
     max_value: int
 
     def initialize(self) -> None:
         super().initialize()
-        self.gen = {
-            "uniform": partial(random.randint, self.min_value, self.max_value),
-            "normal": partial(
-                random.normalvariate,
-                mu=(self.max_value + self.min_value) / 2,
-                sigma=(self.max_value - self.min_value) / 6,
-            ),
-        }[self.dist_name]
         self.noise_synth.extend(
             [
-                lambda x: self.min_value - random.randint(4, 12),
-                lambda x: self.max_value + random.randint(4, 12),
-                lambda x: f"XXX{x}XXX",
+                lambda x, rng: self.min_value - rng.randint(4, 12),
+                lambda x, rng: self.max_value + rng.randint(4, 12),
+                lambda x, rng: f"XXX{x}XXX",
             ]
         )
 
+    def make_distribution(self) -> Distribution:
+        return make_distribution(
+            self.dist_name, self.min_value, self.max_value + 1, **self.distribution_parameters()
+        )
+
     def value_gen(self, sequence: int | None = None) -> Any:
         """Creates integer in range with given distribution."""
-        v = int(self.gen())
-        while v < self.min_value or v > self.max_value:
-            v = int(self.gen())
-        return v
+        if self.dist_name == "uniform":
+            return self.rng.randint(self.min_value, self.max_value)
+        return min(math.floor(self.distribution.ppf(self.rng.random())), self.max_value)
+
+    def array_gen(self, rng: numpy.random.Generator, n: int) -> numpy.ndarray:
+        """Draws a block of ``n`` integers from the distribution."""
+        if self.dist_name == "uniform":
+            return rng.integers(self.min_value, self.max_value, size=n, endpoint=True)
+        return numpy.minimum(numpy.floor(super().array_gen(rng, n)), self.max_value)
+
+    def array_values(self, values: numpy.ndarray) -> numpy.ndarray:
+        return values.astype(numpy.int64)
+
+    def value_batch(self, n: int, sequence: int | None = None) -> Column:
+        """
+        Creates an ``int64`` array of integers in range with given distribution.
+        A range beyond ``int64`` creates a list of Python ``int`` values.
+        """
+        int64 = numpy.iinfo(numpy.int64)
+        if self.min_value < int64.min or self.max_value > int64.max:
+            value_gen = self.value_gen
+            return [value_gen() for _ in range(n)]
+        return super().value_batch(n, sequence)
+
+    def domain_size(self) -> int | None:
+        return self.max_value - self.min_value + 1
+
+    def lazy_pool(self, rows: int) -> Pool | None:
+        """
+        Uniform integers in the ``int64`` range use a permutation of the range as the pool.
+        """
+        int64 = numpy.iinfo(numpy.int64)
+        if (
+            self.dist_name != "uniform"
+            or self.json_schema_extra.get("pool", "lazy") != "lazy"
+            or self.min_value < int64.min
+            or self.max_value > int64.max
+        ):
+            return None
+        domain_size = cast(int, self.domain_size())
+        if domain_size > FeistelPermutation.max_size:
+            return None
+        return PermutationPool(self.min_value, domain_size, rows, derive_seed(self.seed, "pool"))
+
+    def sample_unique(self, n: int) -> Column | None:
+        """
+        Integers are drawn from the range without replacement,
+        when the ``n`` values are a large fraction of the range.
+        Other distributions are weighted by :py:meth:`sample_weighted`.
+        """
+        int64 = numpy.iinfo(numpy.int64)
+        if self.min_value < int64.min or self.max_value >= int64.max:
+            return None
+        domain_size = cast(int, self.domain_size())
+        if domain_size > 4 * n:
+            return None
+        if self.dist_name != "uniform":
+            return self.sample_weighted(n)
+        sample = self.numpy_rng().choice(domain_size, size=n, replace=False)
+        return sample.astype(numpy.int64) + self.min_value
+
+    def sample_weighted(self, n: int) -> Column | None:
+        """
+        Integers in a range of up to :py:attr:`weighted_domain` values are drawn without replacement
+        by :py:meth:`weighted_unique`.
+        """
+        int64 = numpy.iinfo(numpy.int64)
+        if self.min_value < int64.min or self.max_value >= int64.max:
+            return None
+        domain_size = cast(int, self.domain_size())
+        if domain_size > self.weighted_domain:
+            return None
+        return self.weighted_unique(self.min_value, domain_size, 1.0, n)
 
     @classmethod
     def match(cls, field_type: type, json_schema_extra: dict[str, Any]) -> bool:
@@ -187,27 +457,19 @@ class SynthesizeFloat(SynthesizeNumber):
 
     def initialize(self) -> None:
         super().initialize()
-        self.gen = {
-            "uniform": lambda: random.random() * (self.max_value - self.min_value) + self.min_value,
-            "normal": partial(
-                random.normalvariate,
-                mu=(self.max_value + self.min_value) / 2,
-                sigma=(self.max_value - self.min_value) / 6,
-            ),
-        }[self.dist_name]
         self.noise_synth.extend(
             [
-                lambda x: self.min_value - random.random() * 8,
-                lambda x: self.max_value + random.random() * 8,
+                lambda x, rng: self.min_value - rng.random() * 8,
+                lambda x, rng: self.max_value + rng.random() * 8,
             ]
         )
 
     def value_gen(self, sequence: int | None = None) -> Any:
         """Creates float in range with given distribution."""
-        v = float(self.gen())
-        while v < self.min_value or v > self.max_value:
-            v = float(self.gen())
-        return v
+        return self.distribution.ppf(self.rng.random())
+
+    def array_values(self, values: numpy.ndarray) -> numpy.ndarray:
+        return values.astype(numpy.float64)
 
     @classmethod
     def match(cls, field_type: type, json_schema_extra: dict[str, Any]) -> bool:
@@ -220,10 +482,26 @@ class SynthesizeDate(SynthesizeNumber):
     Extends :py:class:`synthdata.synths.SynthesizeNumber` to offer only datetime.datetime values.
 
     Default range is 1970-Jan-1 to 2099-Dec-31.
+
+    The distribution is computed over POSIX timestamps.
+    A ``"mu"`` parameter can be a ``datetime.datetime``.
+    The ``"sigma"`` and ``"scale"`` parameters can be ``datetime.timedelta`` values.
     """
 
     def initialize(self) -> None:
         super().initialize()
+        self.noise_synth.extend(
+            [
+                lambda x, rng: datetime.datetime.fromtimestamp(
+                    self.min_date - rng.random() * 90, tz=timezone.utc
+                ),
+                lambda x, rng: datetime.datetime.fromtimestamp(
+                    self.max_date + rng.random() * 90, tz=timezone.utc
+                ),
+            ]
+        )
+
+    def initialize_bounds(self) -> None:
         self.min_value = self.get_meta(Ge, attrgetter("ge"))
         self.max_value = self.get_meta(Le, attrgetter("le"))
         if self.min_value is None:
@@ -238,35 +516,184 @@ class SynthesizeDate(SynthesizeNumber):
             if self.max_value.tzinfo is None:
                 # Ugh. It was local time!
                 self.max_value = self.max_value.astimezone(datetime.timezone.utc)
-        self.dist_name = self.json_schema_extra.get("distribution", self.default_distribution)
 
         self.min_date = self.min_value.timestamp()
         self.max_date = self.max_value.timestamp()
-        self.gen = {
-            "uniform": lambda: random.random() * (self.max_date - self.min_date) + self.min_date,
-            "normal": partial(
-                random.normalvariate,
-                mu=(self.max_date + self.min_date) / 2,
-                sigma=(self.max_date - self.min_date) / 6,
-            ),
-        }[self.dist_name]
-        self.noise_synth.extend(
-            [
-                lambda x: datetime.datetime.fromtimestamp(
-                    self.min_date - random.random() * 90, tz=timezone.utc
-                ),
-                lambda x: datetime.datetime.fromtimestamp(
-                    self.max_date + random.random() * 90, tz=timezone.utc
-                ),
-            ]
-        )
+
+    def array_bounds(self) -> tuple[Any, Any]:
+        """The ``ge`` and ``le`` bounds as POSIX timestamps."""
+        return self.min_date, self.max_date
+
+    def distribution_parameters(self) -> dict[str, Any]:
+        """Converts ``datetime`` and ``timedelta`` parameters to seconds."""
+        parameters = dict(self.json_schema_extra)
+        for name, value in parameters.items():
+            match value:
+                case datetime.datetime():
+                    parameters[name] = value.timestamp()
+                case datetime.timedelta():
+                    parameters[name] = value.total_seconds()
+        return parameters
 
     def value_gen(self, sequence: int | None = None) -> Any:
         """Creates date in range with given distribution."""
-        dt = self.gen()
+        dt = self.distribution.ppf(self.rng.random())
         return datetime.datetime.fromtimestamp(dt, tz=timezone.utc)
 
+    def array_values(self, values: numpy.ndarray) -> numpy.ndarray:
+        """Converts POSIX timestamps to a ``datetime64[us]`` array, implicitly UTC."""
+        return (values * 1_000_000).astype(numpy.int64).astype("datetime64[us]")
+
+    def to_values(self, column: Column) -> list[Any]:
+        """Converts a ``datetime64[us]`` array to UTC ``datetime.datetime`` values."""
+        if isinstance(column, numpy.ndarray):
+            return [dt.replace(tzinfo=timezone.utc) for dt in column.astype(object)]
+        return list(column)
+
+    def make_pool(self, column: Column) -> Pool:
+        """A ``datetime64[us]`` array is kept as the pool's buffer."""
+        if isinstance(column, numpy.ndarray):
+            return DatetimePool(column)
+        return super().make_pool(column)
+
+    def domain_size(self) -> int | None:
+        """The number of distinct microseconds in the range."""
+        return round(self.max_date * 1_000_000) - round(self.min_date * 1_000_000) + 1
+
+    def sample_unique(self, n: int) -> Column | None:
+        """
+        Dates are drawn from the range of microseconds without replacement,
+        when the ``n`` values are a large fraction of the range.
+        Other distributions are weighted by :py:meth:`sample_weighted`.
+        """
+        domain_size = cast(int, self.domain_size())
+        if domain_size > 4 * n:
+            return None
+        if self.dist_name != "uniform":
+            return self.sample_weighted(n)
+        sample = self.numpy_rng().choice(domain_size, size=n, replace=False)
+        return (sample + round(self.min_date * 1_000_000)).astype("datetime64[us]")
+
+    def sample_weighted(self, n: int) -> Column | None:
+        """
+        Dates in a range of up to :py:attr:`weighted_domain` microseconds are drawn without replacement
+        by :py:meth:`weighted_unique`.
+        """
+        domain_size = cast(int, self.domain_size())
+        if domain_size > self.weighted_domain:
+            return None
+        low = round(self.min_date * 1_000_000)
+        return self.weighted_unique(low, domain_size, 1e-6, n).astype("datetime64[us]")
+
     @classmethod
     def match(cls, field_type: type, json_schema_extra: dict[str, Any]) -> bool:
         """Requires ``Annotated[datetime.datetime, ...]``"""
         return issubclass(field_type, datetime.datetime)
+
+
+class SynthesizeCategorical(Synthesizer):
+    """
+    Synthesizes values from a small, fixed set of categories:
+    the members of an ``Enum``, the values of a ``Literal[...]``, or ``False`` and ``True`` for a ``bool``.
+
+    The ``json_schema_extra`` can provide the relative frequencies of the categories.
+    For example, ``{"frequencies": {"RED": 5, "GREEN": 3, "BLUE": 2}}``.
+    A category is identified by its value, the ``str()`` of its value, or -- for an ``Enum`` -- the member's name.
+    A ``bool`` can also use ``"true"`` and ``"false"``.
+    Categories left out of the frequencies never occur, and don't count toward the :py:meth:`domain_size`.
+    Without frequencies, the categories are equally likely.
+
+    Categories are chosen by a :py:class:`synthdata.distributions.AliasTable`.
+    A batch is a NumPy array of compact integer codes, from :py:meth:`code_batch`,
+    decoded with the ``lookup`` array of categories.
+    """
+
+    def initialize(self) -> None:
+        self.categories: list[Any] = self.category_values(self.category_type())
+        frequencies = self.json_schema_extra.get("frequencies")
+        weights: list[float]
+        if frequencies is None:
+            weights = [1.0] * len(self.categories)
+        else:
+            names = [self.category_names(category) for category in self.categories]
+            unknown = set(frequencies) - set().union(*names)
+            if unknown:
+                raise ValueError(f"unknown categories {sorted(map(str, unknown))}")
+            weights = [
+                float(next((frequencies[name] for name in n if name in frequencies), 0))
+                for n in names
+            ]
+        self.weights = weights
+        self.alias = AliasTable(weights)
+        self.code_dtype = numpy.min_scalar_type(len(self.categories) - 1)
+        if all(isinstance(category, bool) for category in self.categories):
+            self.lookup = numpy.array(self.categories)
+        else:
+            self.lookup = numpy.empty(len(self.categories), dtype=object)
+            for code, category in enumerate(self.categories):
+                self.lookup[code] = category
+        self.noise_synth.append(lambda x, rng: f"XXX{x}XXX")
+
+    def category_type(self) -> Any:
+        """The ``Enum``, ``Literal``, or ``bool`` annotation; for a union, the first alternative which matches."""
+        annotation = self.field.annotation
+        if isinstance(annotation, (_UnionGenericAlias, UnionType)):
+            return next(
+                alt for alt in get_args(annotation) if self.match(alt, self.json_schema_extra)
+            )
+        return annotation
+
+    @staticmethod
+    def category_values(annotation: Any) -> list[Any]:
+        """The categories of an ``Enum``, ``Literal``, or ``bool`` annotation, in order."""
+        if get_origin(annotation) is Literal:
+            return list(get_args(annotation))
+        if issubclass(annotation, bool):
+            return [False, True]
+        return list(annotation)
+
+    @staticmethod
+    def category_names(category: Any) -> set[Any]:
+        """The keys which can identify a category in the ``"frequencies"``."""
+        names = {category, str(category)}
+        if isinstance(category, enum.Enum):
+            names |= {category.name, category.value, str(category.value)}
+        if isinstance(category, bool):
+            names.add(str(category).lower())
+        return names
+
+    def value_gen(self, sequence: int | None = None) -> Any:
+        return self.categories[self.alias.sample(self.rng.random())]
+
+    def code_batch(self, n: int) -> numpy.ndarray:
+        """A batch of ``n`` compact integer codes, indices into the ``lookup`` array."""
+        return self.alias.sample_array(self.numpy_rng().random(n)).astype(self.code_dtype)
+
+    def decode(self, codes: numpy.ndarray) -> numpy.ndarray:
+        """The categories for an array of codes."""
+        return self.lookup[codes]
+
+    def value_batch(self, n: int, sequence: int | None = None) -> Column:
+        """A batch of codes, decoded: a ``bool`` array, or an ``object`` array of categories."""
+        return self.decode(self.code_batch(n))
+
+    def domain_size(self) -> int | None:
+        """The number of categories which can occur: those with a frequency above 0."""
+        return sum(1 for weight in self.weights if weight > 0)
+
+    def sample_unique(self, n: int) -> Column | None:
+        """
+        ``n`` distinct categories which can occur, drawn in proportion to their frequencies
+        by :py:func:`synthdata.distributions.weighted_sample`;
+        ``n`` is capped at the :py:meth:`domain_size`.
+        The categories aren't ordered; a pool isn't found by sorting and removing duplicates.
+        """
+        n = min(n, cast(int, self.domain_size()))
+        return self.decode(weighted_sample(self.numpy_rng(), numpy.array(self.weights), n))
+
+    @classmethod
+    def match(cls, field_type: Any, json_schema_extra: dict[str, Any]) -> bool:
+        """Requires ``Literal[...]``, or a subclass of ``Enum``, or ``bool``."""
+        if get_origin(field_type) is Literal:
+            return True
+        return isinstance(field_type, type) and issubclass(field_type, (enum.Enum, bool))
@@ -0,0 +1,615 @@
+"""
+Writers for the column-oriented batches of a :py:class:`synthdata.base.SchemaSynthesizer`.
+
+A batch is a ``dict[str, Column]``, with a column of values for each field.
+The writers format each column in bulk, and never create a ``BaseModel`` instance or a ``dict`` per row.
+Each batch is formatted into a single chunk of text, which is written with one call.
+
+-   Numbers are written as Python writes them: the shortest text which reads back as the same value.
+
+-   Timestamps are written in ISO 8601 format, with microseconds and a UTC offset,
+    for example, ``2021-01-18T09:30:00.000000+00:00``.
+    A ``datetime64[us]`` column is formatted by NumPy, in one call.
+
+-   None is an empty CSV field, or a JSON ``null``.
+
+-   An ``Enum`` member is written as its value.
+
+The :py:meth:`synthdata.base.SchemaSynthesizer.write_csv` and :py:meth:`synthdata.base.SchemaSynthesizer.write_jsonl`
+methods open a file and write all of the rows for a model.
+
+Arrow and Parquet
+=================
+
+A batch can also be an Apache Arrow ``RecordBatch``.
+The Arrow type of each column comes from the field's annotation:
+``int`` is ``int64``, ``float`` is ``float64``, ``datetime.datetime`` is a UTC ``timestamp[us]``,
+``bool`` is ``bool``, and ``str`` is ``string``.
+An optional field, ``type | None``, is a nullable column of the type.
+Other unions are ``float64`` if they're all numbers, otherwise ``string``.
+
+A NumPy column of numbers or timestamps is used as the Arrow buffer, without copying.
+Other columns are converted value by value.
+
+The :py:meth:`synthdata.base.SchemaSynthesizer.write_parquet` method streams the batches into a Parquet file,
+one row group per batch.
+
+..  important:: This requires the optional ``pyarrow`` package.
+
+SQLite
+======
+
+The :py:meth:`synthdata.base.SchemaSynthesizer.load_sqlite` method creates a table for each model and loads the rows.
+
+The DDL comes from the model's annotations and the ``"sql"`` metadata used by
+:py:meth:`synthdata.base.BaseModelSynthesizer.sql_rule`.
+``{"sql": {"key": "primary"}}`` is a ``PRIMARY KEY``.
+``{"sql": {"key": "foreign", "reference": "Model.field"}}`` is a ``REFERENCES`` clause.
+Foreign keys are ``DEFERRABLE INITIALLY DEFERRED``,
+so models which refer to each other can be loaded in the same transaction.
+
+The SQL type is ``INTEGER``, ``REAL``, or ``TEXT``.
+Timestamps are ISO 8601 ``TEXT``, which sorts in time order.
+
+Each table is loaded with ``executemany()``, one call per batch, in a single transaction.
+The :py:data:`SQLITE_PRAGMAS` trade durability for speed while the data is loaded:
+a failure part way through leaves a database that should be discarded.
+
+PostgreSQL COPY
+===============
+
+The :py:meth:`synthdata.base.SchemaSynthesizer.write_copy` method writes rows for ``COPY ... FROM STDIN``,
+to a file or a pipe, for example, ``python gen.py | psql -c 'COPY "Employee" FROM STDIN'``.
+The :py:func:`copy_statement` is the matching ``COPY`` statement.
+
+-   The text format has tab-separated columns.
+    None is ``\\N``.
+    Backslash, tab, newline, and carriage return are escaped with a backslash.
+    Timestamps are ISO 8601, with a UTC offset.
+
+-   The binary format has the PostgreSQL binary representation of each value.
+    This depends on the column types, which must match the :py:func:`postgres_type` of each field:
+    ``bigint``, ``double precision``, ``boolean``, ``timestamptz``, or ``text``.
+    A column of numbers or timestamps is encoded by NumPy, as a structured array of lengths and big-endian values.
+
+..  autodata:: BATCH_ROWS
+
+..  autodata:: BUFFER_SIZE
+
+..  autofunction:: iso_timestamps
+
+..  autofunction:: csv_column
+
+..  autofunction:: json_column
+
+..  autofunction:: write_csv
+
+..  autofunction:: write_jsonl
+
+..  autofunction:: arrow_type
+
+..  autofunction:: arrow_schema
+
+..  autofunction:: arrow_column
+
+..  autofunction:: record_batch
+
+..  autofunction:: write_parquet
+
+..  autodata:: SQLITE_PRAGMAS
+
+..  autofunction:: sql_type
+
+..  autofunction:: create_table
+
+..  autofunction:: load_table
+
+..  autofunction:: postgres_type
+
+..  autofunction:: copy_statement
+
+..  autofunction:: copy_column
+
+..  autofunction:: binary_column
+
+..  autofunction:: write_copy_text
+
+..  autofunction:: write_copy_binary
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+import csv
+import datetime
+import enum
+import io
+from itertools import chain, repeat
+import json
+from pathlib import Path
+import sqlite3
+from types import UnionType, NoneType
+import struct
+from typing import Any, BinaryIO, cast, TextIO, TYPE_CHECKING, _UnionGenericAlias  # type: ignore [attr-defined]
+
+import numpy
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import pyarrow
+
+BATCH_ROWS = 65_536
+"""The number of rows formatted and written at once."""
+
+BUFFER_SIZE = 1 << 20
+"""The size of the buffer for an output file."""
+
+SQLITE_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",
+}
+"""The pragmas set on a SQLite connection before loading rows."""
+
+
+def iso_timestamps(values: numpy.ndarray) -> list[str]:
+    """Formats a ``datetime64`` array, implicitly UTC, as ISO 8601 strings with a UTC offset."""
+    text = numpy.datetime_as_string(values.astype("datetime64[us]"), unit="us")
+    return [t + "+00:00" for t in text.tolist()]
+
+
+def iso_value(value: Any) -> Any:
+    """
+    A ``datetime.datetime`` as an ISO 8601 string, an ``Enum`` member as its value;
+    any other value is unchanged.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(timespec="microseconds")
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def csv_column(column: Sequence[Any] | numpy.ndarray) -> Sequence[Any]:
+    """
+    The values of a column for a ``csv.writer``.
+    Numbers and strings are unchanged, the writer formats them.
+    Timestamps are ISO 8601 strings.
+    """
+    if isinstance(column, numpy.ndarray):
+        if column.dtype.kind == "M":
+            return iso_timestamps(column)
+        if column.dtype.kind != "O":
+            return column.tolist()
+    return [iso_value(value) for value in column]
+
+
+def json_value(value: Any) -> str:
+    """The JSON text for a single value, of any type."""
+    return json.dumps(iso_value(value), ensure_ascii=False, default=str)
+
+
+# The JSON text for the most common types, by type. Other types use json_value.
+JSON_FORMATS: dict[type, Callable[[Any], str]] = {
+    str: json.encoder.encode_basestring,  # type: ignore [attr-defined]
+    int: int.__repr__,
+    type(None): lambda value: "null",
+}
+
+
+def json_column(column: Sequence[Any] | numpy.ndarray) -> list[str]:
+    """
+    The JSON text for each value in a column.
+    An array of numbers or timestamps is formatted in bulk.
+    """
+    if isinstance(column, numpy.ndarray):
+        match column.dtype.kind:
+            case "M":
+                return ['"' + text + '"' for text in iso_timestamps(column)]
+            case "i" | "u":
+                return list(map(int.__repr__, column.tolist()))
+            case "f" if numpy.isfinite(column).all():
+                return list(map(float.__repr__, column.tolist()))
+        column = column.tolist()
+    formats = JSON_FORMATS
+    return [formats.get(type(value), json_value)(value) for value in column]
+
+
+def write_csv(
+    target: TextIO,
+    fields: Sequence[str],
+    batches: Iterable[dict[str, Any]],
+    header: bool = True,
+) -> int:
+    """
+    Writes batches of rows to a CSV file opened with ``newline=""``.
+    The ``csv`` module's default dialect is used, the same as a ``csv.DictWriter``.
+
+    :param target: the file.
+    :param fields: the field names, in column order.
+    :param batches: the column-oriented batches.
+    :param header: write a first row with the field names.
+    :returns: the number of rows written, not counting the header.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(fields)
+    rows = 0
+    for batch in batches:
+        columns = [csv_column(batch[name]) for name in fields]
+        writer.writerows(zip(*columns))
+        rows += len(columns[0]) if columns else 0
+        target.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+    target.write(buffer.getvalue())
+    return rows
+
+
+def write_jsonl(
+    target: TextIO,
+    fields: Sequence[str],
+    batches: Iterable[dict[str, Any]],
+) -> int:
+    """
+    Writes batches of rows to a JSON Lines file: one JSON object per line.
+
+    Each line is built from a template with the field names already encoded.
+    The JSON text of the values is substituted into the template.
+
+    :param target: the file.
+    :param fields: the field names, in the order of the keys of each object.
+    :param batches: the column-oriented batches.
+    :returns: the number of rows written.
+    """
+    members = (json.dumps(name, ensure_ascii=False).replace("%", "%%") + ":%s" for name in fields)
+    template = "{" + ",".join(members) + "}\n"
+    rows = 0
+    for batch in batches:
+        columns = [json_column(batch[name]) for name in fields]
+        lines = [template % values for values in zip(*columns)]
+        rows += len(lines)
+        target.write("".join(lines))
+    return rows
+
+
+def arrow_type(annotation: Any) -> "pyarrow.DataType":
+    """
+    The Arrow type for a field's annotation.
+    Optional fields have the type of the non-None alternative.
+    """
+    import pyarrow
+
+    match annotation:
+        case _UnionGenericAlias() | UnionType() as union:
+            types = {arrow_type(alt) for alt in union.__args__ if alt is not NoneType}
+            if len(types) == 1:
+                return types.pop()
+            if types <= {pyarrow.int64(), pyarrow.float64()}:
+                return pyarrow.float64()
+            return pyarrow.string()
+        case type() if issubclass(annotation, bool):
+            return pyarrow.bool_()
+        case type() if issubclass(annotation, int):
+            return pyarrow.int64()
+        case type() if issubclass(annotation, float):
+            return pyarrow.float64()
+        case type() if issubclass(annotation, datetime.datetime):
+            return pyarrow.timestamp("us", tz="UTC")
+        case _:
+            return pyarrow.string()
+
+
+def arrow_schema(model_class: type[BaseModel]) -> "pyarrow.Schema":
+    """
+    The Arrow schema for a model, with a column for each field.
+    A field is nullable if ``None`` is one of the alternatives in its annotation.
+    """
+    import pyarrow
+
+    def nullable(annotation: Any) -> bool:
+        match annotation:
+            case _UnionGenericAlias() | UnionType() as union:
+                return NoneType in union.__args__
+            case _:
+                return annotation is None or annotation is NoneType
+
+    return pyarrow.schema(
+        [
+            pyarrow.field(name, arrow_type(field.annotation), nullable(field.annotation))
+            for name, field in model_class.model_fields.items()
+        ]
+    )
+
+
+def arrow_column(
+    column: Sequence[Any] | numpy.ndarray, type_: "pyarrow.DataType"
+) -> "pyarrow.Array":
+    """
+    An Arrow array of the given type for a column.
+    A NumPy array of numbers or timestamps with the same layout is used without copying.
+    """
+    import pyarrow
+
+    if isinstance(column, numpy.ndarray):
+        if column.dtype.kind in "iufM":
+            return pyarrow.array(column, type=type_)
+        column = column.tolist()
+    if pyarrow.types.is_string(type_):
+        column = [v if v is None or isinstance(v, str) else str(iso_value(v)) for v in column]
+    return pyarrow.array(column, type=type_)
+
+
+def record_batch(schema: "pyarrow.Schema", batch: dict[str, Any]) -> "pyarrow.RecordBatch":
+    """An Arrow ``RecordBatch`` with the columns of a batch, in the order of the schema's fields."""
+    import pyarrow
+
+    arrays = [arrow_column(batch[field.name], field.type) for field in schema]
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def write_parquet(
+    path: Path | str,
+    schema: "pyarrow.Schema",
+    batches: Iterable["pyarrow.RecordBatch"],
+    compression: str = "snappy",
+) -> int:
+    """
+    Streams Arrow record batches into a Parquet file.
+    Each batch is written as it arrives; the file is never in memory all at once.
+    Each batch is one row group.
+
+    :param path: the file.
+    :param schema: the schema of all of the batches.
+    :param batches: the record batches.
+    :param compression: the Parquet compression codec.
+    :returns: the number of rows written.
+    """
+    import pyarrow.parquet
+
+    rows = 0
+    with pyarrow.parquet.ParquetWriter(path, schema, compression=compression) as writer:
+        for batch in batches:
+            writer.write_batch(batch, row_group_size=max(batch.num_rows, 1))
+            rows += batch.num_rows
+    return rows
+
+
+def quote(name: str) -> str:
+    """A SQL identifier, in double quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sql_type(annotation: Any) -> str:
+    """
+    The SQLite type for a field's annotation.
+    Optional fields have the type of the non-None alternative.
+    """
+    match annotation:
+        case _UnionGenericAlias() | UnionType() as union:
+            types = {sql_type(alt) for alt in union.__args__ if alt is not NoneType}
+            if len(types) == 1:
+                return types.pop()
+            if types <= {"INTEGER", "REAL"}:
+                return "REAL"
+            return "TEXT"
+        case type() if issubclass(annotation, int):
+            return "INTEGER"
+        case type() if issubclass(annotation, float):
+            return "REAL"
+        case _:
+            return "TEXT"
+
+
+def create_table(model_class: type[BaseModel]) -> str:
+    """
+    The ``CREATE TABLE`` statement for a model, with a column for each field.
+    A field is ``NOT NULL`` unless ``None`` is one of the alternatives in its annotation.
+    """
+    columns = []
+    for name, field in model_class.model_fields.items():
+        clauses = [quote(name), sql_type(field.annotation)]
+        match field.annotation:
+            case _UnionGenericAlias() | UnionType() as union if NoneType in union.__args__:
+                pass
+            case _:
+                clauses.append("NOT NULL")
+        json_schema_extra = cast(dict[str, Any], field.json_schema_extra or {})
+        if "sql" in json_schema_extra:
+            sql = cast(dict[str, Any], json_schema_extra["sql"])
+            match sql.get("key", "primary"):
+                case "primary":
+                    clauses.append("PRIMARY KEY")
+                case "foreign":
+                    model_ref, field_ref = sql["reference"].split(".")
+                    clauses.append(
+                        f"REFERENCES {quote(model_ref)} ({quote(field_ref)})"
+                        " DEFERRABLE INITIALLY DEFERRED"
+                    )
+        columns.append(" ".join(clauses))
+    return f"CREATE TABLE {quote(model_class.__name__)} (\n    " + ",\n    ".join(columns) + "\n)"
+
+
+def load_table(
+    connection: sqlite3.Connection,
+    table: str,
+    fields: Sequence[str],
+    batches: Iterable[dict[str, Any]],
+) -> int:
+    """
+    Inserts batches of rows into a table, with one ``executemany()`` per batch.
+    The values are converted by :py:func:`csv_column`: numbers, ISO 8601 strings, and None.
+    The caller manages the transaction.
+
+    :returns: the number of rows inserted.
+    """
+    insert = (
+        f"INSERT INTO {quote(table)} ({', '.join(map(quote, fields))})"
+        f" VALUES ({', '.join('?' for _ in fields)})"
+    )
+    rows = 0
+    for batch in batches:
+        columns = [csv_column(batch[name]) for name in fields]
+        connection.executemany(insert, zip(*columns))
+        rows += len(columns[0]) if columns else 0
+    return rows
+
+
+def postgres_type(annotation: Any) -> str:
+    """
+    The PostgreSQL type for a field's annotation.
+    Optional fields have the type of the non-None alternative.
+    """
+    match annotation:
+        case _UnionGenericAlias() | UnionType() as union:
+            types = {postgres_type(alt) for alt in union.__args__ if alt is not NoneType}
+            if len(types) == 1:
+                return types.pop()
+            if types <= {"bigint", "double precision"}:
+                return "double precision"
+            return "text"
+        case type() if issubclass(annotation, bool):
+            return "boolean"
+        case type() if issubclass(annotation, int):
+            return "bigint"
+        case type() if issubclass(annotation, float):
+            return "double precision"
+        case type() if issubclass(annotation, datetime.datetime):
+            return "timestamptz"
+        case _:
+            return "text"
+
+
+def copy_statement(table: str, fields: Sequence[str], binary: bool = False) -> str:
+    """The ``COPY ... FROM STDIN`` statement for the rows of a table, in the text or binary format."""
+    format = "binary" if binary else "text"
+    return f"COPY {quote(table)} ({', '.join(map(quote, fields))}) FROM STDIN (FORMAT {format})"
+
+
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_text(value: Any) -> str:
+    """The COPY text for a single value, of any type."""
+    if value is None:
+        return "\\N"
+    return str(iso_value(value)).translate(COPY_ESCAPES)
+
+
+def copy_value(value: Any) -> str:
+    """The text of a value for a binary ``text`` field: no escapes, timestamps in ISO 8601 format."""
+    return str(iso_value(value))
+
+
+def copy_column(column: Sequence[Any] | numpy.ndarray) -> list[str]:
+    """
+    The COPY text for each value in a column.
+    An array of numbers or timestamps is formatted in bulk, and needs no escapes.
+    """
+    if isinstance(column, numpy.ndarray):
+        match column.dtype.kind:
+            case "M":
+                return iso_timestamps(column)
+            case "i" | "u" | "f":
+                return list(map(repr, column.tolist()))
+        column = column.tolist()
+    return [copy_text(value) for value in column]
+
+
+def write_copy_text(
+    target: BinaryIO,
+    fields: Sequence[str],
+    batches: Iterable[dict[str, Any]],
+) -> int:
+    """
+    Writes batches of rows in the COPY text format, encoded as UTF-8.
+
+    :param target: the binary file or pipe.
+    :param fields: the field names, in column order.
+    :param batches: the column-oriented batches.
+    :returns: the number of rows written.
+    """
+    rows = 0
+    for batch in batches:
+        columns = [copy_column(batch[name]) for name in fields]
+        lines = ["\t".join(values) for values in zip(*columns)]
+        if lines:
+            target.write(("\n".join(lines) + "\n").encode("utf-8"))
+        rows += len(lines)
+    return rows
+
+
+COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+COPY_NULL = struct.pack(">i", -1)
+PG_EPOCH = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+PG_EPOCH_US = round(PG_EPOCH.timestamp() * 1_000_000)
+
+# The big-endian NumPy type of each fixed-size PostgreSQL type.
+BINARY_DTYPES = {
+    "bigint": numpy.dtype(">i8"),
+    "double precision": numpy.dtype(">f8"),
+    "boolean": numpy.dtype("?"),
+    "timestamptz": numpy.dtype(">i8"),
+}
+
+
+def binary_column(column: Sequence[Any] | numpy.ndarray, type_: str) -> list[bytes]:
+    """
+    The COPY binary field for each value in a column: a 32-bit length and the value's bytes.
+    None is a length of -1.
+
+    Fixed-size values are converted in bulk, to a structured array of lengths and values.
+    Timestamps are microseconds since 2000-01-01 UTC.
+    Text is UTF-8.
+    """
+    if type_ not in BINARY_DTYPES:
+        encoded = (None if v is None else copy_value(v).encode("utf-8") for v in column)
+        return [COPY_NULL if b is None else struct.pack(">i", len(b)) + b for b in encoded]
+    nulls: list[int] = []
+    if isinstance(column, numpy.ndarray):
+        values = column
+    else:
+        nulls = [i for i, v in enumerate(column) if v is None]
+        if type_ == "timestamptz":
+            microsecond = datetime.timedelta(microseconds=1)
+            column = [0 if v is None else (v - PG_EPOCH) // microsecond for v in column]
+        values = numpy.array([0 if v is None else v for v in column])
+    if type_ == "timestamptz" and values.dtype.kind == "M":
+        values = values.astype("datetime64[us]").view(numpy.int64) - PG_EPOCH_US
+    dtype = BINARY_DTYPES[type_]
+    fields = numpy.empty(len(values), dtype=[("size", ">i4"), ("value", dtype)])
+    fields["size"] = dtype.itemsize
+    fields["value"] = values
+    data, width = fields.tobytes(), fields.itemsize
+    result = [data[start : start + width] for start in range(0, len(data), width)]
+    for i in nulls:
+        result[i] = COPY_NULL
+    return result
+
+
+def write_copy_binary(
+    target: BinaryIO,
+    fields: Sequence[str],
+    types: Sequence[str],
+    batches: Iterable[dict[str, Any]],
+) -> int:
+    """
+    Writes batches of rows in the COPY binary format:
+    the signature and header, a tuple for each row, and the trailer.
+
+    :param target: the binary file or pipe.
+    :param fields: the field names, in column order.
+    :param types: the PostgreSQL type of each field, from :py:func:`postgres_type`.
+    :param batches: the column-oriented batches.
+    :returns: the number of rows written.
+    """
+    target.write(COPY_SIGNATURE + struct.pack(">ii", 0, 0))
+    count = struct.pack(">h", len(fields))
+    rows = 0
+    for batch in batches:
+        columns = [binary_column(batch[name], type_) for name, type_ in zip(fields, types)]
+        n = len(columns[0]) if columns else 0
+        target.write(b"".join(chain.from_iterable(zip(repeat(count, n), *columns))))
+        rows += n
+    target.write(struct.pack(">h", -1))
+    return rows
@@ -60,3 +60,60 @@ class Manager(BaseModel):
         ),
     ]
     department_id: Annotated[str, Field(max_length=8)]
+
+
+class Department(BaseModel):
+    code: Annotated[
+        str,
+        Field(
+            min_length=4,
+            max_length=8,
+            json_schema_extra={"sql": {"key": "primary"}},
+        ),
+    ]
+    name: Annotated[
+        str,
+        Field(
+            max_length=24, json_schema_extra={"domain": "name"}
+        ),
+    ]
+
+
+class Project(BaseModel):
+    id: Annotated[
+        int,
+        Field(json_schema_extra={"sql": {"key": "primary"}}),
+    ]
+    department_code: Annotated[
+        str,
+        Field(
+            json_schema_extra={
+                "sql": {
+                    "key": "foreign",
+                    "reference": "Department.code",
+                },
+                "children": {"min": 2, "max": 6},
+            }
+        ),
+    ]
+
+
+class Task(BaseModel):
+    project_id: Annotated[
+        int,
+        Field(
+            json_schema_extra={
+                "sql": {
+                    "key": "foreign",
+                    "reference": "Project.id",
+                },
+                "children": {
+                    "min": 0,
+                    "max": 10,
+                    "distribution": "exponential",
+                    "scale": 2,
+                },
+            }
+        ),
+    ]
+    name: Annotated[str, Field(max_length=24)]
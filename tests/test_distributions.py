@@ -0,0 +1,193 @@
+"""
+Test synthdata.distributions classes.
+"""
+
+import math
+from statistics import NormalDist, mean
+
+import numpy
+
+from synthdata.distributions import *
+
+import pytest
+
+
+@pytest.fixture()
+def uniform_values():
+    return numpy.random.default_rng(42).random(10_000)
+
+
+def test_norm_ppf_array():
+    p = numpy.array([1e-300, 1e-10, 0.01, 0.02425, 0.3, 0.5, 0.7, 0.99, 1 - 1e-10])
+    expected = [NormalDist().inv_cdf(x) for x in p]
+    assert norm_ppf_array(p) == pytest.approx(expected, rel=1e-8)
+
+
+def test_uniform(uniform_values):
+    d = make_distribution("uniform", 2, 21)
+    assert repr(d) == "Uniform(2, 21)"
+    assert d.ppf(0.0) == 2
+    assert d.ppf(0.5) == 11.5
+    values = d.ppf_array(uniform_values)
+    assert 2 <= values.min() and values.max() <= 21
+
+
+def test_normal(uniform_values):
+    d = make_distribution("normal", 2, 21, sql={"key": "primary"})
+    assert (d.mu, d.sigma) == (11.5, pytest.approx(3.1666, rel=1e-3))
+    values = d.ppf_array(uniform_values)
+    assert 2 <= values.min() and values.max() <= 21
+    assert values.mean() == pytest.approx(11.5, rel=0.02)
+    assert d.ppf(0.5) == pytest.approx(11.5)
+
+
+@pytest.mark.parametrize("low, high", [(8.0, 8.001), (-8.001, -8.0), (40.0, 41.0), (-50.0, -49.0)])
+def test_normal_narrow_tail(uniform_values, low, high):
+    d = make_distribution("normal", low, high, mu=0.0, sigma=1.0)
+    values = d.ppf_array(uniform_values)
+    assert low <= values.min() and values.max() <= high
+    scalars = [d.ppf(u) for u in uniform_values[:100]]
+    assert all(low <= v <= high for v in scalars)
+    assert scalars == pytest.approx(values[:100], rel=1e-9)
+
+
+def test_normal_tail_shape(uniform_values):
+    # Far in the upper tail, the density drops off roughly as an exponential with rate 8.
+    d = make_distribution("normal", 8.0, 9.0, mu=0.0, sigma=1.0)
+    values = d.ppf_array(uniform_values)
+    assert values.mean() == pytest.approx(8 + 1 / 8, rel=0.01)
+
+
+def truncated_mean(low, high, mu, sigma):
+    """The mean of a truncated normal, by numerical integration, scaled to avoid underflow."""
+    z = numpy.linspace((low - mu) / sigma, (high - mu) / sigma, 1_000_001)
+    w = numpy.exp(-(z * z - (z * z).min()) / 2)
+    return mu + sigma * (z * w).sum() / w.sum()
+
+
+@pytest.mark.parametrize(
+    "low, high, mu, sigma",
+    [(0, 10, 100, 5), (0, 10, 500, 5), (40.0, 41.0, 0.0, 1.0), (-50.0, -49.0, 0.0, 1.0)],
+)
+def test_normal_far_tail(uniform_values, low, high, mu, sigma):
+    d = make_distribution("normal", low, high, mu=mu, sigma=sigma)
+    values = d.ppf_array(uniform_values)
+    assert low <= values.min() and values.max() <= high
+    expected = truncated_mean(low, high, mu, sigma)
+    assert values.mean() - low == pytest.approx(expected - low, rel=0.01)
+    # The array inverse CDF is an approximation, with a relative error of about 1e-9.
+    assert [d.ppf(u) for u in uniform_values[:100]] == pytest.approx(values[:100], rel=1e-7)
+
+
+def test_lognormal_far_tail(uniform_values):
+    d = make_distribution("lognormal", 1, 10, mu=20.0, sigma=1.0)
+    logs = numpy.log(d.ppf_array(uniform_values))
+    expected = truncated_mean(0.0, math.log(10), 20.0, 1.0)
+    assert logs.mean() == pytest.approx(expected, rel=0.001)
+
+
+def test_lognormal(uniform_values):
+    d = make_distribution("lognormal", 0, 100, mu=1.0, sigma=0.5)
+    values = d.ppf_array(uniform_values)
+    assert 0 <= values.min() and values.max() <= 100
+    assert numpy.median(values) == pytest.approx(math.e, rel=0.05)
+    with pytest.raises(ValueError):
+        make_distribution("lognormal", -10, -1)
+
+
+def test_exponential(uniform_values):
+    d = make_distribution("exponential", 10, 1_000_000, scale=5)
+    values = d.ppf_array(uniform_values)
+    assert 10 <= values.min() and values.max() <= 1_000_000
+    assert values.mean() == pytest.approx(15, rel=0.05)
+    assert mean(d.ppf(u) for u in uniform_values) == pytest.approx(15, rel=0.05)
+
+
+@pytest.mark.parametrize("s", [1.0, 1.5])
+def test_zipf(uniform_values, s):
+    d = make_distribution("zipf", 1, 1001, s=s)
+    ranks = numpy.floor(d.ppf_array(uniform_values)).astype(int)
+    assert 1 <= ranks.min() and ranks.max() <= 1001
+    counts = numpy.bincount(ranks)
+    assert counts[1] > counts[2] > counts[3] > counts[10]
+    assert d.ppf(0.0) == 1
+
+
+def test_unknown():
+    with pytest.raises(KeyError):
+        make_distribution("bimodal", 0, 1)
+    with pytest.raises(ValueError):
+        make_distribution("normal", 0, 1, sigma=0)
+
+
+def test_alias_table():
+    table = AliasTable([1, 2, 3, 4])
+    assert len(table) == 4
+    u = numpy.random.default_rng(42).random(100_000)
+    counts = numpy.bincount(table.sample_array(u), minlength=4) / len(u)
+    assert numpy.allclose(counts, [0.1, 0.2, 0.3, 0.4], atol=0.01)
+    assert [table.sample(x) for x in u[:100]] == table.sample_array(u[:100]).tolist()
+    assert AliasTable([0, 1]).sample_array(u[:100]).tolist() == [1] * 100
+    assert AliasTable([3]).sample(0.999) == 0
+    with pytest.raises(ValueError):
+        AliasTable([])
+    with pytest.raises(ValueError):
+        AliasTable([1, -1])
+
+
+def test_cdf_array():
+    d = make_distribution("exponential", 0, 10, scale=2)
+    x = numpy.array([-1.0, 0.0, 1.0, 5.0, 10.0, 11.0])
+    cdf = d.cdf_array(x)
+    assert cdf[[0, 1, -1]].tolist() == [0.0, 0.0, 1.0]
+    assert d.ppf_array(cdf[2:4]) == pytest.approx(x[2:4])
+    assert numpy.all(numpy.diff(cdf) >= 0)
+
+
+@pytest.mark.parametrize(
+    "name, low, high, parameters",
+    [
+        ("uniform", 1, 1001, {}),
+        ("normal", 1, 1001, {}),
+        ("normal", 1, 1001, {"mu": -100, "sigma": 50}),
+        ("normal", 100, 200, {"mu": 0, "sigma": 1}),
+        ("normal", -200, -100, {"mu": 0, "sigma": 1}),
+        ("lognormal", 0, 1001, {"mu": 3, "sigma": 1}),
+        ("exponential", 1, 201, {"scale": 5}),
+        ("zipf", 1, 1001, {"s": 1}),
+        ("zipf", 1, 1001, {"s": 1.5}),
+        ("hot-set", 1, 1001, {}),
+    ],
+)
+def test_cdf_array_matches_ppf(uniform_values, name, low, high, parameters):
+    d = make_distribution(name, low, high, **parameters)
+    values = numpy.sort(d.ppf_array(uniform_values))
+    x = numpy.quantile(values, [0.05, 0.25, 0.5, 0.75, 0.95])
+    below = numpy.searchsorted(values, x) / len(values)
+    assert d.cdf_array(x) == pytest.approx(below, abs=0.01)
+    assert d.cdf_array(numpy.array([low - 1.0, high + 1.0])).tolist() == [0.0, 1.0]
+
+
+def test_weighted_sample():
+    rng = numpy.random.default_rng(42)
+    weights = numpy.array([1.0, 2.0, 3.0, 4.0, 0.0, 0.0])
+    firsts = [weighted_sample(rng, weights, 1)[0] for _ in range(10_000)]
+    counts = numpy.bincount(firsts, minlength=6) / len(firsts)
+    assert numpy.allclose(counts, [0.1, 0.2, 0.3, 0.4, 0, 0], atol=0.015)
+    sample = weighted_sample(rng, weights, 6)
+    assert sorted(sample.tolist()) == list(range(6))
+    assert set(sample[4:].tolist()) == {4, 5}
+    with pytest.raises(ValueError):
+        weighted_sample(rng, weights, 7)
+
+
+def test_hot_set():
+    d = make_distribution("hot-set", 0, 100, fraction=0.1, weight=0.5)
+    u = numpy.random.default_rng(42).random(100_000)
+    x = d.ppf_array(u)
+    assert 0 <= x.min() and x.max() < 100
+    assert abs((x < 10).mean() - 0.5) < 0.01
+    assert [d.ppf(v) for v in u[:10]] == pytest.approx(x[:10].tolist())
+    assert make_distribution("hot-set", 0, 10).ppf(0.4) == pytest.approx(1.0)
+    with pytest.raises(ValueError):
+        HotSet(0, 1, fraction=1.5)
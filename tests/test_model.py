@@ -2,14 +2,25 @@
 Test synthdata.base classes: SynthesizeModel and SynthesizeSchema
 """
 
+import copy
+import csv
+import enum
+import io
+from itertools import groupby, islice
+import pickle
 import random
-from typing import Union
+import sqlite3
+from typing import Annotated, Literal, Union
 from unittest.mock import Mock, MagicMock, sentinel, call
 
 from sample_schema import *
 from synthdata.synths import *
 from synthdata.base import *
+from synthdata.pools import *
+from synthdata import writers
 
+import numpy
+from pydantic import field_validator
 import pytest
 
 
@@ -37,14 +48,20 @@ def test_data_iter():
     mock_base_model = Mock(return_value=sentinel.OBJECT)
     mock_model_synth = MagicMock(
         name="ModelSynthesizer",
-        fields={"name": Mock(name="Synthesizer", next=Mock(return_value=sentinel.VALUE))},
+        row_chunk=Mock(return_value=[{"name": sentinel.VALUE}, {"name": sentinel.NEXT}]),
         model_class=mock_base_model,
     )
     m = DataIter(mock_model_synth)
 
     assert iter(m) == m
     assert next(m) == {"name": sentinel.VALUE}
+    assert next(m) == {"name": sentinel.NEXT}
+    assert next(m) == {"name": sentinel.VALUE}
     assert mock_base_model.mock_calls == []
+    assert mock_model_synth.row_chunk.mock_calls == [
+        call(0, 16, 0.0, "dict"),
+        call(2, 34, 0.0, "dict"),
+    ]
     assert repr(m) == f"DataIter({str(mock_model_synth)}, noise=0.0)"
 
 
@@ -52,7 +69,7 @@ def test_model_iter():
     mock_base_model = Mock(return_value=sentinel.OBJECT)
     mock_model_synth = MagicMock(
         name="ModelSynthesizer",
-        fields={"name": Mock(name="Synthesizer", next=Mock(return_value=sentinel.VALUE))},
+        row_chunk=Mock(return_value=[{"name": sentinel.VALUE}]),
         model_class=mock_base_model,
     )
     m = ModelIter(mock_model_synth)
@@ -75,6 +92,28 @@ def test_optional():
     assert isinstance(m.fields["opt_int"].behavior, Independent)
 
 
+def test_categorical():
+    class Color(enum.Enum):
+        RED = 1
+        GREEN = 2
+
+    class Categories(BaseModel):
+        color: Color
+        flag: bool
+        size: Literal["S", "M", "L"]
+        maybe: Literal["x", "y"] | None
+
+    m = BaseModelSynthesizer(Categories, 100, seed=42)
+    assert isinstance(m.fields["color"], SynthesizeCategorical)
+    assert isinstance(m.fields["flag"], SynthesizeCategorical)
+    assert isinstance(m.fields["size"], SynthesizeCategorical)
+    assert isinstance(m.fields["maybe"].sources["typing.Literal['x', 'y']"], SynthesizeCategorical)
+    rows = list(islice(m.model_iter(), 50))
+    assert {row.color for row in rows} == {Color.RED, Color.GREEN}
+    assert {row.size for row in rows} == {"S", "M", "L"}
+    assert m.row_chunk(0, 20) == [m.row(i) for i in range(20)]
+
+
 def test_model_prep():
     m = BaseModelSynthesizer(Employee, 12)
     m._prepare()
@@ -157,17 +196,17 @@ def test_alternatives():
 
 
 def test_model_data(seeded_random):
-    mock_manager_id = MagicMock(__next__=Mock(side_effect=[42]))
+    mock_manager_id = MagicMock(choice_batch=Mock(side_effect=lambda n, rng: [1] * n))
     m = BaseModelSynthesizer(Employee, 12)
     m._prepare()
     m.fields["manager"].source = mock_manager_id
 
     row = next(iter(m))
     assert row == Employee(
-        id=2592983555,
-        name="Rosjoruxxdoczuzrenktunpfzpd",
-        hire_date=datetime.datetime(2032, 4, 30, 2, 17, 3, 359625, tzinfo=datetime.timezone.utc),
-        velocity=12.336979706209183,
+        id=1719875050,
+        name="Yktcgjbwfklfluapsjxyfoqyzqsoeoure",
+        hire_date=datetime.datetime(2099, 11, 8, 23, 6, 1, 286342, tzinfo=datetime.timezone.utc),
+        velocity=10.750209178899382,
         manager=1,
     )
 
@@ -187,44 +226,641 @@ def test_schema(seeded_random):
 
     e_0 = next(employee_iter)
     assert e_0 == Employee(
-        id=3701002945,
-        name="Mokiupk",
-        hire_date=datetime.datetime(2057, 7, 17, 21, 24, 55, 558971, tzinfo=datetime.timezone.utc),
-        velocity=12.809854665970944,
-        manager=415393687,
+        id=1719875050,
+        name="Yktcgjbwfklfluapsjxyfoqyzqsoeoure",
+        hire_date=datetime.datetime(2099, 11, 8, 23, 6, 1, 286342, tzinfo=datetime.timezone.utc),
+        velocity=10.750209178899382,
+        manager=2710739865,
     )
 
     manager_iter = s.rows(Manager)
     m_0 = next(manager_iter)
     print(m_0)
-    assert m_0 == Manager(id=3332894265, employee_id=2479708607, department_id="i|I<")
+    assert m_0 == Manager(id=2710739865, employee_id=2696753161, department_id="Op")
+
+
+def test_noisy_dataiter():
+    class TwoFields(BaseModel):
+        f1: int
+        f2: str
+
+    m = BaseModelSynthesizer(TwoFields, 10, seed=42)
+    di = DataIter(m, noise=0.5)
+    rows = list(next(di) for _ in range(10))
+    assert rows == [m.row(i, noise=0.5) for i in range(10)]
+    assert list(islice(DataIter(m, noise=0.5, start=3), 7)) == rows[3:]
+    batch = m.row_batch(0, 10, noise=0.5)
+    assert rows == [{name: batch[name][i] for name in batch} for i in range(10)]
+    noisy = sum(m.fields["f1"].is_noise(i, 0.5) for i in range(1000))
+    assert 400 < noisy < 600
+
+
+def test_row_access():
+    def schema(seed):
+        s = SchemaSynthesizer(seed=seed)
+        s.add(Employee, 10_000)
+        s.add(Manager, 100)
+        return s
+
+    rows = list(islice(schema(42).data(Employee), 5_000))
+
+    s = schema(42)
+    s.prepare()
+    m = s.schema["Employee"]
+    assert m.row(4_321) == rows[4_321]
+    assert m.row(17) == rows[17]
+    batch = m.row_batch(4_000, 5_000)
+    values = {name: m.fields[name].to_values(column) for name, column in batch.items()}
+    assert [{name: values[name][i] for name in values} for i in range(1_000)] == rows[4_000:]
+
+    assert next(schema(43).data(Employee)) != rows[0]
+
+
+def test_schema_batches(seeded_random):
+    s = SchemaSynthesizer()
+    s.add(Employee, 10)
+    s.add(Manager, 2)
+
+    batches = list(s.batches(Employee, 4))
+    assert [len(b["id"]) for b in batches] == [4, 4, 2]
+    assert all(list(b.keys()) == list(Employee.model_fields.keys()) for b in batches)
+
+    ids = [v for b in batches for v in b["id"]]
+    assert set(ids) == set(s.schema["Employee"].fields["id"].behavior.pool)
+    managers = {v for b in batches for v in b["manager"]}
+    assert managers <= set(s.schema["Manager"].fields["id"].behavior.pool)
+
+    b_0 = {name: numpy.asarray(column).tolist() for name, column in batches[0].items()}
+    for i in range(4):
+        Employee(**{name: column[i] for name, column in b_0.items()})
+
+
+def test_noisy_batches(seeded_random):
+    s = SchemaSynthesizer()
+    s.add(Employee, 10)
+    s.add(Manager, 2)
+
+    batches = list(s.batches(Manager, 50, rows=100, noise=0.5))
+    assert [len(b["id"]) for b in batches] == [50, 50]
+    pool = set(s.schema["Manager"].fields["id"].behavior.pool)
+    ids = [v for b in batches for v in b["id"]]
+    assert 20 < sum(1 for v in ids if v not in pool) < 80
+
+
+def test_reference_noise_leaves_source(seeded_random):
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 10)
+    s.add(Manager, 2)
+    s.prepare()
+    source = s.schema["Employee"].fields["id"]
+    rng, np_rng = source.rng.getstate(), source.np_rng.bit_generator.state
+
+    list(s.batches(Manager, 50, rows=100, noise=0.5))
+    assert source.rng.getstate() == rng
+    assert source.np_rng.bit_generator.state == np_rng
+
+
+def test_parallel_batches():
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 1_000)
+    s.add(Manager, 20)
+
+    expected = [
+        {name: numpy.asarray(column).tolist() for name, column in batch.items()}
+        for batch in s.batches(Employee, 300, noise=0.1)
+    ]
+    for workers in (1, 3):
+        actual = [
+            {name: numpy.asarray(column).tolist() for name, column in batch.items()}
+            for batch in s.parallel_batches(Employee, 300, noise=0.1, workers=workers)
+        ]
+        assert [len(b["id"]) for b in actual] == [300, 300, 300, 100]
+        assert actual == expected
+    assert s.shared_pools == {}
+
+
+def test_share_pools(tmp_path):
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 10)
+    s.add(Manager, 2)
+    s.add(Department, 50)
+    shared = s.share_pools(tmp_path)
+    assert list(shared) == [("Department", "code")]
+    assert isinstance(shared["Department", "code"], StringPool)
 
+    s.shared_pools = shared
+    clone = pickle.loads(pickle.dumps(s))
+    behavior = clone.schema["Department"].fields["code"].behavior
+    assert behavior.prepared and behavior.pool.path == shared["Department", "code"].path
+    clone.prepare()
+    assert list(behavior.pool) == list(s.schema["Department"].fields["code"].behavior.pool)
 
-def test_noisy_dataiter(seeded_random):
-    mock_model = Mock(
-        fields={
-            "f1": Mock(
-                noise_gen=Mock(return_value=sentinel.NOISE1),
-                next=Mock(return_value=sentinel.VALUE1),
+    expected = [b["code"] for b in s.batches(Department, 20, rows=100)]
+    assert [b["code"] for b in s.parallel_batches(Department, 20, rows=100, workers=2)] == expected
+
+
+def test_schema_pickle():
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 10)
+    s.add(Manager, 2)
+    clone = pickle.loads(pickle.dumps(s))
+    assert clone.seed == 42
+    assert list(clone.schema) == ["Employee", "Manager"]
+    assert next(clone.data(Manager)) == next(s.data(Manager))
+
+    other = copy.deepcopy(s)
+    assert other is not clone and pickle.loads(pickle.dumps(s)) is not clone
+    other.add(Department, 5)
+    assert list(clone.schema) == ["Employee", "Manager"]
+
+
+def test_prepare_once():
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 10)
+    s.add(Manager, 2)
+    s.add(Department, 5)
+
+    next(s.rows(Department))
+    pool = s.schema["Department"].fields["code"].behavior.pool
+    next(s.data(Manager))
+    list(s.batches(Department, 5))
+    assert s.schema["Department"].fields["code"].behavior.pool is pool
+
+    s.reset()
+    assert not s.schema["Department"].fields["code"].behavior.prepared
+    next(s.rows(Department))
+    refilled = s.schema["Department"].fields["code"].behavior.pool
+    assert refilled is not pool
+    assert list(refilled) == list(pool)
+
+
+def test_prepare_needed():
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 10)
+    s.add(Manager, 2)
+    s.add(Department, 5)
+
+    def prepared(model: str, field: str) -> bool:
+        return s.schema[model].fields[field].behavior.prepared
+
+    assert ("Manager", "id") in s.needed(Employee)
+    assert ("Department", "code") not in s.needed(Employee)
+
+    next(s.rows(Department))
+    assert prepared("Department", "code")
+    assert not prepared("Employee", "id")
+    assert not prepared("Manager", "id")
+
+    next(s.rows(Employee))
+    assert prepared("Employee", "id")
+    assert prepared("Manager", "id")
+
+    s.reset()
+    s.prepare()
+    assert prepared("Department", "code")
+    assert prepared("Employee", "id")
+
+
+def test_pool_cache(tmp_path):
+    def schema(rows: int = 50) -> SchemaSynthesizer:
+        s = SchemaSynthesizer(seed=42, cache_dir=tmp_path)
+        s.add(Department, rows)
+        return s
+
+    first = schema()
+    expected = list(islice(first.data(Department), 80))
+    pool = first.schema["Department"].fields["code"].behavior.pool
+    assert pool.path is not None
+    assert len(list(tmp_path.iterdir())) == 1
+
+    second = schema()
+    second.schema["Department"].fields["code"].behavior.fill = Mock(side_effect=AssertionError)
+    assert list(islice(second.data(Department), 80)) == expected
+    assert second.schema["Department"].fields["code"].behavior.pool.path == pool.path
+
+    uncached = SchemaSynthesizer(seed=42)
+    uncached.add(Department, 50)
+    assert list(islice(uncached.data(Department), 80)) == expected
+
+    schema(rows=60).prepare()
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_write_csv_jsonl(tmp_path):
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 100)
+    s.add(Manager, 10)
+    expected = [Employee(**row) for row in islice(s.data(Employee), 100)]
+
+    assert s.write_csv(Employee, tmp_path / "employee.csv", size=30) == 100
+    with open(tmp_path / "employee.csv", newline="") as source:
+        assert [Employee(**row) for row in csv.DictReader(source)] == expected
+
+    assert s.write_jsonl(Employee, tmp_path / "employee.jsonl", rows=40) == 40
+    with open(tmp_path / "employee.jsonl") as source:
+        assert [Employee.model_validate_json(line) for line in source] == expected[:40]
+
+
+def test_writers_without_rows(tmp_path):
+    class Reading(BaseModel):
+        sensor: Annotated[str, Field(min_length=4, max_length=8)]
+        value: Annotated[float, Field(ge=0, le=100)]
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Reading)
+
+    with pytest.raises(ValueError):
+        s.batches(Reading, 30)
+    with pytest.raises(ValueError):
+        s.write_csv(Reading, tmp_path / "reading.csv")
+    with pytest.raises(ValueError):
+        s.write_jsonl(Reading, tmp_path / "reading.jsonl")
+    with pytest.raises(ValueError):
+        s.record_batches(Reading)
+    with pytest.raises(ValueError):
+        s.write_parquet(Reading, tmp_path / "reading.parquet")
+    with pytest.raises(ValueError):
+        s.write_copy(Reading, tmp_path / "reading.copy")
+    assert list(tmp_path.iterdir()) == []
+
+    assert sum(len(b["sensor"]) for b in s.batches(Reading, 30, rows=50)) == 50
+    assert s.write_jsonl(Reading, tmp_path / "reading.jsonl", rows=50) == 50
+
+
+def test_write_parquet(tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 100)
+    s.add(Manager, 10)
+    expected = [Employee(**row) for row in islice(s.data(Employee), 100)]
+
+    assert s.write_parquet(Employee, tmp_path / "employee.parquet", row_group_size=30) == 100
+    parquet = pq.ParquetFile(tmp_path / "employee.parquet")
+    assert parquet.num_row_groups == 4
+    assert parquet.schema_arrow.field("hire_date").type == pyarrow.timestamp("us", tz="UTC")
+    table = parquet.read()
+    assert [Employee(**row) for row in table.to_pylist()] == expected
+
+
+def test_load_order():
+    class Assignment(BaseModel):
+        department: Annotated[
+            str,
+            Field(json_schema_extra={"sql": {"key": "foreign", "reference": "Department.code"}}),
+        ]
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Assignment, 10)
+    s.add(Employee, 10)
+    s.add(Manager, 2)
+    s.add(Department, 5)
+    # Employee and Manager refer to each other.
+    assert s.load_order() == ["Department", "Assignment", "Employee", "Manager"]
+    assert s.load_order(Assignment, Department) == ["Department", "Assignment"]
+
+
+def test_load_sqlite(tmp_path):
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 100)
+    s.add(Manager, 10)
+    s.add(Department, 20)
+    expected = [Employee(**row) for row in islice(s.data(Employee), 100)]
+
+    connection = sqlite3.connect(tmp_path / "hr.db")
+    connection.execute("PRAGMA foreign_keys = ON")
+    pragmas = {p: connection.execute(f"PRAGMA {p}").fetchone() for p in writers.SQLITE_PRAGMAS}
+    assert s.load_sqlite(connection, Employee, Manager) == {"Employee": 100, "Manager": 10}
+    assert {
+        p: connection.execute(f"PRAGMA {p}").fetchone() for p in writers.SQLITE_PRAGMAS
+    } == pragmas
+    assert connection.execute("PRAGMA foreign_key_check").fetchall() == []
+    names = [row[0] for row in connection.execute("SELECT name FROM sqlite_schema")]
+    assert "Department" not in names
+    cursor = connection.execute("SELECT * FROM Employee ORDER BY rowid")
+    columns = [d[0] for d in cursor.description]
+    rows = [Employee(**dict(zip(columns, row))) for row in cursor]
+    assert sorted(rows, key=lambda e: e.id) == sorted(expected, key=lambda e: e.id)
+    connection.close()
+
+    assert s.load_sqlite(tmp_path / "dept.db") == {"Employee": 100, "Manager": 10, "Department": 20}
+    with pytest.raises(sqlite3.OperationalError):
+        s.load_sqlite(tmp_path / "dept.db", Department)
+
+
+def test_load_sqlite_without_rows():
+    class Reading(BaseModel):
+        sensor: Annotated[str, Field(min_length=4, max_length=8)]
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Department, 10)
+    s.add(Reading)
+    connection = sqlite3.connect(":memory:")
+    with pytest.raises(ValueError):
+        s.load_sqlite(connection)
+    assert connection.execute("SELECT name FROM sqlite_schema").fetchall() == []
+
+
+def test_write_copy(tmp_path):
+    from test_writers import read_copy_binary
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Employee, 100)
+    s.add(Manager, 10)
+    expected = [Employee(**row) for row in islice(s.data(Employee), 100)]
+    fields = list(Employee.model_fields)
+
+    target = io.BytesIO()
+    assert s.write_copy(Employee, target, size=30) == 100
+    lines = target.getvalue().decode("utf-8").splitlines()
+    assert [Employee(**dict(zip(fields, line.split("\t")))) for line in lines] == expected
+
+    assert s.write_copy(Employee, tmp_path / "employee.bin", binary=True) == 100
+    types = ["bigint", "text", "timestamptz", "double precision", "bigint"]
+    rows = read_copy_binary((tmp_path / "employee.bin").read_bytes(), types)
+    assert [Employee(**dict(zip(fields, row))) for row in rows] == expected
+
+    with pytest.raises(ValueError):
+        s.write_copy(Employee, io.BytesIO(), noise=0.1, binary=True)
+
+
+def test_validate_strategies():
+    validated = []
+
+    class Checked(BaseModel):
+        code: Annotated[str, Field(min_length=4, max_length=8)]
+        size: Annotated[int, Field(ge=1, le=99)]
+
+        @field_validator("code")
+        @classmethod
+        def count(cls, value):
+            validated.append(value)
+            return value
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Checked, 10)
+    full = list(islice(s.rows(Checked), 2000))
+    assert len(validated) == 2000
+
+    validated.clear()
+    assert list(islice(s.rows(Checked, validate="none"), 2000)) == full
+    assert validated == []
+
+    assert list(islice(s.rows(Checked, validate="sample:0.1"), 2000)) == full
+    assert 100 < len(validated) < 300
+    sampled = list(validated)
+    validated.clear()
+    list(islice(s.rows(Checked, validate="sample:0.1"), 2000))
+    assert validated == sampled
+
+    validated.clear()
+    assert list(islice(s.rows(Checked, validate="batch:300"), 2000)) == full
+    assert len(validated) == 2100
+    assert list(islice(s.rows(Checked, validate="batch"), 2000)) == full
+    assert s.schema["Checked"].list_adapter() is s.schema["Checked"].list_adapter()
+
+    for strategy in ("partial", "sample:2", "batch:0"):
+        with pytest.raises(ValueError):
+            s.rows(Checked, validate=strategy)
+
+
+def test_trusted_construct():
+    class Private(BaseModel):
+        x: int
+        _hidden: int = 3
+
+    m = BaseModelSynthesizer(Department, 5, seed=42)
+    m._prepare()
+    data = m.row(0)
+    d = ModelIter(m, validate="none").construct(dict(data))
+    assert d == Department(**data)
+    assert d.model_fields_set == {"code", "name"}
+    d.name = "Changed"
+    assert d.model_dump() == {"code": data["code"], "name": "Changed"}
+
+    p = ModelIter(BaseModelSynthesizer(Private, seed=42), validate="none").construct({"x": 1})
+    assert p.x == 1 and p._hidden == 3
+
+
+def test_compiled_rows():
+    class NoFields(BaseModel):
+        pass
+
+    m = BaseModelSynthesizer(Department, 5, seed=42)
+    m._prepare()
+    row, rows = m.compile()
+    assert m.compile() == (row, rows)
+    assert row(3, 0.0) == {"code": m.fields["code"].row(3), "name": m.fields["name"].row(3)}
+    assert rows(2, ["a", "b"], ["x", "y"]) == [
+        {"code": "a", "name": "x"},
+        {"code": "b", "name": "y"},
+    ]
+    assert m.row_chunk(0, 5000, 0.25) == [m.row(i, 0.25) for i in range(5000)]
+
+    di = DataIter(m)
+    assert [next(di) for _ in range(20)] == m.row_chunk(0, 20)
+    assert di.batch(3)["code"] == m.row_batch(20, 23)["code"]
+    assert next(di) == m.row(23)
+
+    assert BaseModelSynthesizer(NoFields).row_chunk(0, 2) == [{}, {}]
+
+
+def test_row_types():
+    m = BaseModelSynthesizer(Department, 5, seed=42)
+    m._prepare()
+    dicts = m.row_chunk(0, 100, 0.25)
+    tuples = m.row_chunk(0, 100, 0.25, "tuple")
+    named = m.row_chunk(0, 100, 0.25, "namedtuple")
+    assert tuples == [tuple(row.values()) for row in dicts]
+    assert [row._asdict() for row in named] == dicts
+    assert type(named[0]) is m.row_class() is m.row_class()
+    assert type(named[0]).__name__ == "Department"
+    assert m.row(7, 0.25, "tuple") == tuples[7]
+    assert m.row(7, row_type="namedtuple") == m.row_class()(**m.row(7))
+
+    di = DataIter(m, row_type="tuple")
+    assert di.fields == ("code", "name")
+    assert [next(di) for _ in range(20)] == m.row_chunk(0, 20, row_type="tuple")
+    assert next(iter(m.data_iter(row_type="namedtuple"))) == named[0]._replace(**m.row(0))
+
+    with pytest.raises(ValueError):
+        m.row(0, row_type="list")
+
+
+def test_noise_rates():
+    class Rated(BaseModel):
+        clean: Annotated[int, Field(json_schema_extra={"noise": 0})]
+        noisy: Annotated[str, Field(json_schema_extra={"noise": 0.5})]
+        other: int
+
+    m = BaseModelSynthesizer(Rated, 10_000, seed=42)
+    m._prepare()
+    assert m.fields["clean"].noise_level(0.1) == 0
+    assert m.fields["noisy"].noise_level(0.0) == 0.0
+    assert m.fields["other"].noise_level(0.1) == 0.1
+
+    batch = m.row_batch(4_000, 9_000, 0.1)
+    assert batch["clean"].tolist() == m.row_batch(4_000, 9_000)["clean"].tolist()
+    noisy = m.fields["noisy"].noise_mask(4_000, 9_000, 0.1)
+    assert 2_000 < noisy.sum() < 3_000
+    assert [v for v, n in zip(batch["noisy"], noisy) if n] == [
+        m.fields["noisy"].noise_at(4_000 + i, 0.1) for i in numpy.flatnonzero(noisy)
+    ]
+    assert m.row_chunk(4_090, 4_110, 0.1) == [m.row(i, 0.1) for i in range(4_090, 4_110)]
+
+    synth = m.fields["other"]
+    column = synth.row_batch(0, 10)
+    assert synth.inject_noise(column, 0, 10, 0.0) is column
+    assert synth.inject_noise(column, 0, 10, 1.0) == [synth.noise_at(i, 1.0) for i in range(10)]
+
+
+def test_reference_distributions():
+    class Customer(BaseModel):
+        id: Annotated[int, Field(json_schema_extra={"sql": {"key": "primary"}})]
+
+    def reference(**extra):
+        return Annotated[
+            int,
+            Field(
+                json_schema_extra={"sql": {"key": "foreign", "reference": "Customer.id"}} | extra
             ),
-            "f2": Mock(
-                noise_gen=Mock(return_value=sentinel.NOISE2),
-                next=Mock(return_value=sentinel.VALUE2),
+        ]
+
+    class Sale(BaseModel):
+        uniform: reference()
+        zipf: reference(distribution="zipf", s=1.2)
+        hot: reference(distribution="hot-set", fraction=0.01, weight=0.5)
+        dealt: reference(distribution="deal")
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Customer, 1_000)
+    s.add(Sale, 10_000)
+    s.prepare()
+    pool = s.schema["Customer"].fields["id"].behavior.pool
+    sales = s.schema["Sale"]
+    batch = sales.row_batch(0, 5_000)
+    counts = {name: numpy.unique(batch[name], return_counts=True)[1] for name in batch}
+    assert all(set(batch[name].tolist()) <= set(pool) for name in batch)
+    assert numpy.sort(counts["uniform"])[-10:].sum() < 200
+    assert numpy.sort(counts["zipf"])[-10:].sum() > 2_000
+    assert 2_300 < (numpy.isin(batch["hot"], [pool[i] for i in range(10)])).sum() < 2_700
+    assert counts["dealt"].tolist() == [5] * 1_000
+    assert len(set(batch["dealt"][:1_000].tolist())) == 1_000
+    assert [sales.row(i) for i in (0, 4_095, 4_096, 9_999)] == [
+        sales.row_chunk(i, i + 1)[0] for i in (0, 4_095, 4_096, 9_999)
+    ]
+
+    class Bad(BaseModel):
+        customer: reference(distribution="pareto")
+
+    with pytest.raises(ValueError):
+        s.add(Bad, 10)
+
+
+def test_children():
+    s = SchemaSynthesizer(seed=42)
+    s.add(Department, 50)
+    s.add(Project)
+    s.add(Task)
+    batch = next(s.batches(Task, 100_000))
+
+    projects = s.schema["Project"]
+    tasks = s.schema["Task"]
+    reference = projects.fields["department_code"]
+    counts = numpy.diff(reference.fan_out(), prepend=0)
+    assert 2 <= counts.min() and counts.max() <= 6
+    assert projects.rows == counts.sum()
+    assert tasks.rows == tasks.fields["project_id"].child_rows() == len(batch["project_id"])
+
+    # Each parent's children are contiguous, in the order of the parent's rows.
+    codes = s.schema["Department"].fields["code"].behavior.pool
+    dealt = list(numpy.repeat(codes.take(numpy.arange(50)), counts))
+    assert list(projects.row_batch(0, projects.rows)["department_code"]) == dealt
+    ids = batch["project_id"].tolist()
+    runs = [k for k, _ in groupby(ids)]
+    assert len(runs) == len(set(runs))
+    task_counts = numpy.diff(tasks.fields["project_id"].fan_out(), prepend=0)
+    project_ids = projects.row_batch(0, projects.rows)["id"]
+    assert runs == [id for id, count in zip(project_ids.tolist(), task_counts) if count]
+
+    assert tasks.row_chunk(0, 50) == [tasks.row(i) for i in range(50)]
+    assert tasks.row(tasks.rows)["project_id"] == tasks.row(0)["project_id"]
+
+
+def test_children_none():
+    class Child(BaseModel):
+        code: Annotated[
+            str,
+            Field(
+                json_schema_extra={
+                    "sql": {"key": "foreign", "reference": "Department.code"},
+                    # All of the counts are 0.
+                    "children": {
+                        "min": 0,
+                        "max": 1,
+                        "distribution": "exponential",
+                        "scale": 1e-6,
+                    },
+                }
             ),
-        },
-        rows=2,
-    )
-    di = DataIter(mock_model, noise=0.5)
-    rows = list(next(di) for _ in range(10))
-    assert rows == [
-        {"f1": sentinel.VALUE1, "f2": sentinel.NOISE2},
-        {"f1": sentinel.NOISE1, "f2": sentinel.NOISE2},
-        {"f1": sentinel.VALUE1, "f2": sentinel.VALUE2},
-        {"f1": sentinel.VALUE1, "f2": sentinel.NOISE2},
-        {"f1": sentinel.NOISE1, "f2": sentinel.NOISE2},
-        {"f1": sentinel.NOISE1, "f2": sentinel.VALUE2},
-        {"f1": sentinel.NOISE1, "f2": sentinel.NOISE2},
-        {"f1": sentinel.VALUE1, "f2": sentinel.VALUE2},
-        {"f1": sentinel.NOISE1, "f2": sentinel.VALUE2},
-        {"f1": sentinel.VALUE1, "f2": sentinel.NOISE2},
+        ]
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Department, 2)
+    s.add(Child)
+    assert list(s.batches(Child, 10)) == []
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Department, 2)
+    s.add(Child, 5)
+    with pytest.raises(ValueError, match="no children"):
+        list(s.batches(Child, 10))
+    with pytest.raises(ValueError, match="no children"):
+        s.schema["Child"].row(0)
+
+
+def test_children_parallel():
+    s = SchemaSynthesizer(seed=7)
+    s.add(Department, 20)
+    s.add(Project)
+    expected = [
+        {name: numpy.asarray(column).tolist() for name, column in batch.items()}
+        for batch in s.batches(Project, 30)
+    ]
+    actual = [
+        {name: numpy.asarray(column).tolist() for name, column in batch.items()}
+        for batch in s.parallel_batches(Project, 30, workers=2)
     ]
+    assert actual == expected
+
+
+def test_categorical_key():
+    class Color(enum.Enum):
+        RED = "r"
+        GREEN = "g"
+        BLUE = "b"
+
+    class Paint(BaseModel):
+        color: Annotated[Color, Field(json_schema_extra={"sql": {"key": "primary"}})]
+
+    class Size(BaseModel):
+        size: Annotated[
+            Literal["S", "M", "L"],
+            Field(json_schema_extra={"sql": {"key": "primary"}, "frequencies": {"S": 1, "M": 1}}),
+        ]
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Paint, 3)
+    s.add(Size, 2)
+    assert sorted(row.color.value for row in islice(s.rows(Paint), 3)) == ["b", "g", "r"]
+    assert sorted(row.size for row in islice(s.rows(Size), 2)) == ["M", "S"]
+
+    s = SchemaSynthesizer(seed=42)
+    s.add(Size, 3)
+    with pytest.raises(ValueError, match="3 rows exceeds 2 distinct values"):
+        s.prepare()
+
+    column = numpy.empty(4, dtype=object)
+    column[:] = [Color.RED, Color.BLUE, Color.RED, Color.GREEN]
+    assert unique_column(column).tolist() == [Color.RED, Color.BLUE, Color.GREEN]
@@ -0,0 +1,131 @@
+"""
+Test synthdata.pools classes.
+"""
+
+import datetime
+import pickle
+
+import numpy
+
+from synthdata.pools import *
+
+import pytest
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 16, 1000, 1025])
+def test_feistel_bijection(size):
+    p = FeistelPermutation(size, seed=42)
+    assert repr(p) == f"FeistelPermutation({size})"
+    scalar = [p(i) for i in range(size)]
+    assert sorted(scalar) == list(range(size))
+    assert p.array(numpy.arange(size)).tolist() == scalar
+
+
+def test_feistel_keyed():
+    p1 = FeistelPermutation(1000, seed=1)
+    p2 = FeistelPermutation(1000, seed=2)
+    assert p1.array(numpy.arange(1000)).tolist() != p2.array(numpy.arange(1000)).tolist()
+    assert p1(0) == FeistelPermutation(1000, seed=1)(0)
+
+
+def test_feistel_limits():
+    with pytest.raises(ValueError):
+        FeistelPermutation(0, seed=42)
+    with pytest.raises(ValueError):
+        FeistelPermutation(FeistelPermutation.max_size + 1, seed=42)
+    big = FeistelPermutation(FeistelPermutation.max_size, seed=42)
+    assert 0 <= big(FeistelPermutation.max_size - 1) < FeistelPermutation.max_size
+
+
+def test_list_pool():
+    pool = ListPool(["a", "b", "c"])
+    assert repr(pool) == "ListPool(3)"
+    assert len(pool) == 3
+    assert pool[1] == "b"
+    assert pool.take(numpy.array([2, 0, 2])) == ["c", "a", "c"]
+    assert list(pool) == ["a", "b", "c"]
+
+
+def test_array_pool():
+    pool = ArrayPool(numpy.array([30, 10, 20], dtype=numpy.int64))
+    assert repr(pool) == "ArrayPool(3)"
+    assert pool[0] == 30 and type(pool[0]) is int
+    assert pool.take(numpy.array([2, 0])).tolist() == [20, 30]
+    assert list(pool) == [30, 10, 20]
+
+
+def test_datetime_pool():
+    utc = datetime.timezone.utc
+    pool = DatetimePool(numpy.array([0, 1_000_000], dtype="datetime64[us]"))
+    assert pool[1] == datetime.datetime(1970, 1, 1, 0, 0, 1, tzinfo=utc)
+    assert pool.take(numpy.array([1])).dtype == numpy.dtype("datetime64[us]")
+    assert list(pool) == [
+        datetime.datetime(1970, 1, 1, tzinfo=utc),
+        datetime.datetime(1970, 1, 1, 0, 0, 1, tzinfo=utc),
+    ]
+
+
+def test_string_pool():
+    values = ["alpha", "", "été", "z"]
+    pool = StringPool.from_strings(values)
+    assert repr(pool) == "StringPool(4)"
+    assert pool.data.dtype == numpy.uint8
+    assert pool.offsets.tolist() == [0, 5, 5, 10, 11]
+    assert [pool[i] for i in range(4)] == values
+    assert pool[-1] == "z"
+    assert pool.take(numpy.array([2, 0, 2])) == ["été", "alpha", "été"]
+    assert list(pool) == values
+    assert len(StringPool.from_strings([])) == 0
+
+
+def test_permutation_pool():
+    pool = PermutationPool(low=1_000, domain=2**32, size=100_000, seed=42)
+    assert repr(pool) == "PermutationPool(100000)"
+    values = list(pool)
+    assert len(set(values)) == 100_000
+    assert all(type(v) is int and 1_000 <= v < 1_000 + 2**32 for v in values)
+    assert pool[99_999] == values[99_999]
+    assert pool.take(numpy.array([5, 7])).tolist() == [values[5], values[7]]
+    with pytest.raises(IndexError):
+        pool[100_000]
+    with pytest.raises(ValueError):
+        PermutationPool(low=0, domain=10, size=11, seed=42)
+
+
+def test_permutation_pool_full_domain():
+    pool = PermutationPool(low=-5, domain=10, size=10, seed=42)
+    assert sorted(pool) == list(range(-5, 5))
+
+
+def test_shared_pools(tmp_path):
+    pool = ArrayPool(numpy.array([30, 10, 20], dtype=numpy.int64))
+    shared = pool.share(tmp_path / "numbers")
+    assert isinstance(shared.values, numpy.memmap)
+    assert list(shared) == [30, 10, 20]
+    clone = pickle.loads(pickle.dumps(shared))
+    assert isinstance(clone.values, numpy.memmap) and clone.path == shared.path
+    assert list(clone) == [30, 10, 20]
+    assert list(pickle.loads(pickle.dumps(pool))) == [30, 10, 20]
+
+    dates = DatetimePool(numpy.array([0, 1_000_000], dtype="datetime64[us]"))
+    assert list(pickle.loads(pickle.dumps(dates.share(tmp_path / "dates")))) == list(dates)
+
+    strings = StringPool.from_strings(["alpha", "", "été"])
+    clone = pickle.loads(pickle.dumps(strings.share(tmp_path / "strings")))
+    assert isinstance(clone.data, numpy.memmap)
+    assert list(clone) == ["alpha", "", "été"]
+    assert clone.take(numpy.array([2])) == ["été"]
+
+    assert ListPool(["a"]).share(tmp_path / "objects") is None
+
+
+def test_load_pool(tmp_path):
+    ArrayPool(numpy.array([3, 1, 2])).share(tmp_path / "numbers")
+    DatetimePool(numpy.array([0], dtype="datetime64[us]")).share(tmp_path / "dates")
+    StringPool.from_strings(["x", "yz"]).share(tmp_path / "strings")
+    assert type(load_pool(tmp_path / "numbers")) is ArrayPool
+    assert list(load_pool(tmp_path / "numbers")) == [3, 1, 2]
+    assert isinstance(load_pool(tmp_path / "dates"), DatetimePool)
+    assert list(load_pool(tmp_path / "strings")) == ["x", "yz"]
+    assert load_pool(tmp_path / "missing") is None
+    assert ListPool(["a"]).path is None
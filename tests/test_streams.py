@@ -0,0 +1,41 @@
+"""
+Test synthdata.streams functions.
+"""
+
+from unittest.mock import Mock
+
+from sample_schema import *
+from synthdata.streams import *
+from synthdata.synths import *
+
+import numpy
+import pytest
+
+
+def test_derive_seed():
+    assert derive_seed(42, "Employee", "id") == derive_seed(42, "Employee", "id")
+    assert derive_seed(42, "Employee", "id") != derive_seed(42, "Employee", "name")
+    assert derive_seed(42, "Employee", "id") != derive_seed(43, "Employee", "id")
+    assert 0 <= derive_seed(42) < 2**64
+
+
+def test_streams():
+    assert random_stream(42, 1).random() == random_stream(42, 1).random()
+    assert numpy_stream(42, 1).random() == numpy_stream(42, 1).random()
+    assert numpy_stream(42, 1).random() != numpy_stream(42, 2).random()
+
+
+def test_uniform():
+    u = uniform_array(42, 1_000, 11_000)
+    assert u.tolist()[:5] == [uniform_at(42, i) for i in range(1_000, 1_005)]
+    assert ((0 <= u) & (u < 1)).all()
+    assert u.mean() == pytest.approx(0.5, abs=0.02)
+
+
+def test_value_at():
+    synth = SynthesizeFloat(Mock(rows=10), Employee.model_fields["velocity"])
+    synth.reseed(42)
+    column = synth.value_range(BLOCK_SIZE - 5, BLOCK_SIZE + 5)
+    assert isinstance(column, numpy.ndarray) and len(column) == 10
+    assert column.tolist() == [synth.value_at(i) for i in range(BLOCK_SIZE - 5, BLOCK_SIZE + 5)]
+    assert synth.value_range(5, 5) == []
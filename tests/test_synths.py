@@ -2,14 +2,20 @@
 Test synthdata.synths classes.
 """
 
+from collections import Counter
+import enum
 import random
 from statistics import mean, stdev
-from unittest.mock import Mock, MagicMock, sentinel
+from typing import Literal
+from unittest.mock import Mock, MagicMock, sentinel, call
 
 from sample_schema import *
 from synthdata.synths import *
 from synthdata.base import *
+from synthdata.pools import *
 
+from pydantic import TypeAdapter
+import numpy
 import pytest
 
 
@@ -24,11 +30,13 @@ def mock_model():
 
 
 def test_independent():
-    synth = Mock(value_gen=Mock(return_value=sentinel.OBJECT))
+    synth = Mock(value_at=Mock(return_value=sentinel.OBJECT))
     behavior = Independent(synth)
     behavior.prepare()
     assert repr(behavior) == "Independent"
     assert behavior.next() == sentinel.OBJECT
+    assert behavior.row(5) == sentinel.OBJECT
+    assert synth.value_at.mock_calls == [call(0), call(5)]
 
 
 def test_pooled():
@@ -43,7 +51,11 @@ def test_pooled():
     ]
     synth = Mock(
         model=Mock(rows=6),
-        value_gen=Mock(side_effect=objects),
+        value_batch=Mock(side_effect=[objects[:6], objects[6:]]),
+        make_pool=ListPool,
+        domain_size=Mock(return_value=None),
+        lazy_pool=Mock(return_value=None),
+        sample_unique=Mock(return_value=None),
     )
     behavior = Pooled(synth)
     behavior.prepare()
@@ -68,7 +80,7 @@ def test_synth_none(seeded_random, mock_model):
 def test_synth_string(seeded_random, mock_model):
     ig = SynthesizeString(mock_model, Employee.model_fields["name"], behavior=Independent)
     ig.prepare()
-    assert ig.next() == "$D@=2.wf"
+    assert ig.next() == "G:6XzWa.2]vF~/g_1t!M9<qlr1ZQ-sL"
     assert (
         repr(ig)
         == f"SynthesizeString({repr(mock_model)}, {str(Employee.model_fields['name'])}, Independent)"
@@ -77,16 +89,16 @@ def test_synth_string(seeded_random, mock_model):
     pg = SynthesizeString(mock_model, Employee.model_fields["name"], behavior=Pooled)
     pg.prepare()
     pool = {
-        "5PN;vCzxs*nr6e~@5\\QCryh=",
-        "/FX5[!}}Ba7a.qGran:4P5",
-        "lW%$,<",
-        "(>%ITC)<i|I<t`Ss[3B2@",
-        "an$h:|tzfV=ZlD!",
-        "MnB&~[e0Q+gFqpOj9{)&u>F",
-        "d!mJ_#/OH?(?i++~_)e11u]g6BdnW<f~y:|",
-        ">-QD[r",
-        "eBkWkTO=2b`,'/4q5xWm)RQm\\dAg\"x}/xeCs",
-        "zWLD4<L.,Q-",
+        "Kj",
+        'd$NpW"@_X{X&y\\X-',
+        "k@Z0s0_v3-sIIY{Jml[!BMJW>nk",
+        "u]L8g",
+        "8Y!%)IdV=Pgu[##zPp0kY0K",
+        "r}\\:KZ}H5;[!0vH,fxkX=",
+        "EtaSRom24n+Iz",
+        "#B_>tl'aHXzlF~6H.5C{Q.n",
+        "tr*",
+        "JQmQ}",
     }
     assert set(pg.behavior.pool) == pool
     assert pg.next() in pool
@@ -97,24 +109,24 @@ def test_synth_string(seeded_random, mock_model):
 def test_synth_name(seeded_random, mock_model):
     g2 = SynthesizeName(mock_model, Employee.model_fields["name"])
     assert [g2.next() for _ in range(10)] == [
-        "Bvrpoivgrv",
-        "Flbcbfnogmbjmtpsiaoclrzawzksbvrjnwvgf",
-        "Gwwmqzcudihyfjsonxkmtecqoxs",
-        "Ogyrdoxk",
-        "Wnqrsrpemokiupkdyrosjoruxx",
-        "Oczuzr",
-        "Nktunpf",
-        "Pdjqipvjiqvlblzxoigffwdhjoky",
-        "Meyymdhqjaruhriwrxpvhsbkdauuqg",
-        "Ggotogmmjxwkix",
+        "Volexjhjhvuzchnijuaynpspjfgtzess",
+        "Crgakvfgdnunastcokylukqwllkaiz",
+        "Htsrmbjdgiukttxnnfvcqkgvmqlzwb",
+        "Bzfzhawnxkuz",
+        "Eqmbtwevfopcszbujsfo",
+        "Aagtgjzadwhvukd",
+        "Kwgnsxgn",
+        "Yaydjdyjhqorksltrkhicuefnmhq",
+        "Ewgvxwndmhsnwhvbjvybypphcwhpeusmfdl",
+        "Jitfhqdvsepzgzjvlditjvurxmobougvznzxjpou",
     ]
-    assert g2.noise_gen() == "MuFbhxZtpdpKffUFeWIXiiQEJkqHMBnIWUSmTtzQPxCH"
+    assert g2.noise_gen() is None
 
 
 def test_syth_int(seeded_random, mock_model):
     g3 = SynthesizeInteger(mock_model, Employee.model_fields["id"])
     print([g3.next() for _ in range(10)])
-    assert g3.noise_gen() is None
+    assert g3.noise_gen() == -11
 
 
 def test_syth_float(seeded_random, mock_model):
@@ -127,13 +139,15 @@ def test_syth_float(seeded_random, mock_model):
     assert mean(s) == pytest.approx(11.5, rel=0.1)
     assert stdev(s) == pytest.approx(3.83, rel=0.5)
 
-    assert g4.noise_gen() < 2.0
+    noise = [g4.noise_gen() for _ in range(10)]
+    assert any(n is not None for n in noise)
+    assert all(n < 2.0 or n > 21.0 for n in noise if n is not None)
 
 
 def test_synth_date(seeded_random, mock_model):
     g5 = SynthesizeDate(mock_model, Employee.model_fields["hire_date"])
     assert g5.next() == datetime.datetime(
-        2071, 7, 13, 14, 47, 30, 697324, tzinfo=datetime.timezone.utc
+        2077, 4, 18, 17, 15, 27, 294062, tzinfo=datetime.timezone.utc
     )
 
     assert g5.noise_gen() is None
@@ -142,9 +156,12 @@ def test_synth_date(seeded_random, mock_model):
 def test_synth_reference(seeded_random, mock_model):
     g6 = SynthesizeReference(mock_model, Employee.model_fields["manager"])
     g6.source = MagicMock(
-        choice=Mock(side_effect=[sentinel.POOL_VALUE]), noise_gen=Mock(side_effect=[sentinel.NOISE])
+        choice=Mock(side_effect=[sentinel.POOL_VALUE]),
+        choice_batch=Mock(side_effect=lambda n, rng: [sentinel.POOL_BATCH] * n),
+        noise_gen=Mock(side_effect=[sentinel.NOISE]),
     )
-    assert g6.next() == sentinel.POOL_VALUE
+    assert g6.value_gen() == sentinel.POOL_VALUE
+    assert g6.next() == sentinel.POOL_BATCH
 
     assert g6.noise_gen() == sentinel.NOISE
 
@@ -155,9 +172,9 @@ def test_synth_union_default(seeded_random, mock_model):
         Employee.model_fields["name"],
         sources={"str": SynthesizeName, "None": SynthesizeNone},
     )
-    assert g8.next() == "Vrpo"
-    names = list(g8.next() for _ in range(50))
-    assert sum(1 for n in names if n is None) == 1
+    assert g8.next() == "Ipgivpdvfquatjfgjovgqyb"
+    names = list(g8.next() for _ in range(500))
+    assert sum(1 for n in names if n is None) == 25
 
 
 def test_synth_union_subdomain(seeded_random, mock_model):
@@ -177,7 +194,7 @@ def test_synth_union_subdomain(seeded_random, mock_model):
     )
     assert g8.next() is None
     names = list(g8.next() for _ in range(50))
-    assert sum(1 for n in names if n is None) == 24
+    assert sum(1 for n in names if n is None) == 25
 
 
 RULE_2_MATCHES = [
@@ -207,3 +224,414 @@ def synth_used_for_fields(request):
 def test_rule_2_match(synth_used_for_fields):
     synth, actual, expected = synth_used_for_fields
     assert actual == expected, f"{synth}.match() error: {actual=} {expected=}"
+
+
+def test_independent_batch():
+    synth = Mock(value_range=Mock(return_value=[sentinel.OB1, sentinel.OB2]))
+    behavior = Independent(synth)
+    assert behavior.batch(2) == [sentinel.OB1, sentinel.OB2]
+    assert behavior.count == 2
+    assert synth.value_range.mock_calls == [call(0, 2)]
+
+
+def test_pooled_batch(seeded_random):
+    synth = Mock(
+        model=Mock(rows=3),
+        domain_size=Mock(return_value=3),
+        lazy_pool=Mock(return_value=None),
+        sample_unique=Mock(return_value=[sentinel.OB1, sentinel.OB2, sentinel.OB3]),
+        make_pool=ListPool,
+        numpy_rng=Mock(return_value=numpy.random.default_rng(42)),
+    )
+    behavior = Pooled(synth)
+    behavior.prepare()
+
+    dealt = behavior.batch(7)
+    assert len(dealt) == 7
+    assert set(dealt[:3]) == set(dealt[3:6]) == {sentinel.OB1, sentinel.OB2, sentinel.OB3}
+    assert set(behavior.choice_batch(10)) <= {sentinel.OB1, sentinel.OB2, sentinel.OB3}
+
+
+@pytest.mark.parametrize(
+    "synth_class, field_name, value_type",
+    [
+        (SynthesizeString, "name", str),
+        (SynthesizeName, "name", str),
+    ],
+)
+def test_value_batch(seeded_random, mock_model, synth_class, field_name, value_type):
+    field = Employee.model_fields[field_name]
+    synth = synth_class(mock_model, field)
+    column = synth.value_batch(100)
+    assert len(column) == 100
+    assert all(isinstance(v, value_type) for v in column)
+    adapter = TypeAdapter(Annotated[field.annotation, field])
+    assert all(adapter.validate_python(v) == v for v in column)
+
+
+@pytest.mark.parametrize(
+    "synth_class, field_name, dtype",
+    [
+        (SynthesizeInteger, "id", numpy.int64),
+        (SynthesizeFloat, "velocity", numpy.float64),
+        (SynthesizeDate, "hire_date", numpy.dtype("datetime64[us]")),
+    ],
+)
+def test_number_value_batch(seeded_random, mock_model, synth_class, field_name, dtype):
+    field = Employee.model_fields[field_name]
+    synth = synth_class(mock_model, field)
+    column = synth.value_batch(1000)
+    assert isinstance(column, numpy.ndarray)
+    assert column.dtype == dtype
+    assert len(column) == 1000
+    low, high = synth.array_bounds()
+    assert synth.array_values(numpy.array([low])) <= column.min()
+    assert column.max() <= synth.array_values(numpy.array([high]))
+
+
+def test_normal_value_batch(seeded_random, mock_model):
+    g4 = SynthesizeFloat(mock_model, Employee.model_fields["velocity"])
+    s = g4.value_batch(10_000)
+    assert 2 <= s.min() and s.max() <= 21
+    assert s.mean() == pytest.approx(11.5, rel=0.05)
+    assert s.std() == pytest.approx(3.17, rel=0.1)
+
+
+def test_wide_integer_batch(seeded_random, mock_model):
+    class Wide(BaseModel):
+        big: Annotated[int, Field(ge=2**64, le=2**66)]
+
+    g3 = SynthesizeInteger(mock_model, Wide.model_fields["big"])
+    column = g3.value_batch(10)
+    assert all(isinstance(v, int) and 2**64 <= v <= 2**66 for v in column)
+
+
+def test_synth_none_batch(mock_model):
+    ig = SynthesizeNone(mock_model, Employee.model_fields["name"])
+    assert ig.value_batch(3) == [None, None, None]
+
+
+def test_synth_reference_batch(mock_model):
+    g6 = SynthesizeReference(mock_model, Employee.model_fields["manager"])
+    g6.source = Mock(choice_batch=Mock(return_value=[sentinel.V1, sentinel.V2]))
+    assert g6.value_batch(2) == [sentinel.V1, sentinel.V2]
+
+
+def test_synth_union_batch(seeded_random, mock_model):
+    g8 = SynthesizeUnion(
+        mock_model,
+        Employee.model_fields["name"],
+        sources={"str": SynthesizeName, "None": SynthesizeNone},
+    )
+    names = g8.value_batch(1000)
+    assert len(names) == 1000
+    assert 20 < sum(1 for n in names if n is None) < 80
+    assert all(n.istitle() for n in names if n is not None)
+
+
+def test_truncated_integer(seeded_random, mock_model):
+    class Narrow(BaseModel):
+        value: Annotated[
+            int,
+            Field(
+                ge=900,
+                le=910,
+                json_schema_extra={"distribution": "normal", "mu": 0, "sigma": 100},
+            ),
+        ]
+
+    g3 = SynthesizeInteger(mock_model, Narrow.model_fields["value"])
+    assert all(900 <= g3.next() <= 910 for _ in range(100))
+    column = g3.value_batch(10_000)
+    assert 900 == column.min() and column.max() == 910
+    counts = numpy.bincount(column - 900)
+    assert counts[0] > counts[10]
+
+
+def test_zipf_integer(seeded_random, mock_model):
+    class Skewed(BaseModel):
+        value: Annotated[int, Field(ge=1, le=100, json_schema_extra={"distribution": "zipf"})]
+
+    g3 = SynthesizeInteger(mock_model, Skewed.model_fields["value"])
+    assert all(1 <= g3.next() <= 100 for _ in range(100))
+    counts = numpy.bincount(g3.value_batch(10_000))
+    assert counts[1] > counts[2] > counts[10] > counts[100]
+
+
+def test_truncated_date(seeded_random, mock_model):
+    low = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    high = datetime.datetime(2024, 1, 31, tzinfo=datetime.timezone.utc)
+
+    class Narrow(BaseModel):
+        when: Annotated[
+            datetime.datetime,
+            Field(
+                ge=low,
+                le=high,
+                json_schema_extra={
+                    "distribution": "normal",
+                    "mu": datetime.datetime(2024, 6, 1, tzinfo=datetime.timezone.utc),
+                    "sigma": datetime.timedelta(days=30),
+                },
+            ),
+        ]
+
+    g5 = SynthesizeDate(mock_model, Narrow.model_fields["when"])
+    assert all(low <= g5.next() <= high for _ in range(100))
+    column = g5.value_batch(1000)
+    assert numpy.datetime64(low.replace(tzinfo=None)) <= column.min()
+    assert column.max() <= numpy.datetime64(high.replace(tzinfo=None))
+
+
+def test_string_batch_lengths(seeded_random, mock_model):
+    class Wide(BaseModel):
+        text: Annotated[str, Field(min_length=0, max_length=255)]
+
+    g1 = SynthesizeString(mock_model, Wide.model_fields["text"])
+    column = g1.value_batch(1000)
+    lengths = [len(v) for v in column]
+    assert min(lengths) == 0 and max(lengths) == 255
+    assert set("".join(column)) <= set(SynthesizeString.domain)
+
+
+def test_name_batch_title(seeded_random, mock_model):
+    g2 = SynthesizeName(mock_model, Employee.model_fields["name"])
+    column = g2.value_batch(1000)
+    assert all(v == v.title() and v.isalpha() for v in column)
+    assert all(3 <= len(v) <= 40 for v in column)
+
+
+def test_string_batch_unicode(seeded_random, mock_model):
+    g = SynthesizeName(mock_model, Employee.model_fields["name"])
+    g.domain = "αβγδεζηθ"
+    g.initialize()
+    assert g.domain_codes is None
+    column = g.value_batch(100)
+    assert all(v == v.title() and set(v.lower()) <= set(g.domain) for v in column)
+
+
+def test_pooled_integer_domain(seeded_random):
+    class Small(BaseModel):
+        id: Annotated[int, Field(ge=1, le=1000, json_schema_extra={"sql": {"key": "primary"}})]
+
+    m = BaseModelSynthesizer(Small, 1000)
+    assert m.fields["id"].domain_size() == 1000
+    m._prepare()
+    assert sorted(m.fields["id"].behavior.pool) == list(range(1, 1001))
+    assert all(type(v) is int for v in m.fields["id"].behavior.pool)
+
+    too_many = BaseModelSynthesizer(Small, 1001)
+    with pytest.raises(ValueError):
+        too_many._prepare()
+
+
+@pytest.mark.parametrize(
+    "rows, le, extra",
+    [
+        (1000, 1000, {"distribution": "normal"}),
+        (200, 200, {"distribution": "exponential", "scale": 5}),
+        (50, 200, {"distribution": "exponential", "scale": 5}),
+    ],
+)
+def test_pooled_weighted_domain(seeded_random, rows, le, extra):
+    class Skewed(BaseModel):
+        id: Annotated[
+            int, Field(ge=1, le=le, json_schema_extra={"sql": {"key": "primary"}, **extra})
+        ]
+
+    m = BaseModelSynthesizer(Skewed, rows)
+    m._prepare()
+    pool = list(m.fields["id"].behavior.pool)
+    assert len(set(pool)) == rows and 1 <= min(pool) and max(pool) <= le
+    if extra["distribution"] == "exponential":
+        # The smallest values are the most likely.
+        assert sum(1 for v in pool if v <= 20) >= min(rows, 15)
+
+
+def test_pooled_dedupe_fallback(seeded_random):
+    class Skewed(BaseModel):
+        id: Annotated[
+            int,
+            Field(
+                ge=1,
+                le=1000,
+                json_schema_extra={
+                    "sql": {"key": "primary"},
+                    "distribution": "exponential",
+                    "scale": 2,
+                },
+            ),
+        ]
+
+    m = BaseModelSynthesizer(Skewed, 200)
+    m._prepare()
+    # Too few distinct values are likely; the dedupe gives up, and the weighted sample fills the pool.
+    pool = list(m.fields["id"].behavior.pool)
+    assert len(set(pool)) == 200
+    assert set(range(1, 11)) <= set(pool)
+
+
+def test_pooled_dedupe_limit(seeded_random):
+    class Skewed(BaseModel):
+        id: Annotated[
+            int,
+            Field(
+                ge=1,
+                le=10**9,
+                json_schema_extra={
+                    "sql": {"key": "primary"},
+                    "distribution": "exponential",
+                    "scale": 5,
+                },
+            ),
+        ]
+
+    m = BaseModelSynthesizer(Skewed, 200)
+    with pytest.raises(ValueError):
+        m._prepare()
+
+
+def test_pooled_string_domain(seeded_random):
+    class Codes(BaseModel):
+        code: Annotated[
+            str,
+            Field(min_length=2, max_length=2, json_schema_extra={"sql": {"key": "primary"}}),
+        ]
+        name: Annotated[
+            str,
+            Field(
+                min_length=1,
+                max_length=2,
+                json_schema_extra={"sql": {"key": "primary"}, "domain": "name"},
+            ),
+        ]
+
+    m = BaseModelSynthesizer(Codes, 702)
+    assert m.fields["code"].domain_size() == len(SynthesizeString.domain) ** 2
+    assert m.fields["name"].domain_size() == 26 + 26**2
+    m._prepare()
+    codes = m.fields["code"].behavior.pool
+    assert len(set(codes)) == 702 and all(len(c) == 2 for c in codes)
+    assert isinstance(codes, StringPool)
+    names = m.fields["name"].behavior.pool
+    assert len(set(names)) == 702 and all(n == n.title() for n in names)
+
+
+def test_pooled_date_domain(seeded_random):
+    low = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+    class Events(BaseModel):
+        when: Annotated[
+            datetime.datetime,
+            Field(
+                ge=low,
+                le=low + datetime.timedelta(microseconds=99),
+                json_schema_extra={"sql": {"key": "primary"}},
+            ),
+        ]
+
+    m = BaseModelSynthesizer(Events, 100)
+    m._prepare()
+    pool = m.fields["when"].behavior.pool
+    assert isinstance(pool, DatetimePool)
+    assert sorted(pool) == [low + datetime.timedelta(microseconds=us) for us in range(100)]
+
+
+def test_pooled_lazy(seeded_random):
+    m = BaseModelSynthesizer(Employee, 100_000_000)
+    m._prepare()
+    behavior = m.fields["id"].behavior
+    assert isinstance(behavior.pool, PermutationPool)
+    assert len(behavior.pool) == 100_000_000
+    assert 0 <= behavior.choice() < 2**32
+    dealt = behavior.batch(10_000)
+    assert len(set(dealt.tolist())) == 10_000
+    assert behavior.next() == behavior.pool[10_000]
+
+
+def test_pooled_reshuffle(seeded_random):
+    class Small(BaseModel):
+        id: Annotated[int, Field(ge=1, le=10, json_schema_extra={"sql": {"key": "primary"}})]
+
+    m = BaseModelSynthesizer(Small, 10)
+    m._prepare()
+    behavior = m.fields["id"].behavior
+    first = behavior.batch(10).tolist()
+    second = [behavior.next() for _ in range(10)]
+    assert sorted(first) == sorted(second) == list(range(1, 11))
+    assert first != second
+
+
+def test_pooled_materialized(seeded_random):
+    class Stored(BaseModel):
+        id: Annotated[
+            int,
+            Field(json_schema_extra={"sql": {"key": "primary"}, "pool": "materialized"}),
+        ]
+
+    m = BaseModelSynthesizer(Stored, 100)
+    m._prepare()
+    assert isinstance(m.fields["id"].behavior.pool, ArrayPool)
+    assert m.fields["id"].behavior.pool.values.dtype == numpy.int64
+    assert len(set(m.fields["id"].behavior.pool)) == 100
+
+
+class Color(enum.Enum):
+    RED = "r"
+    GREEN = "g"
+    BLUE = "b"
+
+
+def test_synth_categorical(seeded_random, mock_model):
+    class Paint(BaseModel):
+        color: Annotated[
+            Color, Field(json_schema_extra={"frequencies": {"RED": 5, "g": 3, "Color.BLUE": 2}})
+        ]
+        finish: Literal["matte", "gloss"]
+        primer: Annotated[bool, Field(json_schema_extra={"frequencies": {"true": 1}})]
+        size: Literal[1, 4] | None
+
+    g9 = SynthesizeCategorical(mock_model, Paint.model_fields["color"])
+    assert g9.categories == [Color.RED, Color.GREEN, Color.BLUE]
+    codes = g9.code_batch(10_000)
+    assert codes.dtype == numpy.uint8
+    counts = numpy.bincount(codes) / len(codes)
+    assert numpy.allclose(counts, [0.5, 0.3, 0.2], atol=0.02)
+    assert g9.decode(codes[:5]).tolist() == [g9.categories[c] for c in codes[:5]]
+    assert g9.value_gen() in Color
+    assert g9.domain_size() == 3
+
+    g10 = SynthesizeCategorical(mock_model, Paint.model_fields["finish"])
+    assert set(g10.value_batch(100).tolist()) == {"matte", "gloss"}
+
+    g11 = SynthesizeCategorical(mock_model, Paint.model_fields["primer"])
+    primers = g11.value_batch(100)
+    assert primers.dtype == numpy.bool_ and primers.all()
+
+    g12 = SynthesizeCategorical(mock_model, Paint.model_fields["size"])
+    assert g12.categories == [1, 4]
+
+    class Bad(BaseModel):
+        color: Annotated[Color, Field(json_schema_extra={"frequencies": {"PINK": 1}})]
+
+    with pytest.raises(ValueError):
+        SynthesizeCategorical(mock_model, Bad.model_fields["color"])
+
+
+def test_categorical_sample_unique(mock_model):
+    class Paint(BaseModel):
+        color: Annotated[
+            Color, Field(json_schema_extra={"frequencies": {"RED": 90, "GREEN": 9, "BLUE": 1}})
+        ]
+
+    g = SynthesizeCategorical(mock_model, Paint.model_fields["color"])
+    pools = [g.sample_unique(1).tolist() for _ in range(1000)]
+    counts = Counter(pool[0] for pool in pools)
+    assert counts[Color.RED] > 800 and counts[Color.BLUE] < 50
+    assert sorted(g.sample_unique(5).tolist(), key=str) == sorted(Color, key=str)
+
+    class Primer(BaseModel):
+        primer: Annotated[bool, Field(json_schema_extra={"frequencies": {"true": 1}})]
+
+    g = SynthesizeCategorical(mock_model, Primer.model_fields["primer"])
+    assert g.sample_unique(2).tolist() == [True]
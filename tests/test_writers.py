@@ -0,0 +1,270 @@
+"""
+Test synthdata.writers functions.
+"""
+
+import csv
+import datetime
+import enum
+import io
+import json
+import sqlite3
+import struct
+from typing import Annotated, Optional
+
+import numpy
+from pydantic import BaseModel, Field
+
+from synthdata.writers import *
+
+import pytest
+
+
+def test_iso_timestamps():
+    values = numpy.array(["2021-01-18T09:30:00", "1970-01-01T00:00:00.5"], dtype="datetime64[us]")
+    assert iso_timestamps(values) == [
+        "2021-01-18T09:30:00.000000+00:00",
+        "1970-01-01T00:00:00.500000+00:00",
+    ]
+    dt = datetime.datetime(2021, 1, 18, 9, 30, tzinfo=datetime.timezone.utc)
+    assert iso_timestamps(values)[0] == dt.isoformat(timespec="microseconds")
+    assert csv_column([dt, None, "x"]) == [iso_timestamps(values)[0], None, "x"]
+
+    class Size(enum.Enum):
+        SMALL = "S"
+
+    assert csv_column(numpy.array([Size.SMALL, None], dtype=object)) == ["S", None]
+    assert json_column([Size.SMALL]) == ['"S"']
+
+
+def test_json_column():
+    assert json_column(numpy.array([1, -2])) == ["1", "-2"]
+    assert json_column(numpy.array([0.1, 2.5])) == ["0.1", "2.5"]
+    assert json_column(numpy.array([numpy.nan])) == ["NaN"]
+    assert json_column(numpy.array([0], dtype="datetime64[us]")) == [
+        '"1970-01-01T00:00:00.000000+00:00"'
+    ]
+    assert json_column(['a"b', "été", None, 3, 1.5, True]) == [
+        '"a\\"b"',
+        '"été"',
+        "null",
+        "3",
+        "1.5",
+        "true",
+    ]
+
+
+def test_write_csv():
+    batches = [
+        {"n": numpy.array([1, 2]), "s": ["a,b", 'q"'], "x": [None, 0.5]},
+        {"n": numpy.array([3]), "s": ["c"], "x": [1.25]},
+    ]
+    target = io.StringIO(newline="")
+    assert write_csv(target, ["n", "s", "x"], batches) == 3
+    assert list(csv.reader(io.StringIO(target.getvalue(), newline=""))) == [
+        ["n", "s", "x"],
+        ["1", "a,b", ""],
+        ["2", 'q"', "0.5"],
+        ["3", "c", "1.25"],
+    ]
+
+    target = io.StringIO(newline="")
+    assert write_csv(target, ["n"], [], header=False) == 0
+    assert target.getvalue() == ""
+
+
+def test_write_jsonl():
+    batches = [
+        {"n": numpy.array([1, 2]), "a%s": ["x", None]},
+        {"n": numpy.array([3]), "a%s": ["z"]},
+    ]
+    target = io.StringIO()
+    assert write_jsonl(target, ["n", "a%s"], batches) == 3
+    assert [json.loads(line) for line in target.getvalue().splitlines()] == [
+        {"n": 1, "a%s": "x"},
+        {"n": 2, "a%s": None},
+        {"n": 3, "a%s": "z"},
+    ]
+
+
+def test_arrow_schema():
+    pyarrow = pytest.importorskip("pyarrow")
+
+    class Sample(BaseModel):
+        n: int
+        x: float | None
+        when: datetime.datetime
+        flag: bool
+        mixed: int | float
+        other: int | str
+        s: Optional[str]
+
+    schema = arrow_schema(Sample)
+    assert schema.types == [
+        pyarrow.int64(),
+        pyarrow.float64(),
+        pyarrow.timestamp("us", tz="UTC"),
+        pyarrow.bool_(),
+        pyarrow.float64(),
+        pyarrow.string(),
+        pyarrow.string(),
+    ]
+    assert [field.nullable for field in schema] == [False, True, False, False, False, False, True]
+
+
+def test_record_batch():
+    pyarrow = pytest.importorskip("pyarrow")
+    schema = pyarrow.schema(
+        [
+            ("n", pyarrow.int64()),
+            ("when", pyarrow.timestamp("us", tz="UTC")),
+            ("s", pyarrow.string()),
+        ]
+    )
+    numbers = numpy.array([1, 2, 3])
+    times = numpy.array([0, 1, 2], dtype="datetime64[us]")
+    batch = record_batch(schema, {"s": ["a", None, 3], "n": numbers, "when": times})
+    assert batch.num_rows == 3
+    assert batch.column("s").to_pylist() == ["a", None, "3"]
+    assert batch.column("when")[1].as_py() == datetime.datetime(
+        1970, 1, 1, 0, 0, 0, 1, tzinfo=datetime.timezone.utc
+    )
+    # Zero-copy for numbers and timestamps.
+    assert batch.column("n").buffers()[1].address == numbers.ctypes.data
+    assert batch.column("when").buffers()[1].address == times.ctypes.data
+
+
+def test_write_parquet(tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    schema = pyarrow.schema([("n", pyarrow.int64())])
+    batches = [record_batch(schema, {"n": numpy.arange(start, start + 3)}) for start in (0, 3)]
+    assert write_parquet(tmp_path / "n.parquet", schema, batches) == 6
+    table = pq.read_table(tmp_path / "n.parquet")
+    assert table.column("n").to_pylist() == list(range(6))
+    assert pq.ParquetFile(tmp_path / "n.parquet").num_row_groups == 2
+
+
+def test_create_table():
+    class Parent(BaseModel):
+        id: Annotated[int, Field(json_schema_extra={"sql": {"key": "primary"}})]
+        when: datetime.datetime
+        x: float | None
+
+    class Child(BaseModel):
+        parent: Annotated[
+            int | None,
+            Field(json_schema_extra={"sql": {"key": "foreign", "reference": "Parent.id"}}),
+        ]
+        note: str
+
+    assert create_table(Parent) == (
+        'CREATE TABLE "Parent" (\n'
+        '    "id" INTEGER NOT NULL PRIMARY KEY,\n'
+        '    "when" TEXT NOT NULL,\n'
+        '    "x" REAL\n'
+        ")"
+    )
+    assert create_table(Child) == (
+        'CREATE TABLE "Child" (\n'
+        '    "parent" INTEGER REFERENCES "Parent" ("id") DEFERRABLE INITIALLY DEFERRED,\n'
+        '    "note" TEXT NOT NULL\n'
+        ")"
+    )
+    assert sql_type(int | float) == "REAL"
+    assert sql_type(int | str) == "TEXT"
+
+
+def test_load_table():
+    connection = sqlite3.connect(":memory:")
+    connection.execute('CREATE TABLE "t" ("n" INTEGER, "when" TEXT, "s" TEXT)')
+    batches = [
+        {
+            "n": numpy.array([1, 2]),
+            "when": numpy.array([0, 1], dtype="datetime64[us]"),
+            "s": ["a", None],
+        },
+        {"n": numpy.array([3]), "when": numpy.array([2], dtype="datetime64[us]"), "s": ["c"]},
+    ]
+    assert load_table(connection, "t", ["n", "when", "s"], batches) == 3
+    assert connection.execute('SELECT * FROM "t" ORDER BY "n"').fetchall() == [
+        (1, "1970-01-01T00:00:00.000000+00:00", "a"),
+        (2, "1970-01-01T00:00:00.000001+00:00", None),
+        (3, "1970-01-01T00:00:00.000002+00:00", "c"),
+    ]
+
+
+def read_copy_binary(data: bytes, types: list[str]) -> list[tuple]:
+    """Decodes the COPY binary format, for the types written by write_copy_binary."""
+    assert data[:11] == b"PGCOPY\n\xff\r\n\x00"
+    assert data[-2:] == b"\xff\xff"
+    formats = {"bigint": ">q", "double precision": ">d", "boolean": ">?", "timestamptz": ">q"}
+    epoch = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+    rows, position = [], 19
+    while position < len(data) - 2:
+        (count,), position = struct.unpack_from(">h", data, position), position + 2
+        assert count == len(types)
+        row = []
+        for type_ in types:
+            (size,), position = struct.unpack_from(">i", data, position), position + 4
+            if size == -1:
+                row.append(None)
+                continue
+            field, position = data[position : position + size], position + size
+            if type_ == "text":
+                row.append(field.decode("utf-8"))
+            elif type_ == "timestamptz":
+                (us,) = struct.unpack(">q", field)
+                row.append(epoch + datetime.timedelta(microseconds=us))
+            else:
+                (value,) = struct.unpack(formats[type_], field)
+                row.append(value)
+        rows.append(tuple(row))
+    return rows
+
+
+def test_postgres_type():
+    assert postgres_type(int) == "bigint"
+    assert postgres_type(bool) == "boolean"
+    assert postgres_type(float | None) == "double precision"
+    assert postgres_type(int | float) == "double precision"
+    assert postgres_type(datetime.datetime) == "timestamptz"
+    assert postgres_type(int | str) == "text"
+    assert copy_statement("T", ["a", "b"]) == 'COPY "T" ("a", "b") FROM STDIN (FORMAT text)'
+    assert copy_statement("T", ["a"], binary=True) == 'COPY "T" ("a") FROM STDIN (FORMAT binary)'
+
+
+def test_write_copy_text():
+    batches = [
+        {"n": numpy.array([1, 2]), "s": ["a\tb\\c", None], "x": numpy.array([0.5, 1.0])},
+        {"n": numpy.array([], dtype=numpy.int64), "s": [], "x": numpy.array([])},
+        {"n": numpy.array([3]), "s": ["line\nbreak\r"], "x": numpy.array([2.25])},
+    ]
+    target = io.BytesIO()
+    assert write_copy_text(target, ["n", "s", "x"], batches) == 3
+    assert target.getvalue().decode("utf-8").splitlines() == [
+        "1\ta\\tb\\\\c\t0.5",
+        "2\t\\N\t1.0",
+        "3\tline\\nbreak\\r\t2.25",
+    ]
+    dt = datetime.datetime(2021, 1, 18, tzinfo=datetime.timezone.utc)
+    assert copy_column([dt, "été", 3]) == ["2021-01-18T00:00:00.000000+00:00", "été", "3"]
+
+
+def test_write_copy_binary():
+    when = numpy.array(["2000-01-01T00:00:00.000001", "1999-12-31"], dtype="datetime64[us]")
+    dt = datetime.datetime(2021, 1, 18, tzinfo=datetime.timezone.utc)
+    batches = [
+        {"n": numpy.array([1, -2]), "x": [0.5, None], "t": when, "s": ["été", None]},
+        {"n": numpy.array([3]), "x": [2.0], "t": [dt], "s": [dt]},
+    ]
+    types = ["bigint", "double precision", "timestamptz", "text"]
+    target = io.BytesIO()
+    assert write_copy_binary(target, ["n", "x", "t", "s"], types, batches) == 3
+    epoch = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+    assert read_copy_binary(target.getvalue(), types) == [
+        (1, 0.5, epoch + datetime.timedelta(microseconds=1), "été"),
+        (-2, None, epoch - datetime.timedelta(days=1), None),
+        (3, 2.0, dt, "2021-01-18T00:00:00.000000+00:00"),
+    ]
+    assert binary_column([True, None], "boolean") == [b"\x00\x00\x00\x01\x01", b"\xff\xff\xff\xff"]